@@ -28,6 +28,9 @@ HORIZON_CONFIG = {
     'ajax_queue_limit': 10,
     'ajax_poll_interval': 2500,
 
+    # Number of threads loading the preloaded tabs of a tab group
+    'tab_preload_workers': 1,
+
     # URL for reporting issue with this site.
     'bug_url': None,
 
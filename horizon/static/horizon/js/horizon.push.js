@@ -0,0 +1,114 @@
+/* Core functionality related to the changes pushed by the server.
+ *
+ * A single long-poll request per page waits for the alarm summaries, hosts,
+ * strategies or subclouds subscribed to change, and triggers a
+ * "push:<topic>" event on the document with the changed entities of each
+ * topic. The server polls the underlying services once for every open
+ * browser, so pages driven by these events replace their periodic polling.
+ *
+ * Each page subscribed holds a request, and a server worker thread, open
+ * at all times, so the channel is only used when the PUSH_CHANNEL_ENABLED
+ * setting is set; pages keep polling periodically otherwise.
+ */
+horizon.push = {
+    url: WEBROOT + 'api/push/updates/',
+    // Delay before reconnecting after a failed request
+    retry_interval: 10000,
+    // Interval of the page refresh, kept as a fallback, while the page is
+    // refreshed on the changes pushed
+    fallback_interval: 30000,
+    connected: false,
+    _versions: {},
+    _refresh_topics: [],
+    _request: null,
+    _timeout: null,
+
+    // Call the handler with the changes of the topics as they happen
+    subscribe: function(topics, handler) {
+        if (!horizon.conf.push_channel) {
+            return;
+        }
+        var added = false;
+        $.each(topics, function(index, topic) {
+            if (handler) {
+                $(document).on('push:' + topic, function(event, update) {
+                    handler(topic, update);
+                });
+            }
+            if (!(topic in horizon.push._versions)) {
+                horizon.push._versions[topic] = '';
+                added = true;
+            }
+        });
+        if (added) {
+            // Restart the request with the new topics, once the topics of
+            // the page are all subscribed
+            clearTimeout(horizon.push._timeout);
+            horizon.push._timeout = setTimeout(horizon.push.poll, 0);
+        }
+    },
+
+    // Refresh the page as soon as one of the topics changes
+    refreshOn: function(topics) {
+        $.merge(horizon.push._refresh_topics, topics);
+        horizon.push.subscribe(topics, function() {
+            horizon.refresh.now();
+        });
+    },
+
+    refreshing: function() {
+        return horizon.push.connected &&
+            horizon.push._refresh_topics.length > 0;
+    },
+
+    poll: function() {
+        clearTimeout(horizon.push._timeout);
+        if (horizon.push._request) {
+            horizon.push._request.abort();
+        }
+        var params = $.extend({
+            topics: Object.keys(horizon.push._versions).join(',')
+        }, horizon.push._versions);
+
+        // The request is not queued with horizon.ajax since it is pending
+        // most of the time
+        horizon.push._request = $.ajax({
+            url: horizon.push.url,
+            data: params,
+            dataType: 'json',
+            global: false,
+            success: function(data) {
+                horizon.push.connected = true;
+                $.each(data.topics, function(topic, update) {
+                    var seen = horizon.push._versions[topic];
+                    horizon.push._versions[topic] = update.version;
+                    // The first version describes the page as rendered
+                    if (seen) {
+                        $(document).trigger('push:' + topic, [update]);
+                    }
+                });
+                horizon.push._request = null;
+                horizon.push.poll();
+            },
+            error: function(jqXHR, textStatus) {
+                horizon.push._request = null;
+                if (textStatus === 'abort') {
+                    return;
+                }
+                if (horizon.push.refreshing()) {
+                    // Resume the periodic refresh of the page
+                    horizon.push.connected = false;
+                    horizon.refresh.now();
+                }
+                horizon.push.connected = false;
+                // Fall back to the periodic polling of the page, for good
+                // when the changes are not available to the user
+                if (jqXHR.status !== 401 && jqXHR.status !== 403 &&
+                        jqXHR.status !== 404) {
+                    horizon.push._timeout = setTimeout(
+                        horizon.push.poll, horizon.push.retry_interval);
+                }
+            }
+        });
+    }
+};
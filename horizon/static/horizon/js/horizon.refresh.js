@@ -3,6 +3,8 @@ horizon.refresh = {
     refresh_interval: 5000,
     _refresh_functions: [],
     timeout: null,
+    _updating: false,
+    _pending: false,
 
     init: function() {
         // Add page refresh time to page header
@@ -14,7 +16,27 @@ horizon.refresh = {
         });
 
         // Setup next refresh interval
-        horizon.refresh.timeout = setTimeout(horizon.refresh.update, horizon.refresh.refresh_interval);
+        horizon.refresh.timeout = setTimeout(horizon.refresh.update, horizon.refresh.interval());
+    },
+
+    interval: function() {
+        // Pages refreshed on the changes pushed by the server are only
+        // polled as a fallback
+        if (horizon.push.refreshing()) {
+            return horizon.push.fallback_interval;
+        }
+        return horizon.refresh.refresh_interval;
+    },
+
+    now: function() {
+        // Refresh the page without waiting for the next interval, or as
+        // soon as the refresh in progress completes
+        clearTimeout(horizon.refresh.timeout);
+        if (horizon.refresh._updating) {
+            horizon.refresh._pending = true;
+        } else {
+            horizon.refresh.update();
+        }
     },
 
     update: function() {
@@ -47,6 +69,7 @@ horizon.refresh = {
           var $href=currentHREF += newQryStr;
         }
 
+        horizon.refresh._updating = true;
         horizon.ajax.queue({
             url: $href,
             success: function(data, textStatus, jqXHR) {
@@ -104,7 +127,10 @@ horizon.refresh = {
                 }
 
                 // Reset for next refresh interval
-                horizon.refresh.timeout = setTimeout(horizon.refresh.update, horizon.refresh.refresh_interval);
+                horizon.refresh._updating = false;
+                var interval = horizon.refresh._pending ? 0 : horizon.refresh.interval();
+                horizon.refresh._pending = false;
+                horizon.refresh.timeout = setTimeout(horizon.refresh.update, interval);
             }
         });
     },
@@ -15,9 +15,10 @@
 /* Namespace for core functionality related to DataTables. */
 horizon.datatables = {
   update: function () {
-    // WRS: Performance optimization - disable row refresh to reduce
-    // platform load since we already have periodic page refresh.
-    return;
+    // WRS: Performance optimization - rows used to be refreshed with one
+    // request each, which was disabled to reduce platform load since we
+    // already have periodic page refresh. They are now refreshed in batches
+    // with a single list request per batch, see update_batch below.
     if (horizon.datatables.timeout) {
       clearTimeout(horizon.datatables.timeout);
       horizon.datatables.timeout = false;
@@ -40,93 +41,28 @@ horizon.datatables = {
       return;
     }
 
+    // Coalesce the polls of the rows sharing a batch update URL into
+    // requests updating several rows at once.
+    var batches = {};
     $rows_to_update.each(function() {
       var $row = $(this);
-      var $table = $row.closest('table.datatable');
-
-      requests.push(
-        horizon.ajax.queue({
-          url: $row.attr('data-update-url'),
-          error: function (jqXHR) {
-            switch (jqXHR.status) {
-              // A 404 indicates the object is gone, and should be removed from the table
-              case 404:
-                horizon.datatables.remove_row($table, $row);
-                // Reset tablesorter's data cache.
-                $table.trigger("update");
-                // Enable launch action if quota is not exceeded
-                horizon.datatables.update_actions();
-                break;
-              default:
-                console.log(gettext("An error occurred while updating."));
-                $row.removeClass("ajax-update");
-                $row.find("i.ajax-updating").remove();
-                break;
-            }
-          },
-          success: function (data) {
-            var $new_row = $(data);
-
-            if ($new_row.hasClass('warning')) {
-              var $container = $(document.createElement('div'))
-                .addClass('progress-text horizon-loading-bar');
-
-              var $progress = $(document.createElement('div'))
-                .addClass('progress progress-striped active')
-                .appendTo($container);
-
-              // CGCS: incomplete progress bar addition
-              $width = $new_row.find('[percent]:first').attr('percent') || "100%";
-
-              $(document.createElement('div'))
-                .addClass('progress-bar')
-                .css("width", $width)
-                .appendTo($progress);
-
-              // if action/confirm is required, show progress-bar with "?"
-              // icon to indicate user action is required
-              if ($new_row.find('.btn-action-required').length > 0) {
-                $(document.createElement('span'))
-                  .addClass('fa fa-question-circle progress-bar-text')
-                  .appendTo($container);
-              }
-              $new_row.find("td.warning:last").prepend($container);
-            }
+      var batch_url = $row.attr('data-batch-update-url');
 
-            // CGCS: compare the rows without the checkbox row since it has
-            // new UUIDs everytime (can't compare just text since classes are important)
-            $row_cmp = $row.clone();
-            $row_cmp.find('.themable-checkbox').remove();
-            $new_row_cmp = $new_row.clone();
-            $new_row_cmp.find('.themable-checkbox').remove();
-
-            // Only replace row if the html content has changed
-            if($new_row_cmp.html() !== $row_cmp.html()) {
-              horizon.datatables.replace_row($row, $new_row);
-
-              // TODO(matt-borland, tsufiev): ideally we should solve the
-              // problem with not-working angular actions in a content added
-              // by jQuery via replacing jQuery insert with Angular insert.
-              // Should address this in Newton release
-              recompileAngularContent($table);
-
-              // Reset tablesorter's data cache.
-              $table.trigger("update");
-              // Reset decay constant.
-              $table.removeAttr('decay_constant');
-              // Check that quicksearch is enabled for this table
-              // Reset quicksearch's data cache.
-              if ($table.attr('id') in horizon.datatables.qs) {
-                horizon.datatables.qs[$table.attr('id')].cache();
-              }
-            }
-          },
-          complete: function () {
-            // Revalidate the button check for the updated table
-            horizon.datatables.validate_button();
-          }
-        })
-      );
+      if (!batch_url) {
+        requests.push(horizon.datatables.update_single_row($row));
+        return;
+      }
+      if (!(batch_url in batches)) {
+        batches[batch_url] = [];
+      }
+      batches[batch_url].push($row);
+    });
+
+    $.each(batches, function(batch_url, $rows) {
+      for (var i = 0; i < $rows.length; i += horizon.datatables.batch_size) {
+        requests.push(horizon.datatables.update_batch(
+          batch_url, $rows.slice(i, i + horizon.datatables.batch_size)));
+      }
     });
 
     $.when.apply($, requests).always(function() {
@@ -140,6 +76,132 @@ horizon.datatables = {
     });
   },
 
+  // Maximum number of rows updated by a single batch request.
+  batch_size: 50,
+
+  update_single_row: function($row) {
+    return horizon.ajax.queue({
+      url: $row.attr('data-update-url'),
+      error: function (jqXHR) {
+        horizon.datatables.update_row_failed($row, jqXHR.status);
+      },
+      success: function (data) {
+        horizon.datatables.update_row($row, data);
+      },
+      complete: function () {
+        // Revalidate the button check for the updated table
+        horizon.datatables.validate_button();
+      }
+    });
+  },
+
+  update_batch: function(batch_url, $rows) {
+    var params = $.map($rows, function($row) {
+      return 'obj_id=' + encodeURIComponent($row.attr('data-object-id'));
+    });
+    return horizon.ajax.queue({
+      url: batch_url + '&' + params.join('&'),
+      dataType: 'json',
+      error: function (jqXHR) {
+        $.each($rows, function(index, $row) {
+          horizon.datatables.update_row_failed($row, jqXHR.status);
+        });
+      },
+      success: function (data) {
+        $.each($rows, function(index, $row) {
+          var obj_id = $row.attr('data-object-id');
+          if (obj_id in data.rows) {
+            horizon.datatables.update_row($row, data.rows[obj_id]);
+          } else {
+            horizon.datatables.update_row_failed($row, data.errors[obj_id]);
+          }
+        });
+      },
+      complete: function () {
+        // Revalidate the button check for the updated table
+        horizon.datatables.validate_button();
+      }
+    });
+  },
+
+  update_row_failed: function($row, status) {
+    var $table = $row.closest('table.datatable');
+    switch (status) {
+      // A 404 indicates the object is gone, and should be removed from the table
+      case 404:
+        horizon.datatables.remove_row($table, $row);
+        // Reset tablesorter's data cache.
+        $table.trigger("update");
+        // Enable launch action if quota is not exceeded
+        horizon.datatables.update_actions();
+        break;
+      default:
+        console.log(gettext("An error occurred while updating."));
+        $row.removeClass("ajax-update");
+        $row.find("i.ajax-updating").remove();
+        break;
+    }
+  },
+
+  update_row: function($row, data) {
+    var $table = $row.closest('table.datatable');
+    var $new_row = $(data);
+
+    if ($new_row.hasClass('warning')) {
+      var $container = $(document.createElement('div'))
+        .addClass('progress-text horizon-loading-bar');
+
+      var $progress = $(document.createElement('div'))
+        .addClass('progress progress-striped active')
+        .appendTo($container);
+
+      // CGCS: incomplete progress bar addition
+      $width = $new_row.find('[percent]:first').attr('percent') || "100%";
+
+      $(document.createElement('div'))
+        .addClass('progress-bar')
+        .css("width", $width)
+        .appendTo($progress);
+
+      // if action/confirm is required, show progress-bar with "?"
+      // icon to indicate user action is required
+      if ($new_row.find('.btn-action-required').length > 0) {
+        $(document.createElement('span'))
+          .addClass('fa fa-question-circle progress-bar-text')
+          .appendTo($container);
+      }
+      $new_row.find("td.warning:last").prepend($container);
+    }
+
+    // CGCS: compare the rows without the checkbox row since it has
+    // new UUIDs everytime (can't compare just text since classes are important)
+    $row_cmp = $row.clone();
+    $row_cmp.find('.themable-checkbox').remove();
+    $new_row_cmp = $new_row.clone();
+    $new_row_cmp.find('.themable-checkbox').remove();
+
+    // Only replace row if the html content has changed
+    if($new_row_cmp.html() !== $row_cmp.html()) {
+      horizon.datatables.replace_row($row, $new_row);
+
+      // TODO(matt-borland, tsufiev): ideally we should solve the
+      // problem with not-working angular actions in a content added
+      // by jQuery via replacing jQuery insert with Angular insert.
+      // Should address this in Newton release
+      recompileAngularContent($table);
+
+      // Reset tablesorter's data cache.
+      $table.trigger("update");
+      // Reset decay constant.
+      $table.removeAttr('decay_constant');
+      // Check that quicksearch is enabled for this table
+      // Reset quicksearch's data cache.
+      if ($table.attr('id') in horizon.datatables.qs) {
+        horizon.datatables.qs[$table.attr('id')].cache();
+      }
+    }
+  },
+
   update_actions: function() {
     var $actions_to_update = $('.btn-launch.ajax-update, .btn-create.ajax-update');
     $actions_to_update.each(function() {
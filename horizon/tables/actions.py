@@ -132,7 +132,25 @@ class BaseAction(html.HTMLElement):
         """
         return True
 
+    def allowed_for_request(self, request):
+        """Determine whether this action is allowed for the current request.
+
+        This method is meant to be overridden with the checks which do not
+        depend on the datum, such as the mode of the system or the services
+        enabled. It is evaluated once per table rather than for every row,
+        and ``allowed`` is only called when it returns ``True``.
+        """
+        return True
+
     def _allowed(self, request, datum):
+        if self.table is not None:
+            request_allowed = self.table._action_allowed_for_request(self,
+                                                                     request)
+        else:
+            request_allowed = self.allowed_for_request(request)
+        if not request_allowed:
+            return False
+
         policy_check = utils_settings.import_setting("POLICY_CHECK_FUNCTION")
 
         if policy_check and self.policy_rules:
@@ -19,6 +19,7 @@ import json
 import logging
 from operator import attrgetter
 import sys
+import time
 
 from django.conf import settings
 from django.core import exceptions as core_exceptions
@@ -575,10 +576,18 @@ class Row(html.HTMLElement):
         updates of cell. Generally you won't need to change this value.
         It is also used for inline edit of the cell.
         Default: ``"cell_update"``.
+
+    .. attribute:: ajax_batch_action_name
+
+        String that is used for the query parameter key to request AJAX
+        updates of several rows of the table at once. Generally you won't
+        need to change this value.
+        Default: ``"rows_update"``.
     """
     ajax = False
     ajax_action_name = "row_update"
     ajax_cell_action_name = "cell_update"
+    ajax_batch_action_name = "rows_update"
 
     def __init__(self, table, datum=None):
         super(Row, self).__init__()
@@ -623,6 +632,8 @@ class Row(html.HTMLElement):
             interval = conf.HORIZON_CONFIG['ajax_poll_interval']
             self.attrs['data-update-interval'] = interval
             self.attrs['data-update-url'] = self.get_ajax_update_url()
+            self.attrs['data-batch-update-url'] = \
+                self.get_ajax_batch_update_url()
             self.classes.append("ajax-update")
 
         self.attrs['data-object-id'] = table.get_object_id(datum)
@@ -678,7 +689,7 @@ class Row(html.HTMLElement):
         """Returns the bound cells for this row in order."""
         return list(self.cells.values())
 
-    def get_ajax_update_url(self):
+    def _get_ajax_url(self, action_name, obj_id=None):
         table_url = self.table.get_absolute_url()
         marker_name = self.table._meta.pagination_param
         marker = self.table.request.GET.get(marker_name, None)
@@ -686,15 +697,28 @@ class Row(html.HTMLElement):
             marker_name = self.table._meta.prev_pagination_param
             marker = self.table.request.GET.get(marker_name, None)
         request_params = [
-            ("action", self.ajax_action_name),
+            ("action", action_name),
             ("table", self.table.name),
-            ("obj_id", self.table.get_object_id(self.datum)),
         ]
+        if obj_id is not None:
+            request_params.append(("obj_id", obj_id))
         if marker:
             request_params.append((marker_name, marker))
         params = urlencode(collections.OrderedDict(request_params))
         return "%s?%s" % (table_url, params)
 
+    def get_ajax_update_url(self):
+        return self._get_ajax_url(self.ajax_action_name,
+                                  self.table.get_object_id(self.datum))
+
+    def get_ajax_batch_update_url(self):
+        """Returns the URL updating several rows of the table at once.
+
+        The IDs of the objects of the rows are appended to it as ``obj_id``
+        query parameters.
+        """
+        return self._get_ajax_url(self.ajax_batch_action_name)
+
     def can_be_selected(self, datum):
         """Determines whether the row can be selected.
 
@@ -710,6 +734,26 @@ class Row(html.HTMLElement):
         """
         return {}
 
+    def get_batch_data(self, request, obj_ids):
+        """Fetches the updated data for the rows of the given object IDs.
+
+        Returns a dictionary mapping each object ID to its data. The objects
+        which no longer exist are left out of it.
+
+        By default :meth:`~horizon.tables.Row.get_data` is called for each
+        object; subclasses may override this to fetch all of them at once.
+        """
+        data = {}
+        for obj_id in obj_ids:
+            try:
+                data[obj_id] = self.get_data(request, obj_id)
+            except Exception:
+                exc_info = sys.exc_info()
+                error = exceptions.handle(request, ignore=True)
+                if error is not exceptions.NotFound:
+                    six.reraise(*exc_info)
+        return data
+
 
 class Cell(html.HTMLElement):
     """Represents a single cell in the table."""
@@ -1312,6 +1356,10 @@ class DataTable(object):
         self.permissions = self._meta.permissions
         self.needs_filter_first = False
         self._filter_first_message = self._meta.filter_first_message
+        # Results of the datum-independent checks of the actions, and time
+        # spent checking whether each action is allowed, keyed by action name
+        self._request_allowed_actions = {}
+        self._allowed_timings = collections.defaultdict(lambda: [0, 0.0])
 
         # Create a new set
         columns = []
@@ -1412,13 +1460,25 @@ class DataTable(object):
         for column in self.get_columns():
             self._data_cache[column] = {}
 
+    def _action_allowed_for_request(self, action, request):
+        if action.name not in self._request_allowed_actions:
+            self._request_allowed_actions[action.name] = \
+                action.allowed_for_request(request)
+        return self._request_allowed_actions[action.name]
+
     def _filter_action(self, action, request, datum=None):
         try:
             # Catch user errors in permission functions here
             row_matched = True
             if self._meta.mixed_data_type:
                 row_matched = action.data_type_matched(datum)
-            return action._allowed(request, datum) and row_matched
+            start = time.time()
+            try:
+                return action._allowed(request, datum) and row_matched
+            finally:
+                timing = self._allowed_timings[action.name]
+                timing[0] += 1
+                timing[1] += time.time() - start
         except AssertionError:
             # don't trap mox exceptions (which subclass AssertionError)
             # when testing!
@@ -1443,7 +1503,18 @@ class DataTable(object):
         table_template = template.loader.get_template(self._meta.template)
         extra_context = {self._meta.context_var_name: self,
                          'hidden_title': self._meta.hidden_title}
-        return table_template.render(extra_context, self.request)
+        content = table_template.render(extra_context, self.request)
+        self._log_allowed_timings()
+        return content
+
+    def _log_allowed_timings(self):
+        if not LOG.isEnabledFor(logging.DEBUG):
+            return
+        for name, (count, elapsed) in sorted(self._allowed_timings.items()):
+            LOG.debug("Table %(table)s: allowed() of action %(action)s "
+                      "took %(elapsed).1f ms for %(count)d checks.",
+                      {'table': self.name, 'action': name,
+                       'elapsed': elapsed * 1000, 'count': count})
 
     def get_absolute_url(self):
         """Returns the canonical URL for this table.
@@ -1725,6 +1796,10 @@ class DataTable(object):
                         return HttpResponse(new_row.render())
                     else:
                         return HttpResponse(status=error.status_code)
+            elif (new_row.ajax and
+                    new_row.ajax_batch_action_name == action_name):
+                if request.is_ajax():
+                    return self.batch_update_handle(request, new_row)
             elif new_row.ajax_cell_action_name == action_name:
                 # inline edit of the cell actions
                 return self.inline_edit_handle(request, table_name,
@@ -1741,6 +1816,42 @@ class DataTable(object):
                             return handled
         return None
 
+    def batch_update_handle(self, request, new_row):
+        """AJAX update handler of several rows.
+
+        The data of all the rows is fetched at once and the rendered rows
+        are returned in a JSON object keyed by object ID, along with the
+        HTTP status of the rows which could not be updated.
+        """
+        obj_ids = request.GET.getlist("obj_id")
+        try:
+            data = new_row.get_batch_data(request, obj_ids)
+        except Exception:
+            error = exceptions.handle(request, ignore=True)
+            return HttpResponse(status=error.status_code)
+
+        rows = {}
+        errors = {}
+        for obj_id in obj_ids:
+            if obj_id not in data:
+                errors[obj_id] = exceptions.NotFound.status_code
+                continue
+            try:
+                datum = data[obj_id]
+                row = self._meta.row_class(self)
+                if self.get_object_id(datum) == self.current_item_id:
+                    self.selected = True
+                    row.classes.append('current_selected')
+                row.load_cells(datum)
+                rows[obj_id] = row.render()
+            except Exception:
+                error = exceptions.handle(request, ignore=True)
+                errors[obj_id] = error.status_code
+        response = {'rows': rows, 'errors': errors}
+        return HttpResponse(json.dumps(response),
+                            status=200,
+                            content_type="application/json")
+
     def inline_edit_handle(self, request, table_name, action_name, obj_id,
                            new_row):
         """Inline edit handler.
@@ -13,16 +13,23 @@
 #    under the License.
 
 from collections import OrderedDict
+import logging
 import sys
+import time
 
+import futurist
 import six
 
 from django.template.loader import render_to_string
 from django.template import TemplateSyntaxError
+from django.utils import translation
 
+from horizon import conf
 from horizon import exceptions
 from horizon.utils import html
 
+LOG = logging.getLogger(__name__)
+
 SEPARATOR = "__"
 CSS_TAB_GROUP_CLASSES = ["nav", "nav-tabs", "ajax-tabs"]
 CSS_ACTIVE_TAB_CLASSES = ["active"]
@@ -76,12 +83,27 @@ class TabGroup(html.HTMLElement):
         Read-only property which is set to the value of the current active tab.
         This may not be the same as the value of ``selected`` if no
         specific tab was requested via the ``GET`` parameter.
+
+    .. attribute:: preload_workers
+
+        The number of threads loading the data of the preloaded tabs
+        concurrently. Only tabs whose data can be retrieved independently
+        of each other should be loaded concurrently. When ``None``, the
+        ``tab_preload_workers`` key of ``HORIZON_CONFIG`` is used.
+        Default: ``None``.
+
+    .. attribute:: load_times
+
+        A dictionary of the number of seconds spent loading the data of
+        each tab, keyed by tab slug in the order of the tabs. It is filled by
+        :meth:`~horizon.tabs.TabGroup.load_tab_data`.
     """
     slug = None
     template_name = "horizon/common/_tab_group.html"
     param_name = 'tab'
     sticky = False
     show_single_tab = False
+    preload_workers = None
     _selected = None
     _active = None
 
@@ -104,6 +126,7 @@ class TabGroup(html.HTMLElement):
         self.request = request
         self.kwargs = kwargs
         self._data = None
+        self.load_times = OrderedDict()
         tab_instances = []
         for tab in self.tabs:
             tab_instances.append((tab.slug, tab(self, request)))
@@ -116,15 +139,68 @@ class TabGroup(html.HTMLElement):
     def __repr__(self):
         return "<%s: %s>" % (self.__class__.__name__, self.slug)
 
+    def get_preload_workers(self):
+        if self.preload_workers is not None:
+            return self.preload_workers
+        return conf.HORIZON_CONFIG.get('tab_preload_workers', 1)
+
+    def _load_tab(self, tab):
+        # Returns the load time and the exception info of a failed load
+        # instead of raising it, so that they are recorded and handled in the
+        # thread of the request, in the order of the tabs.
+        start = time.time()
+        try:
+            tab._data = tab.get_context_data(self.request)
+            exc_info = None
+        except Exception:
+            tab._data = False
+            exc_info = sys.exc_info()
+        load_time = time.time() - start
+        LOG.debug("Loaded tab %s of %s in %.3f seconds", tab.slug, self.slug,
+                  load_time)
+        return load_time, exc_info
+
+    def _handle_load_result(self, tab, result):
+        load_time, exc_info = result
+        self.load_times[tab.slug] = load_time
+        if exc_info:
+            self._handle_load_error(exc_info)
+
+    def _handle_load_error(self, exc_info):
+        try:
+            six.reraise(*exc_info)
+        except Exception:
+            exceptions.handle(self.request)
+
     def load_tab_data(self):
-        """Preload all data that for the tabs that will be displayed."""
-        for tab in self._tabs.values():
-            if tab.load and not tab.data_loaded:
-                try:
-                    tab._data = tab.get_context_data(self.request)
-                except Exception:
-                    tab._data = False
-                    exceptions.handle(self.request)
+        """Preload all data that for the tabs that will be displayed.
+
+        The tabs are loaded one after another, or concurrently when more than
+        one :attr:`~horizon.tabs.TabGroup.preload_workers` is configured.
+        Errors are handled for each tab, in the order of the tabs.
+        """
+        tabs = [tab for tab in self._tabs.values()
+                if tab.load and not tab.data_loaded]
+        workers = min(self.get_preload_workers(), len(tabs))
+        if workers <= 1:
+            for tab in tabs:
+                self._handle_load_result(tab, self._load_tab(tab))
+            return
+
+        language = translation.get_language()
+
+        def _task_load_tab(tab):
+            # The active language is local to the thread of the request
+            translation.activate(language)
+            try:
+                return self._load_tab(tab)
+            finally:
+                translation.deactivate()
+
+        with futurist.ThreadPoolExecutor(max_workers=workers) as e:
+            futures = [e.submit(_task_load_tab, tab) for tab in tabs]
+        for tab, future in zip(tabs, futures):
+            self._handle_load_result(tab, future.result())
 
     def get_id(self):
         """Returns the id for this tab group.
@@ -15,6 +15,8 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import json
+
 from django.core.urlresolvers import reverse
 from django import forms
 from django import http
@@ -23,9 +25,11 @@ from django.template import defaultfilters
 from django.test.utils import override_settings
 from django.utils.translation import ungettext_lazy
 
+import mock
 from mox3.mox import IsA
 import six
 
+from horizon import exceptions
 from horizon import tables
 from horizon.tables import formset as table_formset
 from horizon.tables import views as table_views
@@ -1103,6 +1107,71 @@ class DataTableTests(test.TestCase):
         self.assertEqual("Log In",
                          six.text_type(row_actions[1].verbose_name))
 
+    def test_row_actions_allowed_for_request_evaluated_once(self):
+        calls = []
+
+        class RequestAction(MyLinkAction):
+            name = "request_allowed"
+
+            def allowed_for_request(self, request):
+                calls.append(request)
+                return self.table.kwargs.get('allowed', True)
+
+        class TempTable(MyTable):
+            class Meta(object):
+                name = "my_table"
+                columns = ('id',)
+                row_actions = (MyAction, RequestAction,)
+
+        self.table = TempTable(self.request, TEST_DATA)
+        for datum in TEST_DATA:
+            row_actions = self.table.get_row_actions(datum)
+            self.assertIn('request_allowed',
+                          [action.name for action in row_actions])
+        self.assertEqual([self.request], calls)
+
+        self.table = TempTable(self.request, TEST_DATA, allowed=False)
+        for datum in TEST_DATA:
+            row_actions = self.table.get_row_actions(datum)
+            self.assertNotIn('request_allowed',
+                             [action.name for action in row_actions])
+        self.assertEqual(2, len(calls))
+
+    def test_table_batch_row_update(self):
+        self.table = MyTable(self.request, TEST_DATA)
+        resp = http.HttpResponse(self.table.render())
+        update_string = "action=rows_update&amp;table=my_table"
+        self.assertContains(resp, update_string, 4)
+
+        req = self.factory.get('/my_url/?table=my_table&action=rows_update'
+                               '&obj_id=1&obj_id=2',
+                               HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+        self.table = MyTable(req)
+        resp = self.table.maybe_preempt()
+        self.assertEqual(200, resp.status_code)
+        content = json.loads(resp.content.decode('utf-8'))
+        self.assertEqual(['1', '2'], sorted(content['rows']))
+        self.assertIn("my_table__row__1", content['rows']['1'])
+        self.assertIn("status_down", content['rows']['1'])
+        self.assertEqual({}, content['errors'])
+
+    def test_table_batch_row_update_not_found(self):
+        def get_data(request, obj_id):
+            if obj_id == '2':
+                raise exceptions.NotFound()
+            return TEST_DATA_2[0]
+
+        req = self.factory.get('/my_url/?table=my_table&action=rows_update'
+                               '&obj_id=1&obj_id=2',
+                               HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+        self.table = MyTable(req)
+        with mock.patch.object(MyRow, 'get_data', side_effect=get_data):
+            resp = self.table.maybe_preempt()
+        self.assertEqual(200, resp.status_code)
+        content = json.loads(resp.content.decode('utf-8'))
+        self.assertEqual(['1'], list(content['rows']))
+        self.assertEqual({'2': 404}, content['errors'])
+
     def test_server_filtering(self):
         filter_value_param = "my_table__filter__q"
         filter_field_param = '%s_field' % filter_value_param
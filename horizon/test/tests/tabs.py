@@ -120,6 +120,18 @@ class TabWithTableView(horizon_tabs.TabbedTableView):
     template_name = "tab_group.html"
 
 
+class TabTwo(BaseTestTab):
+    slug = "tab_two"
+    name = "Tab Two"
+    template_name = "_tab.html"
+
+
+class ConcurrentGroup(horizon_tabs.TabGroup):
+    slug = "concurrent_tab_group"
+    tabs = (TabOne, TabTwo, TabDelayed)
+    preload_workers = 2
+
+
 class TabTests(test.TestCase):
     def test_tab_group_basics(self):
         tg = Group(self.request)
@@ -314,6 +326,16 @@ class TabTests(test.TestCase):
         req = self.factory.post('/', {'action': action_string})
         self.assertRaises(exceptions.Http302, view, req)
 
+    def test_tab_concurrent_preload(self):
+        tg = ConcurrentGroup(self.request)
+        tg.load_tab_data()
+        self.assertEqual(['tab_one', 'tab_two'], list(tg.load_times))
+        self.assertEqual(tg.get_tab('tab_one'),
+                         tg.get_tab('tab_one')._data['tab'])
+        self.assertEqual(tg.get_tab('tab_two'),
+                         tg.get_tab('tab_two')._data['tab'])
+        self.assertFalse(tg.get_tab('tab_delayed').data_loaded)
+
 
 class TabExceptionTests(test.TestCase):
     def setUp(self):
@@ -342,3 +364,13 @@ class TabExceptionTests(test.TestCase):
             resp = mw.process_exception(req, e)
             resp.client = self.client
         self.assertRedirects(resp, RedirectExceptionTab.url)
+
+    def test_tab_concurrent_preload_exception(self):
+        TabWithTableView.tab_group_class.tabs.append(RecoverableErrorTab)
+        TabWithTableView.tab_group_class.preload_workers = 2
+        self.addCleanup(delattr, TabWithTableView.tab_group_class,
+                        'preload_workers')
+        view = TabWithTableView.as_view()
+        req = self.factory.get("/")
+        res = view(req)
+        self.assertMessageCount(res, error=1)
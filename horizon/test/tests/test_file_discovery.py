@@ -10,6 +10,9 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import os
+import shutil
+import tempfile
 import unittest
 
 from horizon.utils import file_discovery as fd
@@ -250,3 +253,54 @@ class FinderTests(unittest.TestCase):
 
         self.assertTrue(templates[0].endswith('.html'))
         self.assertTrue(templates[1].endswith('.html'))
+
+
+class ManifestTests(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.static_path = os.path.join(self.root, 'static/')
+        self.app_path = os.path.join(self.static_path, 'app')
+        os.makedirs(self.app_path)
+        for name in ('a.module.js', 'a.controller.js', 'a.spec.js',
+                     'a.html'):
+            open(os.path.join(self.app_path, name), 'w').close()
+        self.filename = os.path.join(self.root, 'manifest.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def _record(self):
+        manifest = fd.StaticFilesManifest(record=True)
+        found = fd.discover_static_files(self.static_path, manifest=manifest)
+        manifest.save(self.filename)
+        return found
+
+    def test_manifest_missing(self):
+        self.assertIsNone(fd.StaticFilesManifest.load(self.filename))
+
+    def test_manifest_used(self):
+        found = self._record()
+        manifest = fd.StaticFilesManifest.load(self.filename)
+        self.assertEqual(list(found), list(manifest.get(self.static_path)))
+
+        old_walk = fd.walk
+        fd.walk = None
+        try:
+            self.assertEqual(
+                list(found),
+                list(fd.discover_static_files(self.static_path,
+                                              manifest=manifest)))
+        finally:
+            fd.walk = old_walk
+
+    def test_manifest_stale(self):
+        self._record()
+        open(os.path.join(self.app_path, 'b.html'), 'w').close()
+        mtime = os.stat(self.app_path).st_mtime + 10
+        os.utime(self.app_path, (mtime, mtime))
+
+        manifest = fd.StaticFilesManifest.load(self.filename)
+        self.assertIsNone(manifest.get(self.static_path))
+        sources, mocks, specs, templates = fd.discover_static_files(
+            self.static_path, manifest=manifest)
+        self.assertEqual(['app/a.html', 'app/b.html'], templates)
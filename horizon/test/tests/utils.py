@@ -15,6 +15,8 @@
 import datetime
 import os
 
+import mock
+
 from django.core.exceptions import ValidationError
 import django.template
 from django.template import defaultfilters
@@ -467,6 +469,84 @@ class MemoizedTests(test.TestCase):
             # check that some_other_func returned a memoized list.
             self.assertIs(output1, output2)
 
+    def test_memoized_max_size_evicts_least_recently_used(self):
+        values_list = []
+
+        @memoized.memoized(max_size=2)
+        def cache_calls(value):
+            values_list.append(value)
+            return value
+
+        cache_calls(1)
+        cache_calls(2)
+        # Mark 1 as the most recently used value, so 2 gets evicted.
+        cache_calls(1)
+        cache_calls(3)
+        self.assertEqual([1, 2, 3], values_list)
+
+        cache_calls(1)
+        self.assertEqual([1, 2, 3], values_list)
+        cache_calls(2)
+        self.assertEqual([1, 2, 3, 2], values_list)
+
+        info = cache_calls.cache_info()
+        self.assertEqual(2, info.hits)
+        self.assertEqual(4, info.misses)
+        self.assertEqual(2, info.evictions)
+        self.assertEqual(2, info.size)
+
+    @mock.patch.object(memoized.time, 'time')
+    def test_memoized_ttl_expires_values(self, mock_time):
+        values_list = []
+
+        @memoized.memoized(ttl=10)
+        def cache_calls(value):
+            values_list.append(value)
+            return value
+
+        mock_time.return_value = 100
+        cache_calls(1)
+        mock_time.return_value = 109
+        cache_calls(1)
+        self.assertEqual([1], values_list)
+
+        mock_time.return_value = 110
+        cache_calls(1)
+        self.assertEqual([1, 1], values_list)
+        self.assertEqual(1, cache_calls.cache_info().evictions)
+
+    def test_memoized_cache_clear(self):
+        values_list = []
+
+        @memoized.memoized
+        def cache_calls(value):
+            values_list.append(value)
+            return value
+
+        cache_calls(1)
+        cache_calls.cache_clear()
+        cache_calls(1)
+        self.assertEqual([1, 1], values_list)
+        self.assertEqual(0, cache_calls.cache_info().hits)
+        self.assertEqual(1, cache_calls.cache_info().size)
+
+    def test_memoized_with_request_max_size(self):
+        values_list = []
+
+        def some_func(request):
+            return request
+
+        @memoized.memoized_with_request(some_func, max_size=1)
+        def some_other_func(param, value):
+            values_list.append(value)
+            return value
+
+        some_other_func('request', 1)
+        some_other_func('request', 2)
+        some_other_func('request', 1)
+        self.assertEqual([1, 2, 1], values_list)
+        self.assertEqual(2, some_other_func.cache_info().evictions)
+
 
 class GetConfigValueTests(test.TestCase):
     key = 'key'
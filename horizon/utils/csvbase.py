@@ -124,6 +124,7 @@ class BaseCsvStreamingResponse(CsvDataMixin, StreamingHttpResponse):
 
     def buffer(self):
         buf = self.out.getvalue()
+        self.out.seek(0)
         self.out.truncate(0)
         return buf
 
@@ -10,7 +10,9 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import json
 import logging
+import os
 
 from os import path
 from os import walk
@@ -72,12 +74,91 @@ def sort_js_files(js_files):
     return sources, mocks, specs
 
 
-def discover_static_files(base_path, sub_path=''):
+class StaticFilesManifest(object):
+    """Precomputed results of the static file discovery.
+
+    Walking the static directories of horizon, openstack_dashboard, the
+    themes and the plugins is slow, and is done again by every process
+    importing the settings. A manifest built once by the
+    ``make_static_manifest`` management command records the files
+    discovered in each directory, along with the modification times of
+    the directories walked. Entries whose directories changed since are
+    stale, and the directory is walked again.
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, entries=None, record=False):
+        self.entries = entries or {}
+        # When recording, the files discovered by walking the directories
+        # are added to the manifest.
+        self.record = record
+
+    @classmethod
+    def load(cls, filename):
+        """Returns the manifest stored in filename, or None if unusable."""
+        try:
+            with open(filename) as f:
+                data = json.load(f)
+        except (IOError, OSError, ValueError):
+            return None
+        if data.get('version') != cls.FORMAT_VERSION:
+            LOG.info("Ignoring static files manifest %s of another format "
+                     "version.", filename)
+            return None
+        return cls(data.get('entries'))
+
+    def save(self, filename):
+        with open(filename, 'w') as f:
+            json.dump({'version': self.FORMAT_VERSION,
+                       'entries': self.entries},
+                      f, indent=1, sort_keys=True)
+
+    @staticmethod
+    def _get_key(base_path, sub_path):
+        return path.abspath(path.join(base_path, sub_path))
+
+    def get(self, base_path, sub_path=''):
+        """Returns the files discovered in a path, or None if stale."""
+        key = self._get_key(base_path, sub_path)
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        try:
+            for directory, mtime in entry['directories'].items():
+                if os.stat(directory).st_mtime != mtime:
+                    break
+            else:
+                return (entry['sources'], entry['mocks'], entry['specs'],
+                        entry['templates'])
+        except OSError:
+            pass
+        LOG.info("Static files manifest entry for %s is stale.", key)
+        return None
+
+    def add(self, base_path, sub_path, sources, mocks, specs, templates):
+        key = self._get_key(base_path, sub_path)
+        directories = dict((root, os.stat(root).st_mtime)
+                           for root, dirs, files in walk(key))
+        self.entries[key] = {'directories': directories,
+                             'sources': sources,
+                             'mocks': mocks,
+                             'specs': specs,
+                             'templates': templates}
+
+
+def discover_static_files(base_path, sub_path='', manifest=None):
     """Discovers static files in given paths.
 
     It returns JavaScript sources, mocks, specs and HTML templates,
-    all grouped in lists.
+    all grouped in lists. If a :class:`StaticFilesManifest` is given, the
+    files it recorded for the path are used when they are up to date.
     """
+    if manifest is not None:
+        found = manifest.get(base_path, sub_path)
+        if found is not None:
+            return found
+
     js_files = discover_files(base_path, sub_path=sub_path,
                               ext='.js', trim_base_path=True)
     sources, mocks, specs = sort_js_files(js_files)
@@ -90,13 +171,15 @@ def discover_static_files(base_path, sub_path=''):
     _log(specs, 'JavaScript spec', p)
     _log(html_files, 'HTML template', p)
 
+    if manifest is not None and manifest.record:
+        manifest.add(base_path, sub_path, sources, mocks, specs, html_files)
     return sources, mocks, specs, html_files
 
 
 def populate_horizon_config(horizon_config, base_path,
-                            sub_path='', prepend=False):
+                            sub_path='', prepend=False, manifest=None):
     sources, mocks, specs, template = discover_static_files(
-        base_path, sub_path=sub_path)
+        base_path, sub_path=sub_path, manifest=manifest)
     if prepend:
         horizon_config.setdefault('js_files', [])[:0] = sources
         horizon_config.setdefault('js_spec_files', [])[:0] = mocks + specs
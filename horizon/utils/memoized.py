@@ -12,7 +12,10 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import collections
 import functools
+import threading
+import time
 import warnings
 import weakref
 
@@ -21,6 +24,10 @@ class UnhashableKeyWarning(RuntimeWarning):
     """Raised when trying to memoize a function with an unhashable argument."""
 
 
+CacheInfo = collections.namedtuple(
+    'CacheInfo', ['hits', 'misses', 'evictions', 'max_size', 'ttl', 'size'])
+
+
 def _try_weakref(arg, remove_callback):
     """Return a weak reference to arg if possible, or arg itself if not."""
     try:
@@ -44,7 +51,7 @@ def _get_key(args, kwargs, remove_callback):
     return weak_args, weak_kwargs
 
 
-def memoized(func):
+def memoized(func=None, max_size=None, ttl=None):
     """Decorator that caches function calls.
 
     Caches the decorated function's return value the first time it is called
@@ -53,11 +60,63 @@ def memoized(func):
 
     The cache uses weak references to the passed arguments, so it doesn't keep
     them alive in memory forever.
+
+    The decorator can be used either bare (``@memoized``), in which case the
+    cache is unbounded, or with arguments to bound it::
+
+        @memoized(max_size=100, ttl=600)
+        def get_client(username, token_id, endpoint):
+            ...
+
+    ``max_size`` is the maximum number of cached values; once reached, the
+    least recently used value is evicted.  ``ttl`` is the number of seconds
+    a cached value is kept for.  Both default to ``None`` (no limit).
+
+    The decorated function gains a ``cache_info()`` method returning the
+    hit, miss and eviction counters together with the current cache size,
+    and a ``cache_clear()`` method which empties the cache.
     """
+    if func is None:
+        return functools.partial(memoized, max_size=max_size, ttl=ttl)
+
     # The dictionary in which all the data will be cached. This is a separate
     # instance for every decorated function, and it's stored in a closure of
-    # the wrapped function.
-    cache = {}
+    # the wrapped function.  It is kept in least recently used order, and
+    # maps every key to a (value, expiry time) tuple.
+    cache = collections.OrderedDict()
+    stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+    # Memoized functions may be called from worker threads, and the weak
+    # reference callbacks may fire while the lock is already held by the
+    # same thread.
+    lock = threading.RLock()
+
+    def _lookup(key):
+        with lock:
+            value, expires = cache.pop(key)
+            if expires is not None and expires <= time.time():
+                stats['evictions'] += 1
+                raise KeyError(key)
+            # Re-insert the entry to mark it as the most recently used.
+            cache[key] = (value, expires)
+            stats['hits'] += 1
+            return value
+
+    def _store(key, value):
+        with lock:
+            cache.pop(key, None)
+            if ttl is not None:
+                now = time.time()
+                expired = [k for k, (v, expires) in cache.items()
+                           if expires <= now]
+                for k in expired:
+                    del cache[k]
+                stats['evictions'] += len(expired)
+            if max_size is not None:
+                while cache and len(cache) >= max_size:
+                    cache.popitem(last=False)
+                    stats['evictions'] += 1
+            expires = time.time() + ttl if ttl is not None else None
+            cache[key] = (value, expires)
 
     @functools.wraps(func)
     def wrapped(*args, **kwargs):
@@ -70,7 +129,8 @@ def memoized(func):
             """A callback to remove outdated items from cache."""
             try:
                 # The key here is from closure, and is calculated later.
-                del cache[key]
+                with lock:
+                    del cache[key]
             except KeyError:
                 # Some other weak reference might have already removed that
                 # key -- in that case we don't need to do anything.
@@ -83,9 +143,12 @@ def memoized(func):
             # happen once and likely calls some external API, database, or
             # some other slow thing. That's why the hit is in straightforward
             # code, and the miss is in an exception.
-            value = cache[key]
+            value = _lookup(key)
         except KeyError:
-            value = cache[key] = func(*args, **kwargs)
+            with lock:
+                stats['misses'] += 1
+            value = func(*args, **kwargs)
+            _store(key, value)
         except TypeError:
             # The calculated key may be unhashable when an unhashable object,
             # such as a list, is passed as one of the arguments. In that case,
@@ -96,6 +159,19 @@ def memoized(func):
                 UnhashableKeyWarning, 2)
             value = func(*args, **kwargs)
         return value
+
+    def cache_info():
+        with lock:
+            return CacheInfo(stats['hits'], stats['misses'],
+                             stats['evictions'], max_size, ttl, len(cache))
+
+    def cache_clear():
+        with lock:
+            cache.clear()
+            stats.update(hits=0, misses=0, evictions=0)
+
+    wrapped.cache_info = cache_info
+    wrapped.cache_clear = cache_clear
     return wrapped
 
 # We can use @memoized for methods now too, because it uses weakref and so
@@ -104,7 +180,8 @@ def memoized(func):
 memoized_method = memoized
 
 
-def memoized_with_request(request_func, request_index=0):
+def memoized_with_request(request_func, request_index=0, max_size=None,
+                          ttl=None):
     """Decorator for caching functions which receive a request argument
 
     memoized functions with a request argument are memoized only during the
@@ -156,10 +233,13 @@ def memoized_with_request(request_func, request_index=0):
             #     some_other_funt(param, get_api_client(request), other_param)
             return api_client.some_method(param, other_param)
 
+    ``max_size`` and ``ttl`` bound the cache as described in
+    :func:`memoized`.
+
     See openstack_dashboard.api.nova for a complete example.
     """
     def wrapper(func):
-        memoized_func = memoized(func)
+        memoized_func = memoized(func, max_size=max_size, ttl=ttl)
 
         @functools.wraps(func)
         def wrapped(*args, **kwargs):
@@ -168,5 +248,7 @@ def memoized_with_request(request_func, request_index=0):
             args.insert(request_index, request_func(request))
             return memoized_func(*args, **kwargs)
 
+        wrapped.cache_info = memoized_func.cache_info
+        wrapped.cache_clear = memoized_func.cache_clear
         return wrapped
     return wrapper
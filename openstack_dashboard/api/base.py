@@ -18,8 +18,11 @@
 
 from collections import Sequence
 import functools
+import hashlib
+import uuid
 
 from django.conf import settings
+from django.core.cache import cache
 
 from horizon import exceptions
 
@@ -30,6 +33,30 @@ import six
 __all__ = ('APIResourceWrapper', 'APIDictWrapper',
            'get_service_from_catalog', 'url_for',)
 
+# Bounds of the memoized caches of API clients and of the data retrieved
+# through them. These are keyed by user token and endpoint, and would
+# otherwise grow for the lifetime of the worker process.
+CLIENT_CACHE_MAX_SIZE = getattr(settings, 'API_CLIENT_CACHE_MAX_SIZE', 100)
+CLIENT_CACHE_TTL = getattr(settings, 'API_CLIENT_CACHE_TTL', 3600)
+
+# Prefix of the keys of the data shared between requests through the Django
+# cache framework
+SHARED_CACHE_PREFIX = 'openstack_dashboard'
+
+# Number of seconds the reference data (flavors, images and projects) used
+# to resolve resource names is shared between requests
+REFERENCE_DATA_CACHE_TIMEOUT = getattr(settings,
+                                       'REFERENCE_DATA_CACHE_TIMEOUT', 60)
+
+# Number of seconds the alarm summaries polled by the alarm banner are shared
+# between requests
+ALARM_SUMMARY_CACHE_TIMEOUT = getattr(settings,
+                                      'ALARM_SUMMARY_CACHE_TIMEOUT', 5)
+
+# Number of seconds the subclouds polled by the distributed cloud overview are
+# shared between requests
+SUBCLOUD_CACHE_TIMEOUT = getattr(settings, 'SUBCLOUD_CACHE_TIMEOUT', 5)
+
 
 @functools.total_ordering
 class Version(object):
@@ -392,3 +419,81 @@ def get_request_page_size(request, limit=None):
     except Exception:
         default_page_size = getattr(settings, 'API_RESULT_PAGE_SIZE', 20)
         return request.session.get('horizon_pagesize', default_page_size)
+
+
+class CachedResource(dict):
+    """Detached copy of an API resource stored in the Django cache.
+
+    API resources keep a reference to the client which retrieved them, so
+    they cannot be shared between requests. Their attributes are stored
+    as a dictionary instead, which gives attribute access to them once
+    restored from the cache.
+    """
+
+    def __getattr__(self, attr):
+        try:
+            return self[attr]
+        except KeyError:
+            raise AttributeError(attr)
+
+
+def _shared_cache_key(*parts):
+    # Region names and scopes are not guaranteed to be valid memcached keys
+    digest = hashlib.sha1(
+        ':'.join(six.text_type(p) for p in parts).encode('utf-8'))
+    return '%s:%s:%s' % (SHARED_CACHE_PREFIX, parts[0], digest.hexdigest())
+
+
+def _shared_cache_generation(request, kind, renew=False):
+    key = _shared_cache_key(kind, 'generation', request.user.services_region)
+    if renew:
+        generation = uuid.uuid4().hex
+        cache.set(key, generation, None)
+        return generation
+    generation = cache.get(key)
+    if generation is None:
+        cache.add(key, uuid.uuid4().hex, None)
+        generation = cache.get(key)
+    return generation
+
+
+def get_project_scope(request):
+    """Return the scope of the data visible to the user of the request.
+
+    Data shared between the users of the same project with the same roles
+    can be cached with this scope.
+    """
+    roles = sorted(role['name'] for role in request.user.roles)
+    return '%s:%s' % (request.user.project_id, ','.join(roles))
+
+
+def shared_cache_get(request, kind, func, timeout, scope=None,
+                     cacheable=None):
+    """Return data shared between the requests of the same region.
+
+    The data of the given ``kind`` is looked up in the Django cache for the
+    region of the request and the optional ``scope``. When it is missing,
+    ``func`` is called to retrieve it and its result is cached for
+    ``timeout`` seconds. The result must be picklable; ``CachedResource``
+    can hold the attributes of API resources. A result for which the
+    optional ``cacheable`` function returns False, such as a partial one,
+    is returned without being cached.
+
+    Cached data is discarded by :func:`shared_cache_invalidate`.
+    """
+    if not timeout:
+        return func()
+    generation = _shared_cache_generation(request, kind)
+    key = _shared_cache_key(kind, request.user.services_region, generation,
+                            scope)
+    value = cache.get(key)
+    if value is None:
+        value = func()
+        if cacheable is None or cacheable(value):
+            cache.set(key, value, timeout)
+    return value
+
+
+def shared_cache_invalidate(request, kind):
+    """Discard all the cached data of the given kind for the region."""
+    _shared_cache_generation(request, kind, renew=True)
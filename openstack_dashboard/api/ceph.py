@@ -20,11 +20,17 @@ from __future__ import absolute_import
 import logging
 
 from cephclient import wrapper
+from django.conf import settings
+import futurist
 
 from openstack_dashboard.api import base
 
 LOG = logging.getLogger(__name__)
 
+# The storage services snapshot is shared between requests for a few seconds
+# so that pages and ajax refreshes landing together only query ceph once.
+SERVICES_CACHE_TIMEOUT = getattr(settings, 'CEPH_SERVICES_CACHE_TIMEOUT', 5)
+
 
 # TODO(wrs) this can be instancized once, or will need to pass request per
 # user?
@@ -69,9 +75,10 @@ def _Bytes_to_GiB(value_B):
     return (value_B / (1024 * 1024 * 1024))
 
 
-def cluster_get():
+def cluster_get(ceph=None):
+    ceph = ceph or cephwrapper()
     # the json response doesn't give all the information
-    response, text_body = cephwrapper().health(body='text')
+    response, text_body = ceph.health(body='text')
     # ceph is not up, raise exception
     if not response.ok:
         response.raise_for_status()
@@ -83,7 +90,7 @@ def cluster_get():
     else:
         detail = health_info[0]
 
-    response, cluster_uuid = cephwrapper().fsid(body='text')
+    response, cluster_uuid = ceph.fsid(body='text')
     if not response.ok:
         cluster_uuid = None
 
@@ -96,9 +103,10 @@ def cluster_get():
     return Cluster(cluster)
 
 
-def storage_get():
+def storage_get(ceph=None):
+    ceph = ceph or cephwrapper()
     # # Space info
-    response, body = cephwrapper().df(body='json')
+    response, body = ceph.df(body='json')
     # return no space info
     if not response.ok:
         response.raise_for_status()
@@ -110,8 +118,7 @@ def storage_get():
     }
 
     # # I/O info
-    response, body = cephwrapper().osd_pool_stats(body='json',
-                                                  name='cinder-volumes')
+    response, body = ceph.osd_pool_stats(body='json', name='cinder-volumes')
     if not response.ok:
         response.raise_for_status()
     stats = body['output'][0]['client_io_rate']
@@ -141,8 +148,9 @@ def _get_quorum_status(mon, quorums):
     return status
 
 
-def monitor_list():
-    response, body = cephwrapper().mon_dump(body='json')
+def monitor_list(ceph=None):
+    ceph = ceph or cephwrapper()
+    response, body = ceph.mon_dump(body='json')
     # return no monitors info
     if not response.ok:
         response.raise_for_status()
@@ -157,27 +165,69 @@ def monitor_list():
     return [Monitor(m) for m in mons]
 
 
-def osd_list():
-    # would use osd_find, but it doesn't give osd's name
-    response, tree = cephwrapper().osd_tree(body='json')
+def osd_list(ceph=None):
+    ceph = ceph or cephwrapper()
+    # host membership comes from the crush hierarchy in the same response,
+    # rather than one osd_find round trip per osd
+    response, tree = ceph.osd_tree(body='json')
     if not response.ok:
         response.raise_for_status()
 
+    nodes = tree['output']['nodes']
+    osd_hosts = {}
+    for node in nodes:
+        if node['type'] == 'host':
+            for child in node.get('children', []):
+                osd_hosts[child] = node['name']
+
     osds = []
-    for node in tree['output']['nodes']:
+    for node in nodes:
         # found osd
         if node['type'] == 'osd':
             osd = {}
             osd['id'] = node['id']
             osd['name'] = node['name']
             osd['status'] = node['status']
-
-            # check if osd belongs to host
-            response, body = cephwrapper().osd_find(body='json', id=osd['id'])
-            if response.ok and 'host' in body['output']['crush_location']:
-                osd['host'] = body['output']['crush_location']['host']
-            # else dont set hostname
-
+            # only set the hostname if the osd belongs to a host
+            if node['id'] in osd_hosts:
+                osd['host'] = osd_hosts[node['id']]
             osds.append(osd)
 
     return [OSD(o) for o in osds]
+
+
+STORAGE_SERVICES = (
+    ('cluster', cluster_get),
+    ('storage', storage_get),
+    ('monitors', monitor_list),
+    ('osds', osd_list),
+)
+
+
+def storage_services_get(request):
+    """Return the cluster, storage, monitors and osds of the ceph cluster.
+
+    The queries run concurrently and the result is a (results, errors) pair
+    of dicts keyed by service name, so a failing query does not hide the
+    others.  Complete snapshots are shared between the requests of the
+    region for CEPH_SERVICES_CACHE_TIMEOUT seconds.
+    """
+    def _storage_services():
+        results = {}
+        errors = {}
+
+        def _task_get(name, func):
+            try:
+                results[name] = func()
+            except Exception as exc:
+                errors[name] = exc
+
+        with futurist.ThreadPoolExecutor(
+                max_workers=len(STORAGE_SERVICES)) as e:
+            for name, func in STORAGE_SERVICES:
+                e.submit(_task_get, name, func)
+        return results, errors
+
+    return base.shared_cache_get(request, 'ceph_services',
+                                 _storage_services, SERVICES_CACHE_TIMEOUT,
+                                 cacheable=lambda value: not value[1])
@@ -192,7 +192,9 @@ def get_auth_params_from_request(request):
     )
 
 
-@memoized_with_request(get_auth_params_from_request)
+@memoized_with_request(get_auth_params_from_request,
+                       max_size=base.CLIENT_CACHE_MAX_SIZE,
+                       ttl=base.CLIENT_CACHE_TTL)
 def cinderclient(request_auth_params, version=None):
     if version is None:
         api_version = VERSIONS.get_active_version()
@@ -370,17 +372,22 @@ def volume_create(request, size, name, description, volume_type,
     data = _replace_v2_parameters(data)
 
     volume = cinderclient(request).volumes.create(size, **data)
+    base.shared_cache_invalidate(request, 'quota_usages')
     return Volume(volume)
 
 
 @profiler.trace
 def volume_extend(request, volume_id, new_size):
-    return cinderclient(request).volumes.extend(volume_id, new_size)
+    result = cinderclient(request).volumes.extend(volume_id, new_size)
+    base.shared_cache_invalidate(request, 'quota_usages')
+    return result
 
 
 @profiler.trace
 def volume_delete(request, volume_id):
-    return cinderclient(request).volumes.delete(volume_id)
+    result = cinderclient(request).volumes.delete(volume_id)
+    base.shared_cache_invalidate(request, 'quota_usages')
+    return result
 
 
 @profiler.trace
@@ -497,13 +504,17 @@ def volume_snapshot_create(request, volume_id, name,
             'force': force}
     data = _replace_v2_parameters(data)
 
-    return VolumeSnapshot(cinderclient(request).volume_snapshots.create(
-        volume_id, **data))
+    snapshot = cinderclient(request).volume_snapshots.create(volume_id,
+                                                             **data)
+    base.shared_cache_invalidate(request, 'quota_usages')
+    return VolumeSnapshot(snapshot)
 
 
 @profiler.trace
 def volume_snapshot_delete(request, snapshot_id):
-    return cinderclient(request).volume_snapshots.delete(snapshot_id)
+    result = cinderclient(request).volume_snapshots.delete(snapshot_id)
+    base.shared_cache_invalidate(request, 'quota_usages')
+    return result
 
 
 @profiler.trace
@@ -771,7 +782,9 @@ def tenant_quota_get(request, tenant_id):
 
 @profiler.trace
 def tenant_quota_update(request, tenant_id, **kwargs):
-    return cinderclient(request).quotas.update(tenant_id, **kwargs)
+    result = cinderclient(request).quotas.update(tenant_id, **kwargs)
+    base.shared_cache_invalidate(request, 'quota_usages')
+    return result
 
 
 @profiler.trace
@@ -1003,7 +1016,8 @@ def availability_zone_list(request, detailed=False):
 
 
 @profiler.trace
-@memoized_with_request(cinderclient)
+@memoized_with_request(cinderclient, max_size=base.CLIENT_CACHE_MAX_SIZE,
+                       ttl=base.CLIENT_CACHE_TTL)
 def list_extensions(cinder_api):
     return tuple(cinder_list_extensions.ListExtManager(cinder_api).show_all())
 
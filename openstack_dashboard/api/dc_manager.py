@@ -17,7 +17,7 @@ from openstack_dashboard.api import base
 LOG = logging.getLogger(__name__)
 
 
-@memoized
+@memoized(max_size=base.CLIENT_CACHE_MAX_SIZE, ttl=base.CLIENT_CACHE_TTL)
 def dcmanagerclient(request):
     endpoint = base.url_for(request, 'dcmanager', 'adminURL')
     c = client.Client(project_id=request.user.project_id,
@@ -36,6 +36,21 @@ def alarm_summary_list(request):
     return [Summary(summary) for summary in summaries]
 
 
+def alarm_summary_list_cached(request):
+    """Get the subcloud alarm summaries shared between requests.
+
+    The summaries are cached for ``ALARM_SUMMARY_CACHE_TIMEOUT`` seconds.
+    """
+    def _alarm_summary_list():
+        return [base.CachedResource(s.to_dict())
+                for s in alarm_summary_list(request)]
+
+    summaries = base.shared_cache_get(request, 'subcloud_alarm_summaries',
+                                      _alarm_summary_list,
+                                      base.ALARM_SUMMARY_CACHE_TIMEOUT)
+    return [Summary(s) for s in summaries]
+
+
 class Subcloud(base.APIResourceWrapper):
     _attrs = ['subcloud_id', 'name', 'description', 'location',
               'software_version', 'management_subnet', 'management_state',
@@ -50,21 +65,41 @@ def subcloud_list(request):
     return [Subcloud(subcloud) for subcloud in subclouds]
 
 
+def subcloud_list_cached(request):
+    """Get the subclouds shared between requests.
+
+    The subclouds are cached for ``SUBCLOUD_CACHE_TIMEOUT`` seconds, or
+    until one of them is changed through the dashboard.
+    """
+    def _subcloud_list():
+        return [base.CachedResource(s.to_dict())
+                for s in subcloud_list(request)]
+
+    subclouds = base.shared_cache_get(request, 'subclouds', _subcloud_list,
+                                      base.SUBCLOUD_CACHE_TIMEOUT)
+    return [Subcloud(s) for s in subclouds]
+
+
 def subcloud_create(request, data):
-    return dcmanagerclient(request).subcloud_manager.add_subcloud(
+    subcloud = dcmanagerclient(request).subcloud_manager.add_subcloud(
         **data.get('data'))
+    base.shared_cache_invalidate(request, 'subclouds')
+    return subcloud
 
 
 def subcloud_update(request, subcloud_id, changes):
     response = dcmanagerclient(request).subcloud_manager.update_subcloud(
         subcloud_id, **changes.get('updated'))
+    base.shared_cache_invalidate(request, 'subclouds')
     # Updating returns a list of subclouds for some reason
     return [Subcloud(subcloud) for subcloud in response]
 
 
 def subcloud_delete(request, subcloud_id):
-    return dcmanagerclient(request).subcloud_manager.delete_subcloud(
+    response = dcmanagerclient(request).subcloud_manager.delete_subcloud(
         subcloud_id)
+    base.shared_cache_invalidate(request, 'subclouds')
+    return response
 
 
 def subcloud_generate_config(request, subcloud_id, data):
@@ -234,7 +234,9 @@ def _normalize_list_input(filters, **kwargs):
 
 @profiler.trace
 def image_delete(request, image_id):
-    return glanceclient(request).images.delete(image_id)
+    result = glanceclient(request).images.delete(image_id)
+    base.shared_cache_invalidate(request, 'images')
+    return result
 
 
 @profiler.trace
@@ -352,6 +354,31 @@ def image_list_detailed(request, marker=None, sort_dir='desc',
     return wrapped_images, has_more_data, has_prev_data
 
 
+@profiler.trace
+def image_list_cached(request):
+    """Get the list of images shared between requests of the project.
+
+    The list is cached for ``REFERENCE_DATA_CACHE_TIMEOUT`` seconds and is
+    used to resolve image names; it is discarded when images are created,
+    updated or deleted through the dashboard.
+    """
+    def _image_list():
+        cached_images = []
+        for image in image_list_detailed(request)[0]:
+            # v1 Image objects are not iterable, see Image.to_dict()
+            if isinstance(image._apiresource, collections.Iterable):
+                data = dict(image._apiresource)
+            else:
+                data = image._apiresource.to_dict()
+            cached_images.append(base.CachedResource(data))
+        return cached_images
+
+    images = base.shared_cache_get(request, 'images', _image_list,
+                                   base.REFERENCE_DATA_CACHE_TIMEOUT,
+                                   scope=base.get_project_scope(request))
+    return [Image(image) for image in images]
+
+
 @profiler.trace
 def image_update(request, image_id, **kwargs):
     image_data = kwargs.get('data', None)
@@ -362,8 +389,9 @@ def image_update(request, image_id, **kwargs):
         # to remove, and the default is nothing gets removed.
         if VERSIONS.active < 2:
             kwargs['purge_props'] = False
-        return Image(glanceclient(request).images.update(
-            image_id, **kwargs))
+        image = glanceclient(request).images.update(image_id, **kwargs)
+        base.shared_cache_invalidate(request, 'images')
+        return Image(image)
     finally:
         if image_data:
             try:
@@ -441,6 +469,7 @@ def image_create(request, **kwargs):
     image = glanceclient(request).images.create(**kwargs)
     if location is not None:
         glanceclient(request).images.add_location(image.id, location, {})
+    base.shared_cache_invalidate(request, 'images')
 
     if data:
         if isinstance(data, six.string_types):
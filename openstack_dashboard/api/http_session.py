@@ -0,0 +1,116 @@
+#
+# Copyright (c) 2017 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Pooled HTTP transport of the clients of the platform services.
+
+The clients which talk to the platform REST APIs directly send their
+requests through a single session per worker process, which keeps the
+connections to each endpoint alive between the requests of the dashboard
+instead of handshaking again for every API call. The latency of the
+requests is recorded per endpoint.
+"""
+
+import collections
+import logging
+import os
+import threading
+import time
+import urlparse
+
+from django.conf import settings
+import requests
+from requests import adapters
+from requests.packages.urllib3.util import retry
+
+LOG = logging.getLogger(__name__)
+
+# Number of connections kept alive per endpoint
+POOL_SIZE = getattr(settings, 'PLATFORM_HTTP_POOL_SIZE', 10)
+
+# Number of seconds to wait for an endpoint to accept the connection, and
+# to send the response (None waits as long as the operation takes, such as
+# the upload of a patch)
+CONNECT_TIMEOUT = getattr(settings, 'PLATFORM_HTTP_CONNECT_TIMEOUT', 10)
+READ_TIMEOUT = getattr(settings, 'PLATFORM_HTTP_READ_TIMEOUT', None)
+
+# Number of times a request is sent again when the connection to the
+# endpoint fails
+RETRIES = getattr(settings, 'PLATFORM_HTTP_RETRIES', 2)
+
+_session = None
+_session_pid = None
+_lock = threading.Lock()
+_latencies = collections.defaultdict(lambda: {'count': 0, 'errors': 0,
+                                              'total': 0.0, 'max': 0.0})
+
+
+def get_session():
+    """Return the HTTP session of the worker process.
+
+    A session created before the process was forked is not reused by the
+    child, whose connections would be shared with its parent.
+    """
+    global _session, _session_pid
+    with _lock:
+        if _session is None or _session_pid != os.getpid():
+            # Only failures to connect are retried, when the request has
+            # not been sent yet
+            adapter = adapters.HTTPAdapter(
+                pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE,
+                max_retries=retry.Retry(total=RETRIES, read=False,
+                                        backoff_factor=0.2))
+            session = requests.Session()
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _session = session
+            _session_pid = os.getpid()
+            _latencies.clear()
+        return _session
+
+
+def _record_latency(endpoint, elapsed, failed):
+    with _lock:
+        latency = _latencies[endpoint]
+        latency['count'] += 1
+        latency['errors'] += int(failed)
+        latency['total'] += elapsed
+        latency['max'] = max(latency['max'], elapsed)
+
+
+def get_latencies():
+    """Return the latency of the requests of the process per endpoint.
+
+    Maps each endpoint to the number of requests, of failed ones, and the
+    total and maximum number of seconds they took.
+    """
+    with _lock:
+        return dict((endpoint, dict(latency))
+                    for endpoint, latency in _latencies.items())
+
+
+def request(method, url, **kwargs):
+    """Send a request through the session of the process.
+
+    Takes the arguments of :meth:`requests.Session.request`, with the
+    ``PLATFORM_HTTP_CONNECT_TIMEOUT`` and ``PLATFORM_HTTP_READ_TIMEOUT``
+    timeouts by default.
+    """
+    kwargs.setdefault('timeout', (CONNECT_TIMEOUT, READ_TIMEOUT))
+    o = urlparse.urlparse(url)
+    endpoint = "://".join((o.scheme, o.netloc))
+    session = get_session()
+    start = time.time()
+    failed = True
+    try:
+        response = session.request(method, url, **kwargs)
+        failed = response.status_code >= 500
+        return response
+    finally:
+        elapsed = time.time() - start
+        _record_latency(endpoint, elapsed, failed)
+        LOG.debug("%(method)s %(path)s on %(endpoint)s took %(ms).1f ms",
+                  {'method': method, 'path': o.path, 'endpoint': endpoint,
+                   'ms': elapsed * 1000})
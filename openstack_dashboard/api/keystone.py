@@ -263,13 +263,15 @@ def tenant_create(request, name, description=None, enabled=None,
     manager = VERSIONS.get_project_manager(request, admin=True)
     try:
         if VERSIONS.active < 3:
-            return manager.create(name, description, enabled, **kwargs)
+            project = manager.create(name, description, enabled, **kwargs)
         else:
-            return manager.create(name, domain,
-                                  description=description,
-                                  enabled=enabled, **kwargs)
+            project = manager.create(name, domain,
+                                     description=description,
+                                     enabled=enabled, **kwargs)
     except keystone_exceptions.Conflict:
         raise exceptions.Conflict()
+    base.shared_cache_invalidate(request, 'projects')
+    return project
 
 
 def get_default_domain(request, get_name=True):
@@ -353,7 +355,9 @@ def tenant_get(request, project, admin=True):
 @profiler.trace
 def tenant_delete(request, project):
     manager = VERSIONS.get_project_manager(request, admin=True)
-    return manager.delete(project)
+    result = manager.delete(project)
+    base.shared_cache_invalidate(request, 'projects')
+    return result
 
 
 @profiler.trace
@@ -399,19 +403,42 @@ def tenant_list(request, paginate=False, marker=None, domain=None, user=None,
     return tenants, has_more_data
 
 
+@profiler.trace
+def tenant_list_cached(request):
+    """Get the list of projects shared between requests of the project.
+
+    The list is cached for ``REFERENCE_DATA_CACHE_TIMEOUT`` seconds and is
+    used to resolve project names; it is discarded when projects are
+    created, updated or deleted through the dashboard.
+    """
+    def _tenant_list():
+        return [base.CachedResource(t.to_dict())
+                for t in tenant_list(request)[0]]
+
+    domain_id = (request.session.get('domain_context') or
+                 getattr(request.user, 'user_domain_id', None))
+    scope = '%s:%s' % (base.get_project_scope(request), domain_id)
+    return base.shared_cache_get(request, 'projects', _tenant_list,
+                                 base.REFERENCE_DATA_CACHE_TIMEOUT,
+                                 scope=scope)
+
+
 @profiler.trace
 def tenant_update(request, project, name=None, description=None,
                   enabled=None, domain=None, **kwargs):
     manager = VERSIONS.get_project_manager(request, admin=True)
     try:
         if VERSIONS.active < 3:
-            return manager.update(project, name, description, enabled,
-                                  **kwargs)
+            result = manager.update(project, name, description, enabled,
+                                    **kwargs)
         else:
-            return manager.update(project, name=name, description=description,
-                                  enabled=enabled, domain=domain, **kwargs)
+            result = manager.update(project, name=name,
+                                    description=description,
+                                    enabled=enabled, domain=domain, **kwargs)
     except keystone_exceptions.Conflict:
         raise exceptions.Conflict()
+    base.shared_cache_invalidate(request, 'projects')
+    return result
 
 
 @profiler.trace
@@ -950,6 +950,7 @@ def network_create(request, **kwargs):
         kwargs['tenant_id'] = request.user.project_id
     body = {'network': kwargs}
     network = neutronclient(request).create_network(body=body).get('network')
+    base.shared_cache_invalidate(request, 'quota_usages')
     return Network(network)
 
 
@@ -967,6 +968,7 @@ def network_update(request, network_id, **kwargs):
 def network_delete(request, network_id):
     LOG.debug("network_delete(): netid=%s", network_id)
     neutronclient(request).delete_network(network_id)
+    base.shared_cache_invalidate(request, 'quota_usages')
 
 
 @profiler.trace
@@ -1012,6 +1014,7 @@ def subnet_create(request, network_id, **kwargs):
         kwargs['tenant_id'] = request.user.project_id
     body['subnet'].update(kwargs)
     subnet = neutronclient(request).create_subnet(body=body).get('subnet')
+    base.shared_cache_invalidate(request, 'quota_usages')
     return Subnet(subnet)
 
 
@@ -1029,6 +1032,7 @@ def subnet_update(request, subnet_id, **kwargs):
 def subnet_delete(request, subnet_id):
     LOG.debug("subnet_delete(): subnetid=%s", subnet_id)
     neutronclient(request).delete_subnet(subnet_id)
+    base.shared_cache_invalidate(request, 'quota_usages')
 
 
 @profiler.trace
@@ -1175,6 +1179,7 @@ def router_create(request, **kwargs):
         kwargs['tenant_id'] = request.user.project_id
     body['router'].update(kwargs)
     router = neutronclient(request).create_router(body=body).get('router')
+    base.shared_cache_invalidate(request, 'quota_usages')
     return Router(router)
 
 
@@ -1212,6 +1217,7 @@ def router_list_on_l3_agent(request, l3_agent_id, **params):
 @profiler.trace
 def router_delete(request, router_id):
     neutronclient(request).delete_router(router_id)
+    base.shared_cache_invalidate(request, 'quota_usages')
 
 
 @profiler.trace
@@ -1295,7 +1301,9 @@ def tenant_quota_get(request, tenant_id):
 @profiler.trace
 def tenant_quota_update(request, tenant_id, **kwargs):
     quotas = {'quota': kwargs}
-    return neutronclient(request).update_quota(tenant_id, quotas)
+    result = neutronclient(request).update_quota(tenant_id, quotas)
+    base.shared_cache_invalidate(request, 'quota_usages')
+    return result
 
 
 @profiler.trace
@@ -1369,11 +1377,15 @@ def tenant_floating_ip_get(request, floating_ip_id):
 
 
 def tenant_floating_ip_allocate(request, pool=None, tenant_id=None, **params):
-    return FloatingIpManager(request).allocate(pool, tenant_id, **params)
+    fip = FloatingIpManager(request).allocate(pool, tenant_id, **params)
+    base.shared_cache_invalidate(request, 'quota_usages')
+    return fip
 
 
 def tenant_floating_ip_release(request, floating_ip_id):
-    return FloatingIpManager(request).release(floating_ip_id)
+    result = FloatingIpManager(request).release(floating_ip_id)
+    base.shared_cache_invalidate(request, 'quota_usages')
+    return result
 
 
 def floating_ip_associate(request, floating_ip_id, port_id):
@@ -1416,11 +1428,15 @@ def security_group_get(request, sg_id):
 
 
 def security_group_create(request, name, desc):
-    return SecurityGroupManager(request).create(name, desc)
+    secgroup = SecurityGroupManager(request).create(name, desc)
+    base.shared_cache_invalidate(request, 'quota_usages')
+    return secgroup
 
 
 def security_group_delete(request, sg_id):
-    return SecurityGroupManager(request).delete(sg_id)
+    result = SecurityGroupManager(request).delete(sg_id)
+    base.shared_cache_invalidate(request, 'quota_usages')
+    return result
 
 
 def security_group_update(request, sg_id, name, desc):
@@ -1550,7 +1566,7 @@ def _server_get_addresses(request, server, ports, floating_ips, network_names):
 
 
 @profiler.trace
-@memoized
+@memoized(max_size=base.CLIENT_CACHE_MAX_SIZE, ttl=base.CLIENT_CACHE_TTL)
 def list_extensions(request):
     try:
         extensions_list = neutronclient(request).list_extensions()
@@ -25,13 +25,17 @@
 from __future__ import absolute_import
 
 import collections
+import datetime
 import logging
+import sys
 
 import keystoneauth1.loading
 import keystoneauth1.session
 
 from django.conf import settings
 from django.utils.translation import ugettext_lazy as _
+import futurist
+import six
 
 import novaclient as nc
 from novaclient import api_versions
@@ -69,6 +73,12 @@ DEFAULT_QUOTA_NAME = 'default'
 INSECURE = getattr(settings, 'OPENSTACK_SSL_NO_VERIFY', False)
 CACERT = getattr(settings, 'OPENSTACK_SSL_CACERT', None)
 
+# Number of seconds the usage of past days is shared between requests
+USAGE_CACHE_TIMEOUT = getattr(settings, 'NOVA_USAGE_CACHE_TIMEOUT', 86400)
+
+USAGE_TOTALS = ('total_hours', 'total_memory_mb_usage', 'total_vcpus_usage',
+                'total_local_gb_usage')
+
 
 @memoized
 def get_microversion(request, feature):
@@ -272,7 +282,9 @@ def novaclient(request_auth_params, version=None):
     return _novaclient(request_auth_params, version)
 
 
-@memoized_with_request(get_auth_params_from_request)
+@memoized_with_request(get_auth_params_from_request,
+                       max_size=base.CLIENT_CACHE_MAX_SIZE,
+                       ttl=base.CLIENT_CACHE_TTL)
 def _novaclient(request_auth_params, version=None):
     (
         username,
@@ -413,12 +425,14 @@ def flavor_create(request, name, memory, vcpu, disk, flavorid='auto',
                                                 rxtx_factor=rxtx_factor)
     if (metadata):
         flavor_extra_set(request, flavor.id, metadata)
+    base.shared_cache_invalidate(request, 'flavors')
     return flavor
 
 
 @profiler.trace
 def flavor_delete(request, flavor_id):
     novaclient(request).flavors.delete(flavor_id)
+    base.shared_cache_invalidate(request, 'flavors')
 
 
 @profiler.trace
@@ -440,6 +454,23 @@ def flavor_list(request, is_public=True, get_extras=False):
     return flavors
 
 
+@profiler.trace
+def flavor_list_cached(request):
+    """Get the list of flavors shared between requests of the project.
+
+    The list is cached for ``REFERENCE_DATA_CACHE_TIMEOUT`` seconds and is
+    used to resolve flavor names; it is discarded when flavors are created,
+    deleted or their access is changed through the dashboard.
+    """
+    def _flavor_list():
+        return [base.CachedResource(f.to_dict())
+                for f in flavor_list(request)]
+
+    return base.shared_cache_get(request, 'flavors', _flavor_list,
+                                 base.REFERENCE_DATA_CACHE_TIMEOUT,
+                                 scope=base.get_project_scope(request))
+
+
 @profiler.trace
 def update_pagination(entities, page_size, marker, sort_dir, sort_key,
                       reversed_order):
@@ -505,15 +536,19 @@ def flavor_access_list(request, flavor=None):
 @profiler.trace
 def add_tenant_to_flavor(request, flavor, tenant):
     """Add a tenant to the given flavor access list."""
-    return novaclient(request).flavor_access.add_tenant_access(
+    access = novaclient(request).flavor_access.add_tenant_access(
         flavor=flavor, tenant=tenant)
+    base.shared_cache_invalidate(request, 'flavors')
+    return access
 
 
 @profiler.trace
 def remove_tenant_from_flavor(request, flavor, tenant):
     """Remove a tenant from the given flavor access list."""
-    return novaclient(request).flavor_access.remove_tenant_access(
+    access = novaclient(request).flavor_access.remove_tenant_access(
         flavor=flavor, tenant=tenant)
+    base.shared_cache_invalidate(request, 'flavors')
+    return access
 
 
 @profiler.trace
@@ -581,7 +616,7 @@ def server_create(request, name, image, flavor, key_name, user_data,
                   availability_zone=None, instance_count=1, admin_pass=None,
                   disk_config=None, config_drive=None, meta=None,
                   scheduler_hints=None, min_inst_count=None):
-    return Server(novaclient_with_newtoken(request).servers.create(
+    server = Server(novaclient_with_newtoken(request).servers.create(
         name.strip(), image, flavor, userdata=user_data,
         security_groups=security_groups,
         key_name=key_name, block_device_mapping=block_device_mapping,
@@ -591,11 +626,14 @@ def server_create(request, name, image, flavor, key_name, user_data,
         max_count=instance_count, admin_pass=admin_pass,
         disk_config=disk_config, config_drive=config_drive,
         meta=meta, scheduler_hints=scheduler_hints), request)
+    base.shared_cache_invalidate(request, 'quota_usages')
+    return server
 
 
 @profiler.trace
 def server_delete(request, instance_id):
     novaclient_with_newtoken(request).servers.delete(instance_id)
+    base.shared_cache_invalidate(request, 'quota_usages')
 
 
 def get_novaclient_with_locked_status(request):
@@ -782,6 +820,7 @@ def tenant_quota_get(request, tenant_id):
 def tenant_quota_update(request, tenant_id, **kwargs):
     if kwargs:
         novaclient_with_newtoken(request).quotas.update(tenant_id, **kwargs)
+    base.shared_cache_invalidate(request, 'quota_usages')
 
 
 @profiler.trace
@@ -825,9 +864,7 @@ def _merge_usage_list(usages, next_usage_list):
             usages[next_usage.tenant_id] = next_usage
 
 
-@profiler.trace
-def usage_get(request, tenant_id, start, end):
-    client = upgrade_api(request, novaclient(request), '2.40')
+def _usage_get(client, tenant_id, start, end):
     usage = client.usage.get(tenant_id, start, end)
     if client.api_version >= api_versions.APIVersion('2.40'):
         # If the number of instances used to calculate the usage is greater
@@ -839,12 +876,10 @@ def usage_get(request, tenant_id, start, end):
             marker = _get_usage_marker(next_usage)
             if marker:
                 _merge_usage(usage, next_usage)
-    return NovaUsage(usage)
+    return usage
 
 
-@profiler.trace
-def usage_list(request, start, end):
-    client = upgrade_api(request, novaclient(request), '2.40')
+def _usage_list(client, start, end):
     usage_list = client.usage.list(start, end, True)
     if client.api_version >= api_versions.APIVersion('2.40'):
         # If the number of instances used to calculate the usage is greater
@@ -860,7 +895,162 @@ def usage_list(request, start, end):
             if marker:
                 _merge_usage_list(usages, next_usage_list)
         usage_list = usages.values()
-    return [NovaUsage(u) for u in usage_list]
+    return usage_list
+
+
+def _get_usage_periods(start, end):
+    """Splits a time range into days, flagging the days that are over.
+
+    Returns a list of ``(start, end, closed)`` tuples. The first and last
+    periods are truncated to the range.
+    """
+    now = datetime.datetime.utcnow()
+    periods = []
+    period_start = start
+    while period_start < end:
+        next_day = datetime.datetime.combine(
+            period_start.date() + datetime.timedelta(days=1),
+            datetime.time())
+        period_end = min(next_day, end)
+        periods.append((period_start, period_end, period_end <= now))
+        period_start = period_end
+    return periods
+
+
+def _detach_usage(usage):
+    return base.CachedResource(
+        (attr, getattr(usage, attr)) for attr in NovaUsage._attrs
+        if hasattr(usage, attr))
+
+
+def _sum_usages(usages):
+    """Sums the usages of a tenant over consecutive periods.
+
+    The hours of the instances are added up, while their other fields,
+    such as their state, are taken from the most recent period.
+    """
+    total = base.CachedResource()
+    servers = collections.OrderedDict()
+    for usage in usages:
+        total.update((key, value) for key, value in usage.items()
+                     if key not in USAGE_TOTALS and key != 'server_usages')
+        for server in usage.get('server_usages', []):
+            merged = servers.setdefault(server['instance_id'], {'hours': 0})
+            hours = merged['hours'] + server.get('hours', 0)
+            merged.update(server)
+            merged['hours'] = hours
+    if usages:
+        total['start'] = usages[0].get('start')
+    for attr in USAGE_TOTALS:
+        total[attr] = sum(usage.get(attr, 0) for usage in usages)
+    total['server_usages'] = list(servers.values())
+    return total
+
+
+def _sum_tenant_usages(usage_lists):
+    """Sums the usages of each tenant over consecutive periods."""
+    tenant_usages = collections.OrderedDict()
+    for usages in usage_lists:
+        for usage in usages:
+            tenant_usages.setdefault(usage['tenant_id'], []).append(usage)
+    return [_sum_usages(usages) for usages in tenant_usages.values()]
+
+
+def _get_period_usages(request, kind, fetch, combine, start, end,
+                       scope=None):
+    """Retrieves the usage of a range, caching the days that are over.
+
+    The usage from ``start`` to the end of each day that is over does not
+    change, so it is cached. ``fetch`` is called with the bounds of the
+    days that are over since the last cached one, then of the current day,
+    which makes at most two calls whatever the number of days.
+    ``combine`` sums a chronological list of the results of ``fetch``.
+    """
+    boundaries = [period_end for period_start, period_end, closed
+                  in _get_usage_periods(start, end) if closed]
+    if not boundaries:
+        return fetch(start, end)
+
+    def _get_cached(boundary, func):
+        # Returns None without caching it when func does
+        return base.shared_cache_get(
+            request, kind, func, USAGE_CACHE_TIMEOUT,
+            scope='%s:%s:%s' % (scope, start.isoformat(),
+                                boundary.isoformat()),
+            cacheable=lambda value: value is not None)
+
+    cached = None
+    cached_end = start
+    for boundary in reversed(boundaries):
+        cached = _get_cached(boundary, lambda: None)
+        if cached is not None:
+            cached_end = boundary
+            break
+    closed_end = boundaries[-1]
+
+    ranges = {}
+    if cached_end < closed_end:
+        ranges['closed'] = (cached_end, closed_end)
+    if closed_end < end:
+        ranges['current'] = (closed_end, end)
+    results = {}
+    errors = []
+
+    def _task_fetch(name, period_start, period_end):
+        try:
+            results[name] = fetch(period_start, period_end)
+        except Exception:
+            errors.append(sys.exc_info())
+
+    with futurist.ThreadPoolExecutor(max_workers=len(ranges) or 1) as e:
+        for name, (period_start, period_end) in ranges.items():
+            e.submit(_task_fetch, name, period_start, period_end)
+    if errors:
+        six.reraise(*errors[0])
+
+    usage = cached
+    if 'closed' in results:
+        usage = combine([u for u in (cached, results['closed'])
+                         if u is not None])
+        _get_cached(closed_end, lambda: usage)
+    if 'current' in results:
+        usage = combine([usage, results['current']])
+    return usage
+
+
+@profiler.trace
+def usage_get(request, tenant_id, start, end):
+    client = upgrade_api(request, novaclient(request), '2.40')
+    if not USAGE_CACHE_TIMEOUT:
+        return NovaUsage(_usage_get(client, tenant_id, start, end))
+
+    # The usage of past days does not change, so it is cached and only the
+    # days since then are retrieved again.
+    def _fetch(period_start, period_end):
+        return _detach_usage(_usage_get(client, tenant_id,
+                                        period_start, period_end))
+
+    return NovaUsage(_get_period_usages(request, 'nova_usage', _fetch,
+                                        _sum_usages, start, end,
+                                        scope=tenant_id))
+
+
+@profiler.trace
+def usage_list(request, start, end):
+    client = upgrade_api(request, novaclient(request), '2.40')
+    if not USAGE_CACHE_TIMEOUT:
+        return [NovaUsage(u) for u in _usage_list(client, start, end)]
+
+    # The usage of past days does not change, so it is cached and only the
+    # days since then are retrieved again.
+    def _fetch(period_start, period_end):
+        return [_detach_usage(usage)
+                for usage in _usage_list(client, period_start, period_end)]
+
+    return [NovaUsage(usage)
+            for usage in _get_period_usages(request, 'nova_usage_list',
+                                            _fetch, _sum_tenant_usages,
+                                            start, end)]
 
 
 @profiler.trace
@@ -1023,13 +1213,17 @@ def server_group_get(request, server_group_id):
 
 @profiler.trace
 def server_group_create(request, name, project_id, metadata, policies):
-    return novaclient(request).server_groups.create(
+    server_group = novaclient(request).server_groups.create(
         name, project_id, metadata, policies)
+    base.shared_cache_invalidate(request, 'quota_usages')
+    return server_group
 
 
 @profiler.trace
 def server_group_delete(request, server_group_id):
-    return novaclient(request).server_groups.delete(server_group_id)
+    result = novaclient(request).server_groups.delete(server_group_id)
+    base.shared_cache_invalidate(request, 'quota_usages')
+    return result
 
 
 @profiler.trace
@@ -1121,7 +1315,8 @@ def interface_detach(request, server, port_id):
 
 
 @profiler.trace
-@memoized_with_request(novaclient)
+@memoized_with_request(novaclient, max_size=base.CLIENT_CACHE_MAX_SIZE,
+                       ttl=base.CLIENT_CACHE_TTL)
 def list_extensions(nova_api):
     """List all nova extensions, except the ones in the blacklist."""
     blacklist = set(getattr(settings,
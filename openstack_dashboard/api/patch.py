@@ -16,14 +16,19 @@
 import logging
 import urlparse
 
-import requests
+from django.conf import settings
 
 from openstack_dashboard.api import base
+from openstack_dashboard.api import http_session
 from requests_toolbelt import MultipartEncoder
 
 
 LOG = logging.getLogger(__name__)
 
+# Number of seconds the patching state of the hosts is shared between the
+# requests looking up a single host, such as the inventory row updates
+HOSTS_CACHE_TIMEOUT = getattr(settings, 'PATCH_HOSTS_CACHE_TIMEOUT', 5)
+
 
 class Client(object):
     def __init__(self, version, url, token_id):
@@ -41,11 +46,12 @@ class Client(object):
                    "Accept": "application/json"}
 
         if method == 'GET':
-            req = requests.get(url, headers=headers)
+            req = http_session.request('GET', url, headers=headers)
         elif method == 'POST':
             if encoder is not None:
                 headers['Content-Type'] = encoder.content_type
-            req = requests.post(url, headers=headers, data=encoder)
+            req = http_session.request('POST', url, headers=headers,
+                                       data=encoder)
 
         resp = req.json()
 
@@ -171,6 +177,13 @@ def get_patch(request, patch_id):
     return patch
 
 
+def _make_host(data):
+    host = Host()
+    for a in host._attrs:
+        setattr(host, a, data[a])
+    return host
+
+
 def get_hosts(request):
     hosts = []
     try:
@@ -180,17 +193,38 @@ def get_hosts(request):
 
     if info:
         for h in info['data']:
-            host = Host()
-            for a in host._attrs:
-                setattr(host, a, h[a])
-            hosts.append(host)
+            hosts.append(_make_host(h))
     return hosts
 
 
+def _get_hosts_by_name(request):
+    def _query_hosts():
+        info = _patching_client(request).get_hosts()
+        if not info:
+            return {}
+        return dict((h['hostname'],
+                     base.CachedResource((a, h[a]) for a in Host._attrs))
+                    for h in info['data'])
+
+    try:
+        return base.shared_cache_get(request, 'patch_hosts', _query_hosts,
+                                     HOSTS_CACHE_TIMEOUT)
+    except Exception:
+        return {}
+
+
 def get_host(request, hostname):
-    phosts = get_hosts(request)
-    return next((phost for phost in phosts if phost.hostname == hostname),
-                None)
+    """Get the patching state of a host.
+
+    The state of all the hosts is retrieved at once, indexed by hostname and
+    shared between requests for ``PATCH_HOSTS_CACHE_TIMEOUT`` seconds, so
+    that the rows of the inventory polled during a patching operation do
+    not each retrieve it.
+    """
+    data = _get_hosts_by_name(request).get(hostname)
+    if data is None:
+        return None
+    return _make_host(data)
 
 
 def get_message(data):
@@ -212,11 +246,13 @@ def upload_patch(request, patchfile, name):
 
 def patch_apply_req(request, patch_id):
     resp = _patching_client(request).apply(patch_id)
+    base.shared_cache_invalidate(request, 'patch_hosts')
     return get_message(resp)
 
 
 def patch_remove_req(request, patch_id):
     resp = _patching_client(request).remove(patch_id)
+    base.shared_cache_invalidate(request, 'patch_hosts')
     return get_message(resp)
 
 
@@ -227,9 +263,11 @@ def patch_delete_req(request, patch_id):
 
 def host_install(request, hostname):
     resp = _patching_client(request).host_install(hostname)
+    base.shared_cache_invalidate(request, 'patch_hosts')
     return get_message(resp)
 
 
 def host_install_async(request, hostname):
     resp = _patching_client(request).host_install_async(hostname)
+    base.shared_cache_invalidate(request, 'patch_hosts')
     return get_message(resp)
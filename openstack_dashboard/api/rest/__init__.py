@@ -31,6 +31,7 @@ from openstack_dashboard.api.rest import network
 from openstack_dashboard.api.rest import neutron
 from openstack_dashboard.api.rest import nova
 from openstack_dashboard.api.rest import policy
+from openstack_dashboard.api.rest import push
 from openstack_dashboard.api.rest import swift
 from openstack_dashboard.api.rest import sysinv
 
@@ -46,6 +47,7 @@ __all__ = [
     'neutron',
     'nova',
     'policy',
+    'push',
     'swift',
     'sysinv',
 ]
@@ -5,16 +5,28 @@
 #
 #
 
+import hashlib
 import logging
 
+from django.conf import settings
+from django.core.cache import cache
+from django import http
+from django.utils.cache import patch_cache_control
 from django.views import generic
+from oslo_serialization import jsonutils
 
+from openstack_dashboard.api import base
 from openstack_dashboard.api import dc_manager
 from openstack_dashboard.api.rest import urls
 from openstack_dashboard.api.rest import utils as rest_utils
 
 LOG = logging.getLogger(__name__)
 
+# Number of seconds a version of the subcloud overview is remembered so that
+# later polls only receive the subclouds that changed since that version
+OVERVIEW_VERSION_CACHE_TIMEOUT = getattr(
+    settings, 'SUBCLOUD_OVERVIEW_VERSION_CACHE_TIMEOUT', 300)
+
 
 @urls.register
 class Subcloud(generic.View):
@@ -87,3 +99,70 @@ class Summaries(generic.View):
         """Get a list of summaries"""
         result = dc_manager.alarm_summary_list(request)
         return {'items': [s.to_dict() for s in result]}
+
+
+def _digest(value):
+    return hashlib.sha1(
+        jsonutils.dumps(value, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def _overview_version_key(request, version):
+    digest = hashlib.sha1(('%s:%s' % (request.user.services_region,
+                                      version)).encode('utf-8'))
+    return '%s:subcloud_overview:%s' % (base.SHARED_CACHE_PREFIX,
+                                        digest.hexdigest())
+
+
+@urls.register
+class Overview(generic.View):
+    """API for the subclouds joined to their alarm summaries"""
+    url_regex = r'dc_manager/overview/$'
+
+    @rest_utils.ajax()
+    def get(self, request):
+        """Get the subclouds with their alarm summary
+
+        GET http://localhost/api/dc_manager/overview/?since=<version>
+
+        Returns the ``version`` of the overview, which is also its ETag,
+        and either all the subclouds as ``items`` or, when the ``since``
+        version is still known, the subclouds ``changed`` since then and
+        the ids of the ``removed`` ones. A request whose If-None-Match
+        header matches the current version is answered with 304.
+        """
+        summaries = dict(
+            (summary.name, summary.to_dict())
+            for summary in dc_manager.alarm_summary_list_cached(request))
+        items = []
+        for subcloud in dc_manager.subcloud_list_cached(request):
+            item = subcloud.to_dict()
+            item.update(summaries.get(subcloud.name, {}))
+            items.append(item)
+        digests = dict((item['subcloud_id'], _digest(item))
+                       for item in items)
+        version = _digest(digests)
+        etag = '"%s"' % version
+
+        if request.META.get('HTTP_IF_NONE_MATCH') == etag:
+            response = http.HttpResponseNotModified()
+        else:
+            cache.set(_overview_version_key(request, version), digests,
+                      OVERVIEW_VERSION_CACHE_TIMEOUT)
+            since = request.GET.get('since')
+            old_digests = None
+            if since:
+                old_digests = cache.get(_overview_version_key(request, since))
+            if old_digests is None:
+                result = {'version': version, 'items': items}
+            else:
+                result = {
+                    'version': version,
+                    'changed': [item for item in items
+                                if old_digests.get(item['subcloud_id']) !=
+                                digests[item['subcloud_id']]],
+                    'removed': sorted(set(old_digests) - set(digests)),
+                }
+            response = rest_utils.JSONResponse(result)
+        response['ETag'] = etag
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
@@ -33,7 +33,25 @@ class NaNJSONEncoder(json.JSONEncoder):
         Infinity values are not supported by JSON standard, we still can
         convince Javascript JSON.parse() to create a Javascript Infinity
         object if we feed a token `1e+999` to it.
+
+        The floatstr() function cannot be given to the C accelerated
+        encoder, so one-shot encodings are first attempted by it with NaN
+        and infinity disallowed, and only fall back to the pure Python
+        encoder when such values are present.
         """
+        if _one_shot:
+            allow_nan = self.allow_nan
+            self.allow_nan = False
+            try:
+                return list(super(NaNJSONEncoder, self).iterencode(
+                    o, _one_shot=True))
+            except ValueError:
+                pass
+            finally:
+                self.allow_nan = allow_nan
+        return self._py_iterencode(o, _one_shot)
+
+    def _py_iterencode(self, o, _one_shot=False):
         if self.check_circular:
             markers = {}
         else:
@@ -0,0 +1,223 @@
+#
+# Copyright (c) 2017 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+#
+
+"""Long-poll channel pushing alarm, host and strategy changes to browsers.
+
+Each topic is retrieved at most once per ``PUSH_CHANNEL_POLL_INTERVAL``
+seconds and region, whatever the number of open browsers: the request which
+obtains the poll lease of the topic in the Django cache retrieves it and
+stores a snapshot of its entities, which the requests of every other
+browser and worker process only read. The browsers send the version of the
+topics they have seen and receive the entities that changed since then as
+soon as a new snapshot differs, or an empty response after
+``PUSH_CHANNEL_WAIT`` seconds.
+
+Every request holds a worker thread of the web server while it waits, and
+the pages subscribed to the channel keep one pending at all times, so the
+channel is disabled unless ``PUSH_CHANNEL_ENABLED`` is set.
+"""
+
+import hashlib
+import logging
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.views import generic
+from oslo_serialization import jsonutils
+import six
+
+from openstack_dashboard.api import base
+from openstack_dashboard.api import dc_manager
+from openstack_dashboard.api.rest import urls
+from openstack_dashboard.api.rest import utils as rest_utils
+from openstack_dashboard.api import sysinv
+from openstack_dashboard.api import vim
+
+LOG = logging.getLogger(__name__)
+
+# Whether the pages refreshed on changes are pushed them rather than poll
+ENABLED = getattr(settings, 'PUSH_CHANNEL_ENABLED', False)
+
+# Minimum number of seconds between two retrievals of a topic for a region
+POLL_INTERVAL = getattr(settings, 'PUSH_CHANNEL_POLL_INTERVAL', 5)
+
+# Maximum number of seconds a request waits for a change before returning
+WAIT = getattr(settings, 'PUSH_CHANNEL_WAIT', 20)
+
+# Number of seconds the snapshots of a topic are remembered to compute the
+# changes since the version seen by a browser
+HISTORY_TIMEOUT = getattr(settings, 'PUSH_CHANNEL_HISTORY_TIMEOUT', 300)
+
+HOST_STATE_FIELDS = ('hostname', 'personality', 'administrative',
+                     'operational', 'availability', 'task', 'config_status',
+                     'vim_progress_status', 'install_state',
+                     'install_state_info')
+
+STRATEGY_STATE_FIELDS = ('state', 'current_phase',
+                         'current_phase_completion_percentage')
+
+
+def _alarm_summary_entities(request):
+    summary = sysinv.alarm_summary_get(request)
+    return {'system': summary.to_dict()} if summary else {}
+
+
+def _host_entities(request):
+    return dict((host.id, dict((field, getattr(host, field, None))
+                               for field in HOST_STATE_FIELDS))
+                for host in sysinv.host_list(request))
+
+
+def _strategy_entities(request):
+    # The strategies are retrieved from vim on every poll rather than
+    # through vim.get_strategy(), which keeps them for the whole request
+    # while the long-poll request polls them several times
+    client = vim._sw_update_client(request)
+    entities = {}
+    for name in (vim.STRATEGY_SW_PATCH, vim.STRATEGY_SW_UPGRADE):
+        strategy = client.get_strategy(name)
+        if strategy:
+            entities[name] = dict((field, getattr(strategy, field, None))
+                                  for field in STRATEGY_STATE_FIELDS)
+    return entities
+
+
+def _subcloud_entities(request):
+    return dict((subcloud.subcloud_id, subcloud.to_dict())
+                for subcloud in dc_manager.subcloud_list(request))
+
+
+def _subcloud_alarm_entities(request):
+    return dict((summary.name, summary.to_dict())
+                for summary in dc_manager.alarm_summary_list(request))
+
+
+# The function retrieving the entities of each topic, keyed by their id, and
+# the type of the service it requires
+TOPICS = {
+    'alarm_summary': (_alarm_summary_entities, 'platform'),
+    'hosts': (_host_entities, 'platform'),
+    'strategy': (_strategy_entities, 'nfv'),
+    'subclouds': (_subcloud_entities, 'dcmanager'),
+    'subcloud_alarms': (_subcloud_alarm_entities, 'dcmanager'),
+}
+
+
+def _digest(value):
+    return hashlib.sha1(
+        jsonutils.dumps(value, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def _cache_key(request, topic, *parts):
+    digest = hashlib.sha1(':'.join(
+        six.text_type(p) for p in (request.user.services_region, topic) + parts
+    ).encode('utf-8'))
+    return '%s:push:%s' % (base.SHARED_CACHE_PREFIX, digest.hexdigest())
+
+
+def _get_snapshot(request, topic):
+    """Return the latest snapshot of the topic, polling it if it is due.
+
+    Only the request holding the poll lease of the topic retrieves it; the
+    others return the snapshot stored by the last lease holder, which may
+    be missing until its first poll completes.
+    """
+    snapshot_key = _cache_key(request, topic)
+    if not cache.add(_cache_key(request, topic, 'lease'), True,
+                     POLL_INTERVAL):
+        return cache.get(snapshot_key)
+    try:
+        entities = TOPICS[topic][0](request)
+    except Exception:
+        LOG.exception('Unable to retrieve the %s pushed to browsers.', topic)
+        return cache.get(snapshot_key)
+    digests = dict((key, _digest(value))
+                   for key, value in entities.items())
+    version = _digest(digests)
+    snapshot = {'version': version, 'digests': digests,
+                'entities': entities}
+    cache.set(snapshot_key, snapshot, HISTORY_TIMEOUT)
+    cache.set(_cache_key(request, topic, version), digests, HISTORY_TIMEOUT)
+    return snapshot
+
+
+def _get_changes(request, topic, snapshot, since):
+    """Return the entities of the snapshot which changed since a version.
+
+    All the entities are returned with ``reset`` set when the digests of
+    that version are no longer known.
+    """
+    old_digests = None
+    if since:
+        old_digests = cache.get(_cache_key(request, topic, since))
+    if old_digests is None:
+        return {'version': snapshot['version'], 'reset': True,
+                'changed': snapshot['entities'], 'removed': []}
+    digests = snapshot['digests']
+    return {
+        'version': snapshot['version'],
+        'reset': False,
+        'changed': dict((key, snapshot['entities'][key])
+                        for key, digest in digests.items()
+                        if old_digests.get(key) != digest),
+        'removed': sorted(set(old_digests) - set(digests)),
+    }
+
+
+def get_updates(request, versions, wait=WAIT):
+    """Wait for the topics to differ from the versions seen by a browser.
+
+    ``versions`` maps the topics to the version last seen, or None. The
+    changes of every topic whose version differs are returned as soon as
+    there is one, or no change once ``wait`` seconds are elapsed.
+    """
+    deadline = time.time() + wait
+    while True:
+        updates = {}
+        for topic, since in versions.items():
+            snapshot = _get_snapshot(request, topic)
+            if snapshot and snapshot['version'] != since:
+                updates[topic] = _get_changes(request, topic, snapshot,
+                                              since)
+        if updates or time.time() >= deadline:
+            return updates
+        time.sleep(1)
+
+
+@urls.register
+class Updates(generic.View):
+    """API pushing the changes of alarms, hosts, strategies and subclouds."""
+    url_regex = r'push/updates/$'
+
+    @rest_utils.ajax()
+    def get(self, request):
+        """Wait for changes of the requested topics.
+
+        The topics are listed in the ``topics`` parameter, with the version
+        last seen of each topic in a parameter of the same name:
+
+        GET /api/push/updates/?topics=alarm_summary,hosts&hosts=<version>
+
+        Returns a ``topics`` object mapping each topic that changed to its
+        new ``version``, the ``changed`` entities keyed by id and the ids
+        of the ``removed`` ones. ``reset`` is set when ``changed`` holds all
+        the entities of the topic. The topics of services missing from the
+        region are ignored. Returns 404 when the channel is disabled.
+        """
+        if not ENABLED:
+            raise rest_utils.AjaxError(404, 'The push channel is disabled')
+        if not request.user.is_superuser:
+            raise rest_utils.AjaxError(403, 'Only available to administrators')
+        versions = {}
+        for topic in request.GET.get('topics', '').split(','):
+            if (topic in TOPICS and
+                    base.is_service_enabled(request, TOPICS[topic][1])):
+                versions[topic] = request.GET.get(topic) or None
+        if not versions:
+            return {'topics': {}}
+        return {'topics': get_updates(request, versions)}
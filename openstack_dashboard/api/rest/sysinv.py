@@ -21,8 +21,8 @@ class AlarmSummary(generic.View):
     def get(self, request):
         """Get an alarm summary for the system"""
         include_suppress = request.GET.get('include_suppress', False)
-        result = sysinv.alarm_summary_get(request, include_suppress)
-        return result.to_dict()
+        result = sysinv.alarm_summary_get_cached(request, include_suppress)
+        return result.to_dict() if result else {}
 
 
 @urls.register
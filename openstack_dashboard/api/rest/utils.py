@@ -17,6 +17,7 @@ import logging
 
 from django.conf import settings
 from django import http
+from django.middleware import gzip as gzip_middleware
 from django.utils import decorators
 
 from oslo_serialization import jsonutils
@@ -73,8 +74,39 @@ class JSONResponse(_RestResponse):
         )
 
 
+class JSONStreamingResponse(http.StreamingHttpResponse):
+    """Streams a JSON object with a large ``items`` list.
+
+    The items, which may be produced by a generator, are encoded and sent
+    one at a time rather than building the whole document in memory.
+    """
+    def __init__(self, data, status=200, json_encoder=json.JSONEncoder):
+        super(JSONStreamingResponse, self).__init__(
+            status=status,
+            streaming_content=self._iter_json(data, json_encoder),
+            content_type='application/json',
+        )
+
+    @staticmethod
+    def _iter_json(data, json_encoder):
+        encoder = json_encoder(default=jsonutils.to_primitive,
+                               sort_keys=settings.DEBUG)
+        yield '{"items": ['
+        for index, item in enumerate(data['items']):
+            if index:
+                yield ', '
+            yield encoder.encode(item)
+        yield ']'
+        others = [(k, v) for k, v in data.items() if k != 'items']
+        if settings.DEBUG:
+            others.sort()
+        for key, value in others:
+            yield ', %s: %s' % (encoder.encode(key), encoder.encode(value))
+        yield '}'
+
+
 def ajax(authenticated=True, data_required=False,
-         json_encoder=json.JSONEncoder):
+         json_encoder=json.JSONEncoder, gzip=False, stream_items=False):
     """Decorator to allow the wrappered view to exist in an AJAX environment.
 
     Provide a decorator to wrap a view method so that it may exist in an
@@ -91,6 +123,12 @@ def ajax(authenticated=True, data_required=False,
     If data_required is true then we'll assert that there is a JSON body
     present.
 
+    If gzip is true then successful responses are compressed when the
+    client accepts it.
+
+    If stream_items is true then returned dictionaries with an ``items``
+    list are streamed one item at a time (see JSONStreamingResponse).
+
     The wrapped view method should return either:
 
     - JSON serialisable data
@@ -126,11 +164,21 @@ def ajax(authenticated=True, data_required=False,
             # invoke the wrapped function, handling exceptions sanely
             try:
                 data = function(self, request, *args, **kw)
-                if isinstance(data, http.HttpResponse):
-                    return data
+                if isinstance(data, (http.HttpResponse,
+                                     http.StreamingHttpResponse)):
+                    response = data
                 elif data is None:
                     return JSONResponse('', status=204)
-                return JSONResponse(data, json_encoder=json_encoder)
+                elif (stream_items and isinstance(data, dict) and
+                        'items' in data):
+                    response = JSONStreamingResponse(
+                        data, json_encoder=json_encoder)
+                else:
+                    response = JSONResponse(data, json_encoder=json_encoder)
+                if gzip:
+                    response = gzip_middleware.GZipMiddleware()\
+                        .process_response(request, response)
+                return response
             except http_errors as e:
                 # exception was raised with a specific HTTP status
                 for attr in ['http_status', 'code', 'status_code']:
@@ -17,6 +17,7 @@
 
 from __future__ import absolute_import
 
+import collections
 import datetime
 import logging
 
@@ -25,6 +26,7 @@ from cgtsclient.v1 import icpu as icpu_utils
 
 from django.conf import settings
 from django.utils.translation import ugettext_lazy as _
+import futurist
 
 from openstack_dashboard.api import base
 
@@ -130,10 +132,27 @@ SERVICE_PARAM_ODL_ROUTER_PLUGINS = [
     'odl-router',
     'networking_odl.l3.l3_odl.OpenDaylightL3RouterPlugin']
 
+# Default number of concurrent sysinv requests used to retrieve the
+# inventory collections of a single host
+HOST_DETAIL_MAX_WORKERS = 8
+
+# Number of seconds the system type and mode are shared between requests
+SYSTEM_CONTEXT_CACHE_TIMEOUT = getattr(
+    settings, 'SYSINV_SYSTEM_CONTEXT_CACHE_TIMEOUT', 60)
+
 LOG = logging.getLogger(__name__)
 
 
 def cgtsclient(request):
+    # One client is created per request and reused by all its API calls
+    client = getattr(request, '_cgtsclient', None)
+    if client is None:
+        client = _cgtsclient(request)
+        request._cgtsclient = client
+    return client
+
+
+def _cgtsclient(request):
     insecure = getattr(settings, 'OPENSTACK_SSL_NO_VERIFY', False)
     cacert = getattr(settings, 'OPENSTACK_SSL_CACERT', None)
 
@@ -1030,6 +1049,27 @@ def alarm_summary_get(request, include_suppress=False):
     return None
 
 
+def alarm_summary_get_cached(request, include_suppress=False):
+    """Get the alarm summary shared between requests of the region.
+
+    The summary is cached for ``ALARM_SUMMARY_CACHE_TIMEOUT`` seconds per
+    value of ``include_suppress``, so that the alarm banners polled by every
+    open browser result in a single query to sysinv.
+    """
+    def _alarm_summary_get():
+        summary = alarm_summary_get(request, include_suppress)
+        # an empty summary is cached as well
+        return base.CachedResource(summary.to_dict() if summary else {})
+
+    summary = base.shared_cache_get(request, 'alarm_summary',
+                                    _alarm_summary_get,
+                                    base.ALARM_SUMMARY_CACHE_TIMEOUT,
+                                    scope=include_suppress)
+    if not summary:
+        return None
+    return AlarmSummary(summary)
+
+
 class Alarm(base.APIResourceWrapper):
     """Wrapper for Inventory Alarms"""
 
@@ -1052,9 +1092,55 @@ class Alarm(base.APIResourceWrapper):
         super(Alarm, self).__init__(apiresource)
 
 
+def _pop_include_suppress(search_opts):
+    include_suppress = False
+    if "suppression" in search_opts:
+        suppression = search_opts.pop('suppression')
+
+        if suppression == FM_SUPPRESS_SHOW:
+            include_suppress = True
+        elif suppression == FM_SUPPRESS_HIDE:
+            include_suppress = False
+    return include_suppress
+
+
+def _pop_event_log_types(search_opts):
+    alarms = False
+    logs = False
+    if "evtType" in search_opts:
+        evtType = search_opts.pop('evtType')
+        if evtType == FM_ALARM:
+            alarms = True
+        elif evtType == FM_LOG:
+            logs = True
+    return alarms, logs
+
+
+def _list_all_pages(list_func, **kwargs):
+    """Iterate over all the resources of a paginated cgtsclient list.
+
+    The resources are retrieved API_RESULT_LIMIT at a time, following the
+    uuid of the last resource of each page as the marker of the next one.
+    The first page is retrieved before returning so that its errors are
+    raised to the caller.
+    """
+    page_size = getattr(settings, 'API_RESULT_LIMIT', 1000)
+    first_page = list_func(limit=page_size, marker=None, **kwargs)
+
+    def _iter_pages(page):
+        while True:
+            for resource in page:
+                yield resource
+            if len(page) < page_size:
+                return
+            page = list_func(limit=page_size, marker=page[-1].uuid,
+                             **kwargs)
+
+    return _iter_pages(first_page)
+
+
 def alarm_list(request, search_opts=None):
     paginate = False
-    include_suppress = False
 
     if search_opts is None:
         search_opts = {}
@@ -1065,13 +1151,7 @@ def alarm_list(request, search_opts=None):
     sort_dir = search_opts.get('sort_dir', None)
     page_size = base.get_request_page_size(request, limit)
 
-    if "suppression" in search_opts:
-        suppression = search_opts.pop('suppression')
-
-        if suppression == FM_SUPPRESS_SHOW:
-            include_suppress = True
-        elif suppression == FM_SUPPRESS_HIDE:
-            include_suppress = False
+    include_suppress = _pop_include_suppress(search_opts)
 
     if 'paginate' in search_opts:
         paginate = search_opts.pop('paginate')
@@ -1096,6 +1176,20 @@ def alarm_list(request, search_opts=None):
         return [Alarm(n) for n in alarms]
 
 
+def alarm_list_all(request, search_opts=None):
+    """Iterate over all the active alarms, one page at a time.
+
+    The raw cgtsclient resources are returned for exports, so that they
+    are not all held in memory.
+    """
+    search_opts = dict(search_opts or {})
+    include_suppress = _pop_include_suppress(search_opts)
+    return _list_all_pages(cgtsclient(request).ialarm.list,
+                           sort_key=search_opts.get('sort_key'),
+                           sort_dir=search_opts.get('sort_dir'),
+                           include_suppress=include_suppress)
+
+
 def alarm_get(request, alarm_id):
     alarm = cgtsclient(request).ialarm.get(alarm_id)
     if not alarm:
@@ -1120,7 +1214,10 @@ def system_update(request, system_id, **kwargs):
     mypatch = []
     for key, value in kwargs.iteritems():
         mypatch.append(dict(path='/' + key, value=value, op='replace'))
-    return cgtsclient(request).isystem.update(system_id, mypatch)
+    system = cgtsclient(request).isystem.update(system_id, mypatch)
+    base.shared_cache_invalidate(request, 'system_context')
+    request._sysinv_system_context = None
+    return system
 
 
 def host_create(request, **kwargs):
@@ -1226,6 +1323,67 @@ def host_list(request):
     return [Host(n) for n in hosts]
 
 
+class HostStatusModel(object):
+    """Inventory hosts grouped by personality and joined to patch state.
+
+    The hosts are partitioned, sorted by hostname and annotated with the
+    state of the matching patching host in a single pass, which also counts
+    the provisioned hosts and those that are degraded or failed.
+    """
+
+    PERSONALITIES = (PERSONALITY_CONTROLLER, PERSONALITY_STORAGE,
+                     PERSONALITY_COMPUTE, PERSONALITY_UNKNOWN)
+
+    def __init__(self, hosts, phosts=None):
+        self.hosts = dict((p, []) for p in self.PERSONALITIES)
+        self.counts = dict((p, 0) for p in self.PERSONALITIES)
+        self.degraded = 0
+        self.failed = 0
+
+        phosts_by_name = dict((ph.hostname, ph) for ph in phosts or [])
+        for h in sorted(hosts, key=lambda f: f.hostname):
+            personality = self._get_personality(h)
+            if personality is None:
+                continue
+            ph = phosts_by_name.get(h.hostname)
+            if ph is not None:
+                self._set_patch_state(h, ph)
+            self.hosts[personality].append(h)
+            self.counts[personality] += 1
+            if personality == PERSONALITY_UNKNOWN:
+                continue
+            if h._availability == 'degraded':
+                self.degraded += 1
+            elif h._availability == 'failed':
+                self.failed += 1
+
+    @staticmethod
+    def _get_personality(host):
+        if not host._personality:
+            return PERSONALITY_UNKNOWN
+        personality = host._personality.lower()
+        if personality.startswith(PERSONALITY_CONTROLLER):
+            return PERSONALITY_CONTROLLER
+        if personality in (PERSONALITY_STORAGE, PERSONALITY_COMPUTE):
+            return personality
+        return None
+
+    @staticmethod
+    def _set_patch_state(host, phost):
+        if phost.interim_state is True:
+            host.patch_current = "Pending"
+        elif phost.patch_failed is True:
+            host.patch_current = "Failed"
+        else:
+            host.patch_current = phost.patch_current
+        host.requires_reboot = phost.requires_reboot
+        host._patch_state = phost.state
+        host.allow_insvc_patching = phost.allow_insvc_patching
+
+    def get_hosts(self, personality):
+        return self.hosts.get(personality, [])
+
+
 class DNS(base.APIResourceWrapper):
     """..."""
 
@@ -2374,24 +2532,8 @@ def event_log_list(request, search_opts=None):
             limit = page_size + 1
 
     query = None
-    alarms = False
-    logs = False
-    include_suppress = False
-
-    if "evtType" in search_opts:
-        evtType = search_opts.pop('evtType')
-        if evtType == FM_ALARM:
-            alarms = True
-        elif evtType == FM_LOG:
-            logs = True
-
-    if "suppression" in search_opts:
-        suppression = search_opts.pop('suppression')
-
-        if suppression == FM_SUPPRESS_SHOW:
-            include_suppress = True
-        elif suppression == FM_SUPPRESS_HIDE:
-            include_suppress = False
+    alarms, logs = _pop_event_log_types(search_opts)
+    include_suppress = _pop_include_suppress(search_opts)
 
     logs = cgtsclient(request)\
         .event_log.list(q=query,
@@ -2411,6 +2553,22 @@ def event_log_list(request, search_opts=None):
     return [EventLog(n) for n in logs], has_more_data
 
 
+def event_log_list_all(request, search_opts=None):
+    """Iterate over all the event logs, one page at a time.
+
+    The raw cgtsclient resources are returned for exports, so that they
+    are not all held in memory.
+    """
+    search_opts = dict(search_opts or {})
+    alarms, logs = _pop_event_log_types(search_opts)
+    include_suppress = _pop_include_suppress(search_opts)
+    return _list_all_pages(cgtsclient(request).event_log.list,
+                           q=None,
+                           alarms=alarms,
+                           logs=logs,
+                           include_suppress=include_suppress)
+
+
 def event_log_get(request, event_log_id):
     log = cgtsclient(request).event_log.get(event_log_id)
     if not log:
@@ -2442,8 +2600,10 @@ def event_suppression_update(request, event_suppression_uuid, **kwargs):
     patch = []
     for key, value in kwargs.iteritems():
         patch.append(dict(path='/' + key, value=value, op='replace'))
-    return cgtsclient(request)\
+    suppression = cgtsclient(request)\
         .event_suppression.update(event_suppression_uuid, patch)
+    base.shared_cache_invalidate(request, 'alarm_summary')
+    return suppression
 
 
 class Device(base.APIResourceWrapper):
@@ -2599,6 +2759,10 @@ def sdn_controller_delete(request, uuid):
 
 
 def get_sdn_enabled(request):
+    return get_system_context(request)['sdn_enabled']
+
+
+def _read_sdn_enabled():
     # The SDN enabled flag is present in the Capabilities
     # of the system table, however capabilties is not exposed
     # as an attribute through system_list() or system_get()
@@ -2636,15 +2800,193 @@ def get_sdn_l3_mode_enabled(request):
     return False
 
 
+def get_system_context(request):
+    """Return the type and mode of the system and whether SDN is enabled.
+
+    They are retrieved once per request, and shared between the requests
+    of the region for ``SYSINV_SYSTEM_CONTEXT_CACHE_TIMEOUT`` seconds.
+    """
+    context = getattr(request, '_sysinv_system_context', None)
+    if context is None:
+        def _get_system_context():
+            system = system_list(request)[0].to_dict()
+            return base.CachedResource(
+                system_type=system.get('system_type'),
+                system_mode=system.get('system_mode'),
+                sdn_enabled=_read_sdn_enabled())
+
+        context = base.shared_cache_get(request, 'system_context',
+                                        _get_system_context,
+                                        SYSTEM_CONTEXT_CACHE_TIMEOUT)
+        request._sysinv_system_context = context
+    return context
+
+
 def is_system_mode_simplex(request):
-    systems = system_list(request)
-    system_mode = systems[0].to_dict().get('system_mode')
+    system_mode = get_system_mode(request)
     if system_mode == constants.SYSTEM_MODE_SIMPLEX:
         return True
     return False
 
 
+def get_system_mode(request):
+    return get_system_context(request)['system_mode']
+
+
 def get_system_type(request):
-    systems = system_list(request)
-    system_type = systems[0].to_dict().get('system_type')
-    return system_type
+    return get_system_context(request)['system_type']
+
+
+def _host_lvg_list_with_params(request, host_id):
+    return host_lvg_list(request, host_id, get_params=True)
+
+
+# Per-host inventory collections, keyed by the host attribute they are
+# stored in by the host detail view.
+HOST_DETAIL_COLLECTIONS = collections.OrderedDict([
+    ('nodes', host_node_list),
+    ('cpus', host_cpu_list),
+    ('memorys', host_memory_list),
+    ('ports', host_port_list),
+    ('interfaces', host_interface_list),
+    ('devices', host_device_list),
+    ('disks', host_disk_list),
+    ('stors', host_stor_list),
+    ('pvs', host_pv_list),
+    ('partitions', host_disk_partition_list),
+    ('lldpneighbours', host_lldpneighbour_list),
+    ('lvgs', _host_lvg_list_with_params),
+    ('sensors', host_sensor_list),
+    ('sensorgroups', host_sensorgroup_list),
+])
+
+
+def hosts_detail_list(request, host_uuids, collections=None):
+    """Retrieve the inventory collections of several hosts concurrently.
+
+    Every (host, collection) pair is fetched on a single bounded worker
+    pool, sized by the ``HOST_DETAIL_MAX_WORKERS`` setting.  A failure to
+    retrieve one collection does not prevent the others from being
+    returned.
+
+    :param host_uuids: UUIDs of the hosts to retrieve collections for.
+    :param collections: names of the ``HOST_DETAIL_COLLECTIONS`` to
+        retrieve; all of them are retrieved when omitted.
+    :returns: a ``(results, errors)`` tuple of dicts keyed by host UUID.
+        ``results`` maps each retrieved collection name to its list of
+        resources and ``errors`` maps each failed collection name to the
+        exception raised.
+    """
+    if collections is None:
+        collections = list(HOST_DETAIL_COLLECTIONS)
+    unknown = set(collections) - set(HOST_DETAIL_COLLECTIONS)
+    if unknown:
+        raise ValueError('Unknown host collections: %s' %
+                         ', '.join(sorted(unknown)))
+
+    results = dict((uuid, {}) for uuid in host_uuids)
+    errors = dict((uuid, {}) for uuid in host_uuids)
+
+    def _task_get_collection(host_uuid, name):
+        try:
+            results[host_uuid][name] = \
+                HOST_DETAIL_COLLECTIONS[name](request, host_uuid)
+        except Exception as e:
+            LOG.warning('Unable to retrieve %(name)s of host %(host)s: '
+                        '%(error)s',
+                        {'name': name, 'host': host_uuid, 'error': e})
+            errors[host_uuid][name] = e
+
+    tasks = [(uuid, name) for uuid in results for name in collections]
+    if tasks:
+        max_workers = getattr(settings, 'HOST_DETAIL_MAX_WORKERS',
+                              HOST_DETAIL_MAX_WORKERS)
+        max_workers = max(1, min(max_workers, len(tasks)))
+        with futurist.ThreadPoolExecutor(max_workers=max_workers) as e:
+            for host_uuid, name in tasks:
+                e.submit(_task_get_collection, host_uuid, name)
+
+    return results, errors
+
+
+def host_detail_list(request, host_uuid, collections=None):
+    """Retrieve the inventory collections of a host concurrently.
+
+    :param collections: names of the ``HOST_DETAIL_COLLECTIONS`` to
+        retrieve; all of them are retrieved when omitted.
+    :returns: a ``(results, errors)`` tuple where ``results`` maps each
+        retrieved collection name to its list of resources and ``errors``
+        maps each failed collection name to the exception raised.
+    """
+    results, errors = hosts_detail_list(request, [host_uuid], collections)
+    return results[host_uuid], errors[host_uuid]
+
+
+class HostDetailIndex(object):
+    """Lookups between the inventory collections of a host.
+
+    The collections retrieved by ``host_detail_list`` refer to each other
+    by uuid or name; they are indexed once so that the host detail tabs do
+    not scan them for every resource they display.
+    """
+
+    def __init__(self, host):
+        self.ports_by_interface = collections.defaultdict(list)
+        for p in getattr(host, 'ports', []):
+            self.ports_by_interface[p.interface_uuid].append(p)
+
+        self.interfaces_by_name = dict(
+            (i.ifname, i) for i in getattr(host, 'interfaces', []))
+
+        self.neighbours_by_port = collections.defaultdict(list)
+        for n in getattr(host, 'lldpneighbours', []):
+            self.neighbours_by_port[n.port_uuid].append(n)
+
+        self.sensors_by_group = collections.defaultdict(list)
+        for s in getattr(host, 'sensors', []):
+            self.sensors_by_group[s.sensorgroup_uuid].append(s)
+
+        self.sensorgroups_by_uuid = dict(
+            (g.uuid, g) for g in getattr(host, 'sensorgroups', []))
+
+    def get_interface_ports(self, interface_uuid):
+        return self.ports_by_interface.get(interface_uuid, [])
+
+    def get_port_neighbours(self, port_uuid):
+        return self.neighbours_by_port.get(port_uuid, [])
+
+    def get_group_sensors(self, sensorgroup_uuid):
+        return self.sensors_by_group.get(sensorgroup_uuid, [])
+
+    def get_sensorgroup(self, sensorgroup_uuid):
+        return self.sensorgroups_by_uuid.get(sensorgroup_uuid)
+
+    def get_used_interfaces(self, interface):
+        return [self.interfaces_by_name[str(u)] for u in interface.uses
+                if str(u) in self.interfaces_by_name]
+
+    def get_interface_dpdksupport(self, interface):
+        """Return the DPDK support of the ports underlying an interface.
+
+        VLAN interfaces get it from the ethernet interface they use, or from
+        the members of the aggregated interface they use. None is returned
+        when no underlying port is found.
+        """
+        dpdksupport = None
+        if interface.iftype == 'ethernet':
+            dpdksupport = [p.dpdksupport for p in
+                           self.get_interface_ports(interface.uuid)]
+        elif interface.iftype == 'vlan':
+            for used in self.get_used_interfaces(interface):
+                if used.iftype == 'ethernet':
+                    dpdksupport = [p.dpdksupport for p in
+                                   self.get_interface_ports(used.uuid)]
+                elif used.iftype == 'ae':
+                    for member in self.get_used_interfaces(used):
+                        dpdksupport = [p.dpdksupport for p in
+                                       self.get_interface_ports(member.uuid)]
+        elif interface.iftype == 'ae':
+            for used in self.get_used_interfaces(interface):
+                dpdksupport = [p.dpdksupport for p in
+                               self.get_interface_ports(used.uuid)]
+        return dpdksupport
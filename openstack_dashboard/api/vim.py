@@ -4,6 +4,7 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
+import copy
 import logging
 import urlparse
 
@@ -55,8 +56,25 @@ def _sw_update_client(request):
     return Client(url, token_id=request.user.token.id)
 
 
+def _get_strategy(request, strategy_name):
+    # The software management panel looks the strategies up several times
+    # per page; each one is retrieved once per request, and copied since
+    # get_stages() modifies it
+    strategies = getattr(request, '_vim_strategies', None)
+    if strategies is None:
+        strategies = request._vim_strategies = {}
+    if strategy_name not in strategies:
+        strategies[strategy_name] = \
+            _sw_update_client(request).get_strategy(strategy_name)
+    return copy.deepcopy(strategies[strategy_name])
+
+
+def _forget_strategy(request, strategy_name):
+    getattr(request, '_vim_strategies', {}).pop(strategy_name, None)
+
+
 def get_strategy(request, strategy_name):
-    strategy = _sw_update_client(request).get_strategy(strategy_name)
+    strategy = _get_strategy(request, strategy_name)
     return strategy
 
 
@@ -68,28 +86,32 @@ def create_strategy(
         strategy_name, controller_apply_type, storage_apply_type,
         swift_apply_type, compute_apply_type, max_parallel_compute_hosts,
         default_instance_action, alarm_restrictions)
+    _forget_strategy(request, strategy_name)
     return strategy
 
 
 def delete_strategy(request, strategy_name, force=False):
     response = _sw_update_client(request).delete_strategy(strategy_name, force)
+    _forget_strategy(request, strategy_name)
     return response
 
 
 def apply_strategy(request, strategy_name, stage_id=None):
     response = _sw_update_client(request).apply_strategy(strategy_name,
                                                          stage_id)
+    _forget_strategy(request, strategy_name)
     return response
 
 
 def abort_strategy(request, strategy_name, stage_id=None):
     response = _sw_update_client(request).abort_strategy(strategy_name,
                                                          stage_id)
+    _forget_strategy(request, strategy_name)
     return response
 
 
 def get_stages(request, strategy_name):
-    strategy = _sw_update_client(request).get_strategy(strategy_name)
+    strategy = _get_strategy(request, strategy_name)
     if not strategy:
         return []
     stages = []
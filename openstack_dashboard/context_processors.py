@@ -127,6 +127,11 @@ def openstack(request):
 
     context['JS_CATALOG'] = get_js_catalog(conf)
 
+    # The pages refreshed on the changes pushed by the server only
+    # subscribe to them when the push channel is enabled
+    context['push_channel_enabled'] = getattr(settings,
+                                              'PUSH_CHANNEL_ENABLED', False)
+
     if (request.user.is_authenticated() and request.user.is_superuser and
             api.base.is_TiS_region(request)):
 
@@ -51,6 +51,13 @@ class AlarmsLimitAction(tables.LimitAction):
     verbose_name = _("Alarms")
 
 
+class ExportAlarms(tables.LinkAction):
+    name = "export"
+    verbose_name = _("Export CSV")
+    url = "horizon:admin:fault_management:export_alarms"
+    icon = "download"
+
+
 class AlarmFilterAction(tables.FixedWithQueryFilter):
     def __init__(self, **kwargs):
         super(AlarmFilterAction, self).__init__(**kwargs)
@@ -97,7 +104,8 @@ class AlarmsTable(tables.DataTable):
         limit_param = "alarm_limit"
         pagination_param = "alarm_marker"
         prev_pagination_param = 'prev_alarm_marker'
-        table_actions = (AlarmFilterAction, AlarmsLimitAction)
+        table_actions = (AlarmFilterAction, AlarmsLimitAction,
+                         ExportAlarms)
         multi_select = False
         hidden_title = False
 
@@ -106,6 +114,13 @@ class EventLogsLimitAction(tables.LimitAction):
     verbose_name = _("Events")
 
 
+class ExportEventLogs(tables.LinkAction):
+    name = "export"
+    verbose_name = _("Export CSV")
+    url = "horizon:admin:fault_management:export_eventlogs"
+    icon = "download"
+
+
 class EventLogsFilterAction(tables.FixedWithQueryFilter):
     def __init__(self, **kwargs):
         super(EventLogsFilterAction, self).__init__(**kwargs)
@@ -156,7 +171,8 @@ class EventLogsTable(tables.DataTable):
         verbose_name = _("Events")
         status_columns = ["suppression_status"]
         table_actions = (EventLogsFilterAction,
-                         EventLogsLimitAction,)
+                         EventLogsLimitAction,
+                         ExportEventLogs)
         limit_param = "event_limit"
         pagination_param = "event_marker"
         prev_pagination_param = 'prev_event_marker'
@@ -31,5 +31,9 @@ urlpatterns = [
     url(r'^(?P<id>[^/]+)/eventlogdetail/$',
         views.EventLogDetailView.as_view(), name='eventlogdetail'),
     url(r'^banner/$', views.BannerView.as_view(),
-        name='banner')
+        name='banner'),
+    url(r'^export/alarms/$', views.AlarmsExportView.as_view(),
+        name='export_alarms'),
+    url(r'^export/eventlogs/$', views.EventLogsExportView.as_view(),
+        name='export_eventlogs'),
 ]
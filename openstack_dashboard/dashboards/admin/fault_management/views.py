@@ -20,16 +20,25 @@
 #
 
 
+import hashlib
+import json
 import logging
 
 from django.core.urlresolvers import reverse
+from django import http
+from django.utils.cache import patch_cache_control
+from django.utils import translation
 from django.utils.translation import ugettext_lazy as _  # noqa
+from django.views import generic
 from django.views.generic import TemplateView
 
 from horizon import exceptions
 from horizon import tabs
+from horizon.utils import csvbase
 from horizon import views
 from openstack_dashboard import api
+from openstack_dashboard.dashboards.admin.fault_management import \
+    tables as project_tables
 from openstack_dashboard.dashboards.admin.fault_management import \
     tabs as project_tabs
 
@@ -131,6 +140,33 @@ class EventLogDetailView(views.HorizonTemplateView):
 class BannerView(TemplateView):
     template_name = 'header/_alarm_banner.html'
 
+    # context items the rendered banner depends on
+    etag_context_keys = ('alarmbanner', 'dc_admin', 'OK', 'degraded',
+                         'critical', 'disabled')
+
+    def get(self, request, *args, **kwargs):
+        # The banner is polled by every open browser; when it has not
+        # changed since the last poll, it is not rendered again.
+        context = self.get_context_data(**kwargs)
+        etag = self.get_etag(context)
+        if request.META.get('HTTP_IF_NONE_MATCH') == etag:
+            response = http.HttpResponseNotModified()
+        else:
+            response = self.render_to_response(context)
+        response['ETag'] = etag
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+    def get_etag(self, context):
+        state = dict((key, context[key]) for key in self.etag_context_keys
+                     if key in context)
+        if context.get('summary'):
+            state['summary'] = context['summary'].to_dict()
+        state['language'] = translation.get_language()
+        digest = hashlib.sha1(
+            json.dumps(state, sort_keys=True).encode('utf-8')).hexdigest()
+        return '"%s"' % digest
+
     def get_context_data(self, **kwargs):
         context = super(TemplateView, self).get_context_data(**kwargs)
 
@@ -162,11 +198,111 @@ class BannerView(TemplateView):
     def get_data(self):
         summary = None
         try:
-            summary = api.sysinv.alarm_summary_get(self.request)
+            summary = api.sysinv.alarm_summary_get_cached(self.request)
         except Exception:
             exceptions.handle(self.request,
                               _('Unable to retrieve alarm summary.'))
         return summary
 
     def get_subcloud_data(self):
-        return api.dc_manager.alarm_summary_list(self.request)
+        return api.dc_manager.alarm_summary_list_cached(self.request)
+
+
+class AlarmsCsvRenderer(csvbase.BaseCsvStreamingResponse):
+
+    columns = [_("Alarm ID"), _("Reason Text"), _("Entity Instance ID"),
+               _("Suppression Status"), _("Severity"), _("Timestamp")]
+
+    def get_row_data(self):
+        for alarm in self.context['alarms']:
+            yield (alarm.alarm_id,
+                   alarm.reason_text,
+                   alarm.entity_instance_id,
+                   alarm.suppression_status,
+                   alarm.severity,
+                   alarm.timestamp)
+
+
+class EventLogsCsvRenderer(csvbase.BaseCsvStreamingResponse):
+
+    columns = [_("Timestamp"), _("State"), _("ID"), _("Reason Text"),
+               _("Entity Instance ID"), _("Suppression Status"),
+               _("Severity")]
+
+    def get_row_data(self):
+        for log in self.context['event_logs']:
+            yield (log.timestamp,
+                   log.state,
+                   log.event_log_id,
+                   log.reason_text,
+                   log.entity_instance_id,
+                   log.suppression_status,
+                   log.severity)
+
+
+class ExportView(generic.View):
+    """Streams all the entries of a fault management table as CSV.
+
+    The entries are retrieved from sysinv one page at a time while the
+    response is written, using the filters currently selected on the table.
+    """
+    table_class = None
+    csv_response_class = None
+    context_object_name = None
+    filename = None
+
+    def get_filters(self, filter_action):
+        return {}
+
+    def get_data(self, search_opts):
+        return []
+
+    def get(self, request, *args, **kwargs):
+        table = self.table_class(request)
+        filter_action = table._meta._filter_action
+        filter_action.updateFromRequestDataToSession(request)
+        search_opts = {}
+        if filter_action.get_filter_field(request):
+            search_opts = self.get_filters(filter_action)
+        try:
+            data = self.get_data(search_opts)
+        except Exception:
+            exceptions.handle(request,
+                              _('Unable to export %s.') %
+                              table._meta.verbose_name,
+                              redirect=reverse(
+                                  'horizon:admin:fault_management:index'))
+        context = {self.context_object_name: data}
+        return self.csv_response_class(request, None, context, 'text/csv',
+                                       filename=self.filename)
+
+
+class AlarmsExportView(ExportView):
+    table_class = project_tables.AlarmsTable
+    csv_response_class = AlarmsCsvRenderer
+    context_object_name = 'alarms'
+    filename = 'alarms.csv'
+
+    def get_filters(self, filter_action):
+        return {'suppression': filter_action.get_filter_field_for_group(0)}
+
+    def get_data(self, search_opts):
+        search_opts.update({'sort_key': 'severity,entity_instance_id',
+                            'sort_dir': 'asc'})
+        return api.sysinv.alarm_list_all(self.request,
+                                         search_opts=search_opts)
+
+
+class EventLogsExportView(ExportView):
+    table_class = project_tables.EventLogsTable
+    csv_response_class = EventLogsCsvRenderer
+    context_object_name = 'event_logs'
+    filename = 'event_logs.csv'
+
+    def get_filters(self, filter_action):
+        return {'evtType': filter_action.get_filter_field_for_group(0),
+                'suppression': filter_action.get_filter_field_for_group(1)}
+
+    def get_data(self, search_opts):
+        return api.sysinv.event_log_list_all(self.request,
+                                             search_opts=search_opts)
@@ -5,6 +5,7 @@
 #
 
 
+import collections
 import json
 import logging
 
@@ -12,7 +13,9 @@ from django.conf import settings
 from django.core.urlresolvers import reverse
 from django.core.urlresolvers import reverse_lazy
 from django.http import HttpResponse  # noqa
+from django.utils.decorators import method_decorator
 from django.utils.translation import ugettext_lazy as _
+from django.views.decorators.gzip import gzip_page
 from django.views.generic import View  # noqa
 
 from horizon import exceptions
@@ -29,6 +32,12 @@ from openstack_dashboard.usage import quotas
 
 LOG = logging.getLogger(__name__)
 
+# Per-host inventory collections rendered by the topology canvas
+TOPOLOGY_HOST_COLLECTIONS = ('ports', 'interfaces', 'lldpneighbours')
+
+# Default number of seconds a topology snapshot is shared between requests
+HOST_TOPOLOGY_CACHE_TIMEOUT = 5
+
 
 class HostDetailView(i_views.DetailView):
     tab_group_class = topology_tabs.HostDetailTabs
@@ -148,6 +157,8 @@ class HostTopologyView(views.HorizonTemplateView):
 
 
 class JSONView(View):
+    # Set when a part of the topology could not be retrieved
+    _partial = False
 
     @property
     def is_router_enabled(self):
@@ -174,6 +185,7 @@ class JSONView(View):
         try:
             alarms = api.sysinv.alarm_list(request)
         except Exception as ex:
+            self._partial = True
             exceptions.handle(ex)
 
         data = [a.to_dict() for a in alarms]
@@ -184,34 +196,31 @@ class JSONView(View):
         try:
             hosts = api.sysinv.host_list(request)
         except Exception as ex:
+            self._partial = True
             exceptions.handle(ex)
 
+        # Retrieve the per-host collections of every host concurrently,
+        # collections which could not be retrieved are rendered empty
+        results, errors = api.sysinv.hosts_detail_list(
+            request, [host.uuid for host in hosts],
+            TOPOLOGY_HOST_COLLECTIONS)
+        if any(errors.values()):
+            self._partial = True
+
         data = []
         for host in hosts:
             host_data = host.to_dict()
-            try:
-                host_data['ports'] = [
-                    p.to_dict() for p in
-                    api.sysinv.host_port_list(request, host.uuid)]
-
-                host_data['interfaces'] = [
-                    i.to_dict() for i in
-                    api.sysinv.host_interface_list(request, host.uuid)]
-
-                host_data['lldpneighbours'] = [
-                    n.to_dict() for n in
-                    api.sysinv.host_lldpneighbour_list(request, host.uuid)]
-
-                # Set the value for neighbours field for each port in the host.
-                # This will be referenced in Interfaces table
-                for p in host_data['ports']:
-                    p['neighbours'] = \
-                        [n['port_identifier'] for n in
-                         host_data['lldpneighbours']
-                         if n['port_uuid'] == p['uuid']]
-
-            except Exception as ex:
-                exceptions.handle(ex)
+            for name in TOPOLOGY_HOST_COLLECTIONS:
+                host_data[name] = [
+                    r.to_dict() for r in results[host.uuid].get(name, [])]
+
+            # Set the value for neighbours field for each port in the host.
+            # This will be referenced in Interfaces table
+            neighbours = collections.defaultdict(list)
+            for n in host_data['lldpneighbours']:
+                neighbours[n['port_uuid']].append(n['port_identifier'])
+            for p in host_data['ports']:
+                p['neighbours'] = neighbours.get(p['uuid'], [])
 
             data.append(host_data)
         return data
@@ -221,13 +230,30 @@ class JSONView(View):
         try:
             pnets = api.neutron.provider_network_list(request)
         except Exception as ex:
+            self._partial = True
             exceptions.handle(ex)
         data = [p.to_dict() for p in pnets]
         return data
 
+    def _get_snapshot(self, request):
+        # The topology snapshot is shared by every browser watching the
+        # topology of a region for HOST_TOPOLOGY_CACHE_TIMEOUT seconds,
+        # unless a part of it could not be retrieved.
+        timeout = getattr(settings, 'HOST_TOPOLOGY_CACHE_TIMEOUT',
+                          HOST_TOPOLOGY_CACHE_TIMEOUT)
+
+        def _get_topology():
+            self._partial = False
+            data = {'hosts': self._get_hosts(request),
+                    'networks': self._get_pnets(request),
+                    'alarms': self._get_alarms(request), }
+            return json.dumps(data, ensure_ascii=False)
+
+        return api.base.shared_cache_get(
+            request, 'host_topology', _get_topology, timeout,
+            cacheable=lambda json_string: not self._partial)
+
+    @method_decorator(gzip_page)
     def get(self, request, *args, **kwargs):
-        data = {'hosts': self._get_hosts(request),
-                'networks': self._get_pnets(request),
-                'alarms': self._get_alarms(request), }
-        json_string = json.dumps(data, ensure_ascii=False)
+        json_string = self._get_snapshot(request)
         return HttpResponse(json_string, content_type='text/json')
@@ -99,18 +99,34 @@ class LiveMigrateInstance(policy.PolicyTargetMixin,
 
 
 class AdminUpdateRow(project_tables.UpdateRow):
+    all_tenants = True
+
     def get_data(self, request, instance_id):
         instance = super(AdminUpdateRow, self).get_data(request, instance_id)
-        try:
-            tenant = api.keystone.tenant_get(request,
-                                             instance.tenant_id,
-                                             admin=True)
-            instance.tenant_name = getattr(tenant, "name", instance.tenant_id)
-        except keystone_exceptions.NotFound:
-            instance.tenant_name = None
-
+        self._set_tenant_names(request, [instance])
         return instance
 
+    def get_batch_data(self, request, obj_ids):
+        data = super(AdminUpdateRow, self).get_batch_data(request, obj_ids)
+        self._set_tenant_names(request, list(data.values()))
+        return data
+
+    def _set_tenant_names(self, request, instances):
+        # Each project is retrieved once however many of its instances are
+        # updated
+        tenant_names = {}
+        for instance in instances:
+            if instance.tenant_id not in tenant_names:
+                try:
+                    tenant = api.keystone.tenant_get(request,
+                                                     instance.tenant_id,
+                                                     admin=True)
+                    tenant_names[instance.tenant_id] = getattr(
+                        tenant, "name", instance.tenant_id)
+                except keystone_exceptions.NotFound:
+                    tenant_names[instance.tenant_id] = None
+            instance.tenant_name = tenant_names[instance.tenant_id]
+
 
 class AdminInstanceFilterAction(tables.FilterAction):
     # Change default name of 'filter' to distinguish this one from the
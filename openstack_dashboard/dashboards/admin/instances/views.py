@@ -127,7 +127,7 @@ class AdminIndexView(tables.DataTableView):
         def _task_get_tenants():
             # Gather our tenants to correlate against IDs
             try:
-                tmp_tenants, __ = api.keystone.tenant_list(self.request)
+                tmp_tenants = api.keystone.tenant_list_cached(self.request)
                 tenants.extend(tmp_tenants)
                 tenant_dict.update([(t.id, t) for t in tenants])
             except Exception:
@@ -137,7 +137,7 @@ class AdminIndexView(tables.DataTableView):
         def _task_get_images():
             # Gather our images to correlate againts IDs
             try:
-                tmp_images = api.glance.image_list_detailed(self.request)[0]
+                tmp_images = api.glance.image_list_cached(self.request)
                 images.extend(tmp_images)
             except Exception:
                 msg = _("Unable to retrieve image list.")
@@ -146,7 +146,7 @@ class AdminIndexView(tables.DataTableView):
         def _task_get_flavors():
             # Gather our flavors to correlate against IDs
             try:
-                tmp_flavors = api.nova.flavor_list(self.request)
+                tmp_flavors = api.nova.flavor_list_cached(self.request)
                 flavors.extend(tmp_flavors)
                 full_flavors.update([(str(flavor.id), flavor)
                                      for flavor in flavors])
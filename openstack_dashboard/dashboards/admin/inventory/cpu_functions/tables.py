@@ -44,7 +44,7 @@ class CreateCpuProfile(tables.LinkAction):
         host_id = self.table.kwargs['host_id']
         return reverse(self.url, args=(host_id,))
 
-    def allowed(self, request, cpufunction=None):
+    def allowed_for_request(self, request):
         return not api.sysinv.is_system_mode_simplex(request)
 
 
@@ -65,7 +65,7 @@ class CreateInterfaceProfile(tables.LinkAction):
         host_id = self.table.kwargs['host_id']
         return reverse(self.url, args=(host_id,))
 
-    def allowed(self, request, datum):
+    def allowed_for_request(self, request):
         return not api.sysinv.is_system_mode_simplex(request)
 
 
@@ -43,12 +43,14 @@ class CreateMemoryProfile(tables.LinkAction):
         host_id = self.table.kwargs['host_id']
         return reverse(self.url, args=(host_id,))
 
+    def allowed_for_request(self, request):
+        return not api.sysinv.is_system_mode_simplex(request)
+
     def allowed(self, request, datum):
         host = self.table.kwargs['host']
         if host.subfunctions and 'compute' not in host.subfunctions:
             return False
-        return (host.invprovision == 'provisioned' and
-                not api.sysinv.is_system_mode_simplex(request))
+        return host.invprovision == 'provisioned'
 
 
 def get_processor_memory(memory):
@@ -118,7 +118,7 @@ class AddHost(tables.LinkAction):
     icon = "plus"
     ajax = True
 
-    def allowed(self, request, host=None):
+    def allowed_for_request(self, request):
         return not api.sysinv.is_system_mode_simplex(request)
 
 
@@ -349,9 +349,11 @@ class PowerOnHost(tables.BatchAction):
             count
         )
 
+    def allowed_for_request(self, request):
+        return not api.sysinv.is_system_mode_simplex(request)
+
     def allowed(self, request, host=None):
-        return (host_board_management(host) and host_locked(host) and
-                not api.sysinv.is_system_mode_simplex(request))
+        return host_board_management(host) and host_locked(host)
 
     def action(self, request, host_id):
         api.sysinv.host_power_on(request, host_id)
@@ -380,10 +382,12 @@ class PowerOffHost(tables.BatchAction):
             count
         )
 
+    def allowed_for_request(self, request):
+        return not api.sysinv.is_system_mode_simplex(request)
+
     def allowed(self, request, host=None):
         return (host_board_management(host) and host_locked(host) and
-                not host_powered_off(host) and
-                not api.sysinv.is_system_mode_simplex(request))
+                not host_powered_off(host))
 
     def action(self, request, host_id):
         api.sysinv.host_power_off(request, host_id)
@@ -412,9 +416,11 @@ class ResetHost(tables.BatchAction):
             count
         )
 
+    def allowed_for_request(self, request):
+        return not api.sysinv.is_system_mode_simplex(request)
+
     def allowed(self, request, host=None):
-        return (host_board_management(host) and host_locked(host) and
-                not api.sysinv.is_system_mode_simplex(request))
+        return host_board_management(host) and host_locked(host)
 
     def action(self, request, host_id):
         api.sysinv.host_reset(request, host_id)
@@ -503,9 +509,11 @@ class SwactHost(tables.BatchAction):
             count
         )
 
+    def allowed_for_request(self, request):
+        return not api.sysinv.is_system_mode_simplex(request)
+
     def allowed(self, request, host=None):
-        return (host_controller(host) and not host_locked(host) and
-                not api.sysinv.is_system_mode_simplex(request))
+        return host_controller(host) and not host_locked(host)
 
     def action(self, request, host_id):
         api.sysinv.host_swact(request, host_id)
@@ -563,8 +571,20 @@ class UpdateRow(tables.Row):
 
     def get_data(self, request, host_id):
         host = api.sysinv.host_get(request, host_id)
-
         phost = api.patch.get_host(request, host.hostname)
+        return self._load_patch_state(host, phost)
+
+    def get_batch_data(self, request, obj_ids):
+        # The rows are keyed by the ID of the hosts, see Hosts.get_object_id
+        data = {}
+        for host in api.sysinv.host_list(request):
+            if unicode(host.id) in obj_ids:
+                data[unicode(host.id)] = self._load_patch_state(
+                    host, api.patch.get_host(request, host.hostname))
+        return data
+
+    @staticmethod
+    def _load_patch_state(host, phost):
         if phost is not None:
             if phost.interim_state is True:
                 host.patch_current = "Pending"
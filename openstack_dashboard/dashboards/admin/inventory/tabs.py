@@ -50,9 +50,11 @@ class HostsTab(tabs.TableTab):
     # patching service, are in class scope.
     all_hosts = []
     all_phosts = []
+    host_status = None
 
     def get_all_hosts_data(self):
         request = self.request
+        self.host_status = None
         self.all_hosts = []
         try:
             self.all_hosts = api.sysinv.host_list(request)
@@ -68,36 +70,10 @@ class HostsTab(tabs.TableTab):
                                 ' patching service.'))
 
     def get_hosts_data(self, personality):
-        hosts = self.all_hosts
-        phosts = self.all_phosts
-
-        if personality == api.sysinv.PERSONALITY_CONTROLLER:
-            hosts = [h for h in hosts if h._personality and
-                     h._personality.lower().startswith(
-                         api.sysinv.PERSONALITY_CONTROLLER)]
-        elif personality == api.sysinv.PERSONALITY_UNKNOWN:
-            hosts = [h for h in hosts if not h._personality]
-        else:
-            hosts = [h for h in hosts if h._personality and
-                     h._personality.lower() == personality]
-
-        # Add patching status data to hosts
-        for h in hosts:
-            for ph in phosts:
-                if h.hostname == ph.hostname:
-                    if ph.interim_state is True:
-                        h.patch_current = "Pending"
-                    elif ph.patch_failed is True:
-                        h.patch_current = "Failed"
-                    else:
-                        h.patch_current = ph.patch_current
-                    h.requires_reboot = ph.requires_reboot
-                    h._patch_state = ph.state
-                    h.allow_insvc_patching = ph.allow_insvc_patching
-
-        # Sort hosts by hostname
-        hosts.sort(key=lambda f: (f.hostname))
-        return hosts
+        if self.host_status is None:
+            self.host_status = api.sysinv.HostStatusModel(self.all_hosts,
+                                                          self.all_phosts)
+        return self.host_status.get_hosts(personality)
 
     def get_hostscontroller_data(self):
         controllers = self.get_hosts_data(api.sysinv.PERSONALITY_CONTROLLER)
@@ -140,34 +116,15 @@ class HostsTab(tabs.TableTab):
         context['computes'] = computes
         context['unprovisioned'] = unprovisioned
 
-        totals = []
-        ctrl_cnt = 0
-        comp_cnt = 0
-        stor_cnt = 0
-        degr_cnt = 0
-        fail_cnt = 0
-
-        for h in controllers:
-            ctrl_cnt += 1
-            if h._availability == 'degraded':
-                degr_cnt += 1
-            elif h._availability == 'failed':
-                fail_cnt += 1
-
-        for h in storages:
-            stor_cnt += 1
-            if h._availability == 'degraded':
-                degr_cnt += 1
-            elif h._availability == 'failed':
-                fail_cnt += 1
-
-        for h in computes:
-            comp_cnt += 1
-            if h._availability == 'degraded':
-                degr_cnt += 1
-            elif h._availability == 'failed':
-                fail_cnt += 1
+        # the counts were taken while partitioning the hosts
+        host_status = self.host_status
+        ctrl_cnt = host_status.counts[api.sysinv.PERSONALITY_CONTROLLER]
+        stor_cnt = host_status.counts[api.sysinv.PERSONALITY_STORAGE]
+        comp_cnt = host_status.counts[api.sysinv.PERSONALITY_COMPUTE]
+        degr_cnt = host_status.degraded
+        fail_cnt = host_status.failed
 
+        totals = []
         if (ctrl_cnt > 0):
             badge = "badge-success"
             totals.append(
@@ -356,6 +313,7 @@ class OverviewTab(tabs.TableTab):
     name = _("Overview")
     slug = "overview"
     template_name = ("admin/inventory/_detail_overview.html")
+    host_collections = ('nodes', 'cpus', 'ports', 'interfaces')
 
     def get_cpufunctions_data(self):
         host = self.tab_group.kwargs['host']
@@ -369,42 +327,19 @@ class OverviewTab(tabs.TableTab):
     def get_interfaces_data(self):
         host = self.tab_group.kwargs['host']
 
+        index = host.detail_index
+
         # add 'ports' member to interface class for easier mgmt in table
         if host.interfaces:
             for i in host.interfaces:
                 if i.iftype == 'ethernet':
-                    i.ports = [p.uuid for p in host.ports if
-                               i.uuid == p.interface_uuid]
-                    i.portNameList = [p.get_port_display_name() for p in
-                                      host.ports if
-                                      i.uuid == p.interface_uuid]
-                    i.dpdksupport = [p.dpdksupport for p in host.ports if
-                                     i.uuid == p.interface_uuid]
-                elif i.iftype == 'vlan':
-                    for u in i.uses:
-                        for j in host.interfaces:
-                            if j.ifname == str(u):
-                                if j.iftype == 'ethernet':
-                                    i.dpdksupport = [p.dpdksupport for p in
-                                                     host.ports if
-                                                     j.uuid ==
-                                                     p.interface_uuid]
-                                elif j.iftype == 'ae':
-                                    for ae_u in j.uses:
-                                        for k in host.interfaces:
-                                            if k.ifname == str(ae_u):
-                                                i.dpdksupport = [
-                                                    p.dpdksupport for p in
-                                                    host.ports if
-                                                    k.uuid ==
-                                                    p.interface_uuid]
-                elif i.iftype == 'ae':
-                    for u in i.uses:
-                        for j in host.interfaces:
-                            if j.ifname == str(u):
-                                i.dpdksupport = [p.dpdksupport for p in
-                                                 host.ports if
-                                                 j.uuid == p.interface_uuid]
+                    ports = index.get_interface_ports(i.uuid)
+                    i.ports = [p.uuid for p in ports]
+                    i.portNameList = [p.get_port_display_name()
+                                      for p in ports]
+                dpdksupport = index.get_interface_dpdksupport(i)
+                if dpdksupport is not None:
+                    i.dpdksupport = dpdksupport
 
         host.interfaces.sort(key=lambda f: (f.ifname))
         return host.interfaces
@@ -426,6 +361,8 @@ class CpuFunctionsTab(tabs.TableTab):
     name = _("Processor")
     slug = "cpufunctions"
     template_name = ("admin/inventory/_detail_cpufunctions.html")
+    host_collections = ('nodes', 'cpus')
+    preload = False
 
     def get_cpufunctions_data(self):
         host = self.tab_group.kwargs['host']
@@ -448,6 +385,8 @@ class MemorysTab(tabs.TableTab):
     name = _("Memory")
     slug = "memorys"
     template_name = ("admin/inventory/_detail_memorys.html")
+    host_collections = ('nodes', 'memorys')
+    preload = False
 
     def get_memorys_data(self):
         host = self.tab_group.kwargs['host']
@@ -464,6 +403,8 @@ class StorageTab(tabs.TableTab):
     name = _("Storage")
     slug = "storages"
     template_name = ("admin/inventory/_detail_storages.html")
+    host_collections = ('disks', 'stors', 'pvs', 'lvgs', 'partitions')
+    preload = False
 
     def get_disks_data(self):
         host = self.tab_group.kwargs['host']
@@ -505,6 +446,8 @@ class PortsTab(tabs.TableTab):
     name = _("Ports")
     slug = "ports"
     template_name = ("admin/inventory/_detail_ports.html")
+    host_collections = ('ports', 'lldpneighbours')
+    preload = False
 
     def get_ports_data(self):
         host = self.tab_group.kwargs['host']
@@ -517,57 +460,27 @@ class InterfacesTab(tabs.TableTab):
     name = _("Interfaces")
     slug = "interfaces"
     template_name = ("admin/inventory/_detail_interfaces.html")
+    host_collections = ('ports', 'interfaces', 'lldpneighbours')
+    preload = False
 
     def get_interfaces_data(self):
         host = self.tab_group.kwargs['host']
 
+        index = host.detail_index
+
         # add 'ports' member to interface class for easier mgmt in table
         if host.interfaces:
             for i in host.interfaces:
                 i.host_id = host.id
 
-                port_data = \
-                    map(list, zip(*[(p.get_port_display_name(),
-                                     p.neighbours) for p in host.ports if
-                        i.uuid == p.interface_uuid]))
+                # Only default interfaces have port data
+                ports = index.get_interface_ports(i.uuid)
+                i.portNameList = [p.get_port_display_name() for p in ports]
+                i.portNeighbourList = [p.neighbours for p in ports]
 
-                if port_data:
-                    # Default interface
-                    i.portNameList = port_data[0]
-                    i.portNeighbourList = port_data[1]
-                else:
-                    # Non-default interface, no port data
-                    i.portNameList = []
-                    i.portNeighbourList = []
-
-                if i.iftype == 'ethernet':
-                    i.dpdksupport = [p.dpdksupport for p in host.ports if
-                                     i.uuid == p.interface_uuid]
-                elif i.iftype == 'vlan':
-                    for u in i.uses:
-                        for j in host.interfaces:
-                            if j.ifname == str(u):
-                                if j.iftype == 'ethernet':
-                                    i.dpdksupport = [p.dpdksupport for p in
-                                                     host.ports if
-                                                     j.uuid ==
-                                                     p.interface_uuid]
-                                elif j.iftype == 'ae':
-                                    for ae_u in j.uses:
-                                        for k in host.interfaces:
-                                            if k.ifname == str(ae_u):
-                                                i.dpdksupport = [
-                                                    p.dpdksupport for p in
-                                                    host.ports if
-                                                    k.uuid ==
-                                                    p.interface_uuid]
-                elif i.iftype == 'ae':
-                    for u in i.uses:
-                        for j in host.interfaces:
-                            if j.ifname == str(u):
-                                i.dpdksupport = [p.dpdksupport for p in
-                                                 host.ports if
-                                                 j.uuid == p.interface_uuid]
+                dpdksupport = index.get_interface_dpdksupport(i)
+                if dpdksupport is not None:
+                    i.dpdksupport = dpdksupport
 
         host.interfaces.sort(key=lambda f: (f.ifname))
         return host.interfaces
@@ -579,6 +492,8 @@ class SensorTab(tabs.TableTab):
     name = _("Sensors")
     slug = "sensors"
     template_name = ("admin/inventory/_detail_sensors.html")
+    host_collections = ('sensors', 'sensorgroups')
+    preload = False
 
     def get_sensorgroups_data(self):
         host = self.tab_group.kwargs['host']
@@ -587,11 +502,10 @@ class SensorTab(tabs.TableTab):
         if host.sensorgroups:
             for i in host.sensorgroups:
                 i.host_id = host.id
-                i.sensors = [s.uuid for s in host.sensors if
-                             i.uuid == s.sensorgroup_uuid]
+                sensors = host.detail_index.get_group_sensors(i.uuid)
+                i.sensors = [s.uuid for s in sensors]
                 i.sensorNameList = [s.get_sensor_display_name()
-                                    for s in host.sensors
-                                    if i.uuid == s.sensorgroup_uuid]
+                                    for s in sensors]
 
         return host.sensorgroups
 
@@ -600,11 +514,11 @@ class SensorTab(tabs.TableTab):
         if host.sensors:
             for i in host.sensors:
                 i.host_id = host.id
-                i.sensorgroups = [s.uuid for s in host.sensorgroups if
-                                  i.sensorgroup_uuid == s.uuid]
+                group = host.detail_index.get_sensorgroup(i.sensorgroup_uuid)
+                groups = [group] if group is not None else []
+                i.sensorgroups = [s.uuid for s in groups]
                 i.sensorgroupNameList = [s.get_sensorgroup_display_name()
-                                         for s in host.sensorgroups
-                                         if i.sensorgroup_uuid == s.uuid]
+                                         for s in groups]
         return host.sensors
         # .sort(key=lambda s: (s.status))
 
@@ -639,6 +553,8 @@ class DevicesTab(tabs.TableTab):
     name = _("Devices")
     slug = "devices"
     template_name = ("admin/inventory/_detail_devices.html")
+    host_collections = ('devices',)
+    preload = False
 
     def get_devices_data(self):
         host = self.tab_group.kwargs['host']
@@ -653,6 +569,8 @@ class LldpTab(tabs.TableTab):
     name = _("LLDP")
     slug = "lldp"
     template_name = ("admin/inventory/_detail_lldp.html")
+    host_collections = ('lldpneighbours',)
+    preload = False
 
     def get_neighbours_data(self):
         host = self.tab_group.kwargs['host']
@@ -662,6 +580,10 @@ class LldpTab(tabs.TableTab):
         return host.lldpneighbours
 
 
+# Each host detail tab lists the per-host inventory collections it renders
+# in its host_collections attribute so that the detail view only retrieves
+# the collections required by the tabs being loaded. Apart from the overview,
+# the tabs are not preloaded but retrieved when they are shown.
 class HostDetailTabs(tabs.TabGroup):
     slug = "inventory_details"
     tabs = (OverviewTab, CpuFunctionsTab, MemorysTab, StorageTab, PortsTab,
@@ -14,6 +14,7 @@ from django.core.urlresolvers import reverse_lazy
 from django.utils.translation import ugettext_lazy as _
 
 from horizon import exceptions
+from horizon import tables
 from horizon import tabs
 from horizon import workflows
 from openstack_dashboard import api
@@ -111,61 +112,6 @@ class DetailView(tabs.TabbedTableView):
             try:
                 host = api.sysinv.host_get(self.request, host_id)
 
-                host.nodes = api.sysinv.host_node_list(self.request, host.uuid)
-                host.cpus = api.sysinv.host_cpu_list(self.request, host.uuid)
-                icpu_utils.restructure_host_cpu_data(host)
-
-                host.memorys = api.sysinv.host_memory_list(self.request,
-                                                           host.uuid)
-                for m in host.memorys:
-                    for n in host.nodes:
-                        if m.inode_uuid == n.uuid:
-                            m.numa_node = n.numa_node
-                            break
-
-                host.ports = api.sysinv.host_port_list(self.request, host.uuid)
-                host.interfaces = api.sysinv.host_interface_list(self.request,
-                                                                 host.uuid)
-                host.devices = api.sysinv.host_device_list(self.request,
-                                                           host.uuid)
-                host.disks = api.sysinv.host_disk_list(self.request, host.uuid)
-                host.stors = api.sysinv.host_stor_list(self.request, host.uuid)
-                host.pvs = api.sysinv.host_pv_list(self.request, host.uuid)
-                host.partitions = api.sysinv.host_disk_partition_list(
-                    self.request, host.uuid)
-
-                # Translate partition state codes:
-                for p in host.partitions:
-                    p.status = api.sysinv.PARTITION_STATUS_MSG[p.status]
-
-                host.lldpneighbours = \
-                    api.sysinv.host_lldpneighbour_list(self.request, host.uuid)
-
-                # Set the value for neighbours field for each port in the host.
-                # This will be referenced in Interfaces table
-                for p in host.ports:
-                    p.neighbours = \
-                        [n.port_identifier for n in host.lldpneighbours
-                         if n.port_uuid == p.uuid]
-
-                # Adjust pv state to be more "user friendly"
-                for pv in host.pvs:
-                    pv.pv_state = self._adjust_state_data(pv.pv_state,
-                                                          pv.lvm_vg_name)
-
-                host.lvgs = api.sysinv.host_lvg_list(self.request, host.uuid,
-                                                     get_params=True)
-
-                # Adjust lvg state to be more "user friendly"
-                for lvg in host.lvgs:
-                    lvg.vg_state = self._adjust_state_data(lvg.vg_state,
-                                                           lvg.lvm_vg_name)
-
-                host.sensors = api.sysinv.host_sensor_list(self.request,
-                                                           host.uuid)
-                host.sensorgroups = api.sysinv.host_sensorgroup_list(
-                    self.request, host.uuid)
-
                 # Add patching status data to hosts
                 phost = api.patch.get_host(self.request, host.hostname)
                 if phost is not None:
@@ -189,6 +135,71 @@ class DetailView(tabs.TabbedTableView):
             self._host = host
         return self._host
 
+    def _get_host_collections(self, tab_group):
+        # Only the collections used by the tabs rendered in this request,
+        # or by the tab owning the table targeted by a table action, are
+        # retrieved.
+        table_name = tables.DataTable.check_handler(self.request)[0]
+        collections = set()
+        for tab in tab_group.get_tabs():
+            if tab.load or table_name in getattr(tab, '_tables', {}):
+                collections.update(getattr(tab, 'host_collections', ()))
+        return [c for c in api.sysinv.HOST_DETAIL_COLLECTIONS
+                if c in collections]
+
+    def _load_host_collections(self, host, collections):
+        results, errors = api.sysinv.host_detail_list(self.request,
+                                                      host.uuid,
+                                                      collections)
+        for name in api.sysinv.HOST_DETAIL_COLLECTIONS:
+            setattr(host, name, results.get(name, []))
+
+        for name, error in errors.items():
+            try:
+                raise error
+            except Exception:
+                exceptions.handle(self.request,
+                                  _('Unable to retrieve %(collection)s for '
+                                    'host "%(host)s".') %
+                                  {'collection': name,
+                                   'host': host.hostname})
+
+        # Index the collections once for the lookups of all the tabs
+        host.detail_index = api.sysinv.HostDetailIndex(host)
+
+        icpu_utils.restructure_host_cpu_data(host)
+
+        numa_nodes = dict((n.uuid, n.numa_node) for n in host.nodes)
+        for m in host.memorys:
+            if m.inode_uuid in numa_nodes:
+                m.numa_node = numa_nodes[m.inode_uuid]
+
+        # Translate partition state codes:
+        for p in host.partitions:
+            p.status = api.sysinv.PARTITION_STATUS_MSG[p.status]
+
+        # Set the value for neighbours field for each port in the host.
+        # This will be referenced in Interfaces table
+        for p in host.ports:
+            p.neighbours = \
+                [n.port_identifier for n in
+                 host.detail_index.get_port_neighbours(p.uuid)]
+
+        # Adjust pv state to be more "user friendly"
+        for pv in host.pvs:
+            pv.pv_state = self._adjust_state_data(pv.pv_state,
+                                                  pv.lvm_vg_name)
+
+        # Adjust lvg state to be more "user friendly"
+        for lvg in host.lvgs:
+            lvg.vg_state = self._adjust_state_data(lvg.vg_state,
+                                                   lvg.lvm_vg_name)
+
     def get_tabs(self, request, *args, **kwargs):
-        host = self.get_data()
-        return self.tab_group_class(request, host=host, **kwargs)
+        if self._tab_group is None:
+            host = self.get_data()
+            tab_group = self.tab_group_class(request, host=host, **kwargs)
+            self._load_host_collections(host,
+                                        self._get_host_collections(tab_group))
+            self._tab_group = tab_group
+        return self._tab_group
@@ -197,8 +197,7 @@ class AddHostInfoAction(workflows.Action):
                 PERSONALITY_CHOICES_WITHOUT_STORAGE
 
         # All-in-one system, personality can only be controller.
-        systems = api.sysinv.system_list(request)
-        system_type = systems[0].to_dict().get('system_type')
+        system_type = api.sysinv.get_system_type(request)
         if system_type == constants.TS_AIO:
             self.fields['personality'].choices = \
                 PERSONALITY_CHOICE_CONTROLLER
@@ -297,9 +296,8 @@ class UpdateHostInfoAction(workflows.Action):
                 PERSONALITY_CHOICES_WITHOUT_STORAGE
 
         # All-in-one system, personality can only be controller.
-        systems = api.sysinv.system_list(request)
-        self.system_mode = systems[0].to_dict().get('system_mode')
-        self.system_type = systems[0].to_dict().get('system_type')
+        self.system_mode = api.sysinv.get_system_mode(request)
+        self.system_type = api.sysinv.get_system_type(request)
         if self.system_type == constants.TS_AIO:
             self.fields['personality'].choices = \
                 PERSONALITY_CHOICE_CONTROLLER
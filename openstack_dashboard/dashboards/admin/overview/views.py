@@ -20,6 +20,7 @@ from django.conf import settings
 from django.template.defaultfilters import floatformat
 from django.utils import translation
 from django.utils.translation import ugettext_lazy as _
+import futurist
 
 from horizon import exceptions
 from horizon.utils import csvbase
@@ -28,7 +29,7 @@ from openstack_dashboard import api
 from openstack_dashboard import usage
 
 
-class GlobalUsageCsvRenderer(csvbase.BaseCsvResponse):
+class GlobalUsageCsvRenderer(csvbase.BaseCsvStreamingResponse):
 
     columns = [_("Project Name"), _("VCPUs"), _("RAM (MB)"),
                _("Disk (GB)"), _("Usage (Hours)")]
@@ -55,20 +56,24 @@ class GlobalOverview(usage.UsageView):
         return context
 
     def get_data(self):
-        data = super(GlobalOverview, self).get_data()
+        # The project list is retrieved while the usage is summarized.
+        with futurist.ThreadPoolExecutor(max_workers=1) as e:
+            projects_future = e.submit(api.keystone.tenant_list, self.request)
+            data = super(GlobalOverview, self).get_data()
         # Pre-fill project names
         try:
-            projects, has_more = api.keystone.tenant_list(self.request)
+            projects, has_more = projects_future.result()
         except Exception:
             projects = []
             exceptions.handle(self.request,
                               _('Unable to retrieve project list.'))
+        projects = dict((project.id, project) for project in projects)
         for instance in data:
-            project = [t for t in projects if t.id == instance.tenant_id]
+            project = projects.get(instance.tenant_id)
             # If we could not get the project name, show the tenant_id with
             # a 'Deleted' identifier instead.
-            if project:
-                instance.project_name = getattr(project[0], "name", None)
+            if project is not None:
+                instance.project_name = getattr(project, "name", None)
             else:
                 deleted = _("Deleted")
                 instance.project_name = translation.string_concat(
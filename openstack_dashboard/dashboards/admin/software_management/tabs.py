@@ -126,8 +126,7 @@ class UpgradeOrchestrationTab(tabs.TableTab):
         if request.user.services_region == 'SystemController':
             return False
         # Upgrade orchestration not available on CPE deployments
-        systems = api.sysinv.system_list(request)
-        system_type = systems[0].to_dict().get('system_type')
+        system_type = api.sysinv.get_system_type(request)
         if system_type == constants.TS_AIO:
             return False
         return True
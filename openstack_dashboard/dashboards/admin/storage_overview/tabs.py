@@ -25,33 +25,31 @@ class StorageServicesTab(tabs.TableTab):
     slug = "storage_services"
     template_name = constants.STORAGE_SERVICE_DETAIL_TEMPLATE_NAME
 
-    def get_monitors_data(self):
-        try:
-            return ceph.monitor_list()
-        except Exception as e:
-            LOG.error(e)
+    def _get_services(self):
+        # monitors, osds, cluster and storage come from one concurrent,
+        # briefly cached snapshot shared by the tables and the template
+        if not hasattr(self, '_services'):
+            self._services = ceph.storage_services_get(self.request)
+        return self._services
+
+    def _get_service(self, name):
+        results, errors = self._get_services()
+        if name in errors:
+            LOG.error(errors[name])
             return
+        return results.get(name)
+
+    def get_monitors_data(self):
+        return self._get_service('monitors')
 
     def get_osds_data(self):
-        try:
-            return ceph.osd_list()
-        except Exception as e:
-            LOG.error(e)
-            return
+        return self._get_service('osds')
 
     def get_cluster_data(self):
-        try:
-            return ceph.cluster_get()
-        except Exception as e:
-            LOG.error(e)
-            return
+        return self._get_service('cluster')
 
     def get_storage_data(self):
-        try:
-            return ceph.storage_get()
-        except Exception as e:
-            LOG.error(e)
-            return
+        return self._get_service('storage')
 
     def get_context_data(self, request):
         try:
@@ -90,3 +88,5 @@ class StorageOverviewTabs(tabs.TabGroup):
     slug = "storage_overview"
     tabs = (StorageServicesTab, StorageUsageTab)
     sticky = True
+    # ceph and sysinv are queried concurrently
+    preload_workers = 2
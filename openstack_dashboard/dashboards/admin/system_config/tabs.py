@@ -256,3 +256,5 @@ class ConfigTabs(tabs.TabGroup):
             iStorageTab, iStoragePoolsTab, SDNControllerTab,
             CeilometerConfigTab)
     sticky = True
+    # the tabs query independent sysinv resources
+    preload_workers = 4
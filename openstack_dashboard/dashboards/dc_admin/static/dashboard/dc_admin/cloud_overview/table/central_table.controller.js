@@ -54,6 +54,7 @@
     ctrl.$interval = $interval;
     ctrl.refreshInterval;
     ctrl.refreshWaitTime = 5000;
+    ctrl.pushEvents = 'push:alarm_summary';
 
     getData();
     startRefresh();
@@ -84,10 +85,27 @@
 
     function startRefresh() {
       if (angular.isDefined(ctrl.refreshInterval)) return;
-      ctrl.refreshInterval = ctrl.$interval(getData, ctrl.refreshWaitTime);
+      ctrl.refreshInterval = ctrl.$interval(pollData, ctrl.refreshWaitTime);
+
+      // Refresh on the changes pushed by the server, and only poll while
+      // it cannot push them
+      $(document).on(ctrl.pushEvents, onPush);
+      horizon.push.subscribe(['alarm_summary']);
+    }
+
+    function onPush() {
+      // The events are triggered outside of the digest cycle
+      $scope.$evalAsync(getData);
+    }
+
+    function pollData() {
+      if (!horizon.push.connected) {
+        getData();
+      }
     }
 
     $scope.$on('$destroy',function(){
+      $(document).off(ctrl.pushEvents, onPush);
       ctrl.stopRefresh();
     });
 
@@ -54,7 +54,7 @@
     var ctrl = this;
     ctrl.subClouds = [];
     ctrl.isubClouds = [];
-    ctrl.subCloudSummaries = [];
+    ctrl.overviewVersion = undefined;
 
     //ctrl.globalActions = globalActions;
 
@@ -73,6 +73,7 @@
     ctrl.$interval = $interval;
     ctrl.refreshInterval;
     ctrl.refreshWaitTime = 5000;
+    ctrl.pushEvents = 'push:subclouds push:subcloud_alarms';
 
     // Messages
     ctrl.endpointErrorMsg = gettext("This subcloud's endpoints are not yet accessible by horizon.  Please log out and log back in to access this subcloud.");
@@ -83,32 +84,50 @@
     ////////////////////////////////
 
     function getData() {
-      // Fetch subcloud data to populate the table
-      $q.all([
-        dc_manager.getSubClouds().success(getSubCloudsSuccess),
-        dc_manager.getSummaries().success(getSummariesSuccess)
-      ]).then(function(){
-        map_subclouds();
-      })
+      // Fetch the subclouds, with their alarm summary, changed since the
+      // last poll to update the table
+      dc_manager.getOverview(ctrl.overviewVersion).success(getOverviewSuccess);
     }
 
-    function getSubCloudsSuccess(response) {
-      ctrl.subClouds = response.items;
+    function getOverviewSuccess(response) {
+      if (angular.isDefined(response.items)) {
+        ctrl.subClouds = response.items;
+      } else {
+        applyOverviewChanges(response.changed, response.removed);
+      }
+      ctrl.overviewVersion = response.version;
     }
 
-    function getSummariesSuccess(response) {
-      ctrl.subCloudSummaries = response.items;
-    }
+    function applyOverviewChanges(changed, removed) {
+      var changedById = {};
+      var removedById = {};
+      angular.forEach(changed, function(subCloud) {
+        changedById[subCloud.subcloud_id] = subCloud;
+      });
+      angular.forEach(removed, function(id) {
+        removedById[id] = true;
+      });
 
-    function map_subclouds() {
-      ctrl.subClouds = $.map(ctrl.subClouds, function (subCloud){
-        var match = ctrl.subCloudSummaries.filter(function(summary){return summary.name == subCloud.name;});
-        if (match.length == 0){
-          // No matching summary to this subcloud
-          return subCloud;
+      // Keep the order of the table, with the new subclouds last
+      var subClouds = [];
+      angular.forEach(ctrl.subClouds, function(subCloud) {
+        var id = subCloud.subcloud_id;
+        if (removedById[id]) {
+          return;
+        }
+        if (id in changedById) {
+          subClouds.push(changedById[id]);
+          delete changedById[id];
+        } else {
+          subClouds.push(subCloud);
+        }
+      });
+      angular.forEach(changed, function(subCloud) {
+        if (subCloud.subcloud_id in changedById) {
+          subClouds.push(subCloud);
         }
-        return angular.extend(subCloud, match[0]);
       });
+      ctrl.subClouds = subClouds;
     }
 
 
@@ -118,10 +137,27 @@
 
     function startRefresh() {
       if (angular.isDefined(ctrl.refreshInterval)) return;
-      ctrl.refreshInterval = ctrl.$interval(getData, ctrl.refreshWaitTime);
+      ctrl.refreshInterval = ctrl.$interval(pollData, ctrl.refreshWaitTime);
+
+      // Refresh on the changes pushed by the server, and only poll while
+      // it cannot push them
+      $(document).on(ctrl.pushEvents, onPush);
+      horizon.push.subscribe(['subclouds', 'subcloud_alarms']);
+    }
+
+    function onPush() {
+      // The events are triggered outside of the digest cycle
+      $scope.$evalAsync(getData);
+    }
+
+    function pollData() {
+      if (!horizon.push.connected) {
+        getData();
+      }
     }
 
     $scope.$on('$destroy',function(){
+      $(document).off(ctrl.pushEvents, onPush);
       ctrl.stopRefresh();
     });
 
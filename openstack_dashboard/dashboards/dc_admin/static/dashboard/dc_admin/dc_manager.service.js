@@ -25,6 +25,7 @@
       createSubcloud: createSubcloud,
       editSubcloud: editSubcloud,
       getSubClouds: getSubClouds,
+      getOverview: getOverview,
       deleteSubcloud: deleteSubcloud,
       generateConfig: generateConfig
     };
@@ -125,6 +126,24 @@
         });
     }
 
+    /**
+     * @name getOverview
+     * @description
+     * Get the subclouds joined to their alarm summary.
+     * @param {string} since the version of the last overview retrieved, if
+     * any. Only the subclouds changed or removed since then are returned
+     * while the server still knows that version.
+     * @returns {Object} The result of the API call
+     */
+    function getOverview(since) {
+      var config = since ? {params: {since: since}} : {};
+      return apiService.get('/api/dc_manager/overview/', config)
+        .error(function () {
+          toastService.clearErrors();
+          toastService.add('error', gettext('Unable to retrieve the subclouds.'));
+        });
+    }
+
     /**
      * @name deleteSubcloud
      * @description
@@ -23,6 +23,7 @@ from django import http
 from django.test.utils import override_settings
 from django.utils import timezone
 
+from keystoneclient.v3 import role_assignments
 from mox3.mox import IgnoreArg
 from mox3.mox import IsA
 
@@ -854,22 +855,13 @@ class UpdateProjectWorkflowTests(test.BaseAdminViewTests):
                                     domain=self.domain.id,
                                     project=self.tenant.id) \
                 .AndReturn(groups)
-            api.keystone.roles_for_group(IsA(http.HttpRequest),
-                                         group='1',
-                                         project=self.tenant.id) \
-                .AndReturn(roles)
-            api.keystone.remove_group_role(IsA(http.HttpRequest),
-                                           project=self.tenant.id,
-                                           group='1',
-                                           role='1')
-            api.keystone.roles_for_group(IsA(http.HttpRequest),
-                                         group='2',
-                                         project=self.tenant.id) \
-                .AndReturn(roles)
-            api.keystone.roles_for_group(IsA(http.HttpRequest),
-                                         group='3',
-                                         project=self.tenant.id) \
-                .AndReturn(roles)
+            # group 1 keeps role 2, groups 2 and 3 are given roles 1 and 2
+            for group_id in ('2', '3'):
+                for role_id in ('1', '2'):
+                    api.keystone.add_group_role(IsA(http.HttpRequest),
+                                                project=self.tenant.id,
+                                                group=group_id,
+                                                role=role_id).InAnyOrder()
         else:
             api.keystone.user_list(IsA(http.HttpRequest),
                                    project=self.tenant.id) \
@@ -1559,6 +1551,74 @@ class UpdateProjectWorkflowTests(test.BaseAdminViewTests):
         self.assertNoFormErrors(res)
         self.assertMessageCount(error=1, warning=0)
 
+    @test.create_stubs({api.keystone: ('tenant_list',
+                                       'role_assignments_list')})
+    def test_get_services_user_ids(self):
+        services = self.tenants.list()[1]
+        services.name = 'services'
+        users = self.users.list()[:3]
+        # users 2 and 3 have the services project as default project but
+        # only user 2 is one of its members
+        for user in users[1:]:
+            user.tenantId = services.id
+        assignment = role_assignments.RoleAssignment(
+            role_assignments.RoleAssignmentManager,
+            {'user': {'id': users[1].id},
+             'role': {'id': '1'},
+             'scope': {'project': {'id': services.id}}})
+
+        api.keystone.tenant_list(IsA(http.HttpRequest),
+                                 filters={'name': 'services'}) \
+            .AndReturn([[self.tenants.first(), services], False])
+        if api.keystone.VERSIONS.active >= 3:
+            api.keystone.role_assignments_list(IsA(http.HttpRequest),
+                                               project=services.id,
+                                               effective=True,
+                                               include_subtree=False) \
+                .AndReturn([assignment])
+            expected = set([users[1].id])
+        else:
+            expected = set([users[1].id, users[2].id])
+        self.mox.ReplayAll()
+
+        self.assertEqual(expected, workflows._get_services_user_ids(
+            self.request, users))
+
+    def test_get_services_user_ids_without_default_project(self):
+        # no keystone call is made when no user has a default project
+        self.assertEqual(set(), workflows._get_services_user_ids(
+            self.request, self.users.list()))
+
+    def test_diff_role_assignments(self):
+        current = {'1': ['1', '2'], '2': ['2'], '3': ['1']}
+        desired = {'1': set(['2']), '3': set(['1', '2']), '4': set(['1'])}
+        grants, revokes = workflows._diff_role_assignments(current, desired)
+        self.assertEqual({'3': ['2'], '4': ['1']}, grants)
+        self.assertEqual({'1': ['1'], '2': ['2']}, revokes)
+
+    def test_apply_role_assignments_reports_all_failures(self):
+        applied = []
+
+        def _grant(actor_id, role_id):
+            if actor_id == '2':
+                raise self.exceptions.keystone
+            applied.append(('grant', actor_id, role_id))
+
+        def _revoke(actor_id, role_id):
+            if role_id == '3':
+                raise self.exceptions.keystone
+            applied.append(('revoke', actor_id, role_id))
+
+        failures = workflows._apply_role_assignments(
+            _grant, _revoke, {'1': ['1'], '2': ['1', '2']},
+            {'3': ['2', '3']})
+
+        # the other changes are applied despite the failures
+        self.assertItemsEqual([('grant', '1', '1'), ('revoke', '3', '2')],
+                              applied)
+        self.assertEqual([('2', '1'), ('2', '2'), ('3', '3')],
+                         [failure[:2] for failure in failures])
+
 
 class UsageViewTests(test.BaseAdminViewTests):
     def _stub_nova_api_calls(self, nova_stu_enabled=True):
@@ -20,10 +20,13 @@
 #
 
 import logging
+import sys
 
 from django.conf import settings
 from django.core.urlresolvers import reverse
 from django.utils.translation import ugettext_lazy as _
+import futurist
+import six
 
 from openstack_auth import utils
 
@@ -51,6 +54,11 @@ PROJECT_USER_MEMBER_SLUG = "update_members"
 PROJECT_GROUP_MEMBER_SLUG = "update_group_members"
 COMMON_HORIZONTAL_TEMPLATE = "identity/projects/_common_horizontal_form.html"
 
+# Maximum number of role assignments granted or revoked at the same time
+# when the members or groups of a project are saved
+ROLE_ASSIGNMENT_MAX_WORKERS = getattr(settings,
+                                      'ROLE_ASSIGNMENT_MAX_WORKERS', 8)
+
 
 class UpdateProjectSettingsAction(workflows.Action):
     # Neutron
@@ -231,6 +239,115 @@ class CreateProjectInfo(workflows.Step):
             self.contributes += tuple(EXTRA_INFO.keys())
 
 
+def _get_services_user_ids(request, users):
+    """Return the ids of the given users which belong to the services project.
+
+    They are the users whose default project is the "services" project and
+    which are members of it. The services project and its members are
+    retrieved with at most two keystone calls, whatever the number of users.
+    """
+    candidates = dict((user.id, getattr(user, 'tenantId', ''))
+                      for user in users if getattr(user, 'tenantId', ''))
+    if not candidates:
+        return set()
+
+    # keystone v2 does not filter the projects by name
+    projects, has_more = api.keystone.tenant_list(
+        request, filters={'name': 'services'})
+    services_ids = set(project.id for project in projects
+                       if project.name == 'services')
+    candidates = dict((user_id, project_id)
+                      for user_id, project_id in candidates.items()
+                      if project_id in services_ids)
+    if not candidates or keystone.VERSIONS.active < 3:
+        # keystone v2 does not filter the projects by user either, so the
+        # default project of the user was enough
+        return set(candidates)
+
+    member_ids = set()
+    for project_id in set(candidates.values()):
+        assignments = api.keystone.role_assignments_list(
+            request, project=project_id, effective=True,
+            include_subtree=False)
+        member_ids.update(assignment.user['id'] for assignment in assignments
+                          if hasattr(assignment, 'user'))
+    return set(user_id for user_id in candidates if user_id in member_ids)
+
+
+def _get_selected_roles(data, member_step, available_roles):
+    """Map the users or groups selected in a membership step to role ids."""
+    selected = {}
+    for role in available_roles:
+        field_name = member_step.get_member_field_name(role.id)
+        for actor_id in data[field_name]:
+            selected.setdefault(actor_id, set()).add(role.id)
+    return selected
+
+
+def _diff_role_assignments(current, desired):
+    """Return the role assignments to grant and to revoke.
+
+    ``current`` and ``desired`` map the ids of users or groups to the ids of
+    their roles on a project. The grants and revocations turning the
+    former into the latter are returned as two such dicts, holding only the
+    users or groups whose roles change.
+    """
+    grants = {}
+    revokes = {}
+    for actor_id in set(current) | set(desired):
+        current_roles = set(current.get(actor_id, ()))
+        desired_roles = set(desired.get(actor_id, ()))
+        if desired_roles - current_roles:
+            grants[actor_id] = sorted(desired_roles - current_roles)
+        if current_roles - desired_roles:
+            revokes[actor_id] = sorted(current_roles - desired_roles)
+    return grants, revokes
+
+
+def _apply_role_assignments(grant, revoke, grants, revokes):
+    """Grant and revoke role assignments concurrently.
+
+    ``grant`` and ``revoke`` are called with the id of the user or group and
+    the id of the role of each assignment of ``grants`` and ``revokes``, at
+    most ``ROLE_ASSIGNMENT_MAX_WORKERS`` at a time. A failure does not stop
+    the other changes; the failures are returned as a list of
+    ``(actor_id, role_id, exc_info)`` tuples.
+    """
+    changes = [(grant, actor_id, role_id)
+               for actor_id, role_ids in sorted(grants.items())
+               for role_id in role_ids]
+    changes += [(revoke, actor_id, role_id)
+                for actor_id, role_ids in sorted(revokes.items())
+                for role_id in role_ids]
+    failures = []
+
+    def _task_apply(func, actor_id, role_id):
+        try:
+            func(actor_id, role_id)
+        except Exception:
+            failures.append((actor_id, role_id, sys.exc_info()))
+
+    if changes:
+        max_workers = max(1, min(ROLE_ASSIGNMENT_MAX_WORKERS, len(changes)))
+        with futurist.ThreadPoolExecutor(max_workers=max_workers) as e:
+            for change in changes:
+                e.submit(_task_apply, *change)
+    failures.sort(key=lambda failure: failure[:2])
+    return failures
+
+
+def _raise_role_failures(failures, kind):
+    """Log every failed role change and raise the error of the first one."""
+    if not failures:
+        return
+    for actor_id, role_id, exc_info in failures:
+        LOG.warning('Unable to change role %(role)s of %(kind)s %(actor)s '
+                    'on the project: %(error)s',
+                    {'role': role_id, 'kind': kind, 'actor': actor_id,
+                     'error': exc_info[1]})
+    six.reraise(*failures[0][2])
+
+
 class UpdateProjectMembersAction(workflows.MembershipAction):
     def __init__(self, request, *args, **kwargs):
         super(UpdateProjectMembersAction, self).__init__(request,
@@ -269,20 +386,14 @@ class UpdateProjectMembersAction(workflows.MembershipAction):
                                                domain=domain_id)
         except Exception:
             exceptions.handle(request, err_msg)
-        users_list = [(user.id, user.name) for user in all_users]
-
-        users_list = []
-        for user in all_users:
-            tenants = []
-            has_more = False
-            services_user = False
-            tenants, has_more = api.keystone.tenant_list(request, user=user.id)
-            for tenant in tenants:
-                if (getattr(user, 'tenantId', '') == tenant.id) and \
-                        (tenant.name == 'services'):
-                    services_user = True
-            if services_user is False:
-                users_list.append((user.id, user.name))
+        # The users of the services project are not offered as members
+        try:
+            services_user_ids = _get_services_user_ids(request, all_users)
+        except Exception:
+            services_user_ids = set()
+            exceptions.handle(request, err_msg)
+        users_list = [(user.id, user.name) for user in all_users
+                      if user.id not in services_user_ids]
 
         # Get list of roles
         role_list = []
@@ -545,23 +656,19 @@ class CreateProject(CommonQuotaWorkflow):
         try:
             available_roles = api.keystone.role_list(request)
             member_step = self.get_step(PROJECT_USER_MEMBER_SLUG)
-            # count how many users are to be added
-            for role in available_roles:
-                field_name = member_step.get_member_field_name(role.id)
-                role_list = data[field_name]
-                users_to_add += len(role_list)
+            grants = _get_selected_roles(data, member_step, available_roles)
+            users_to_add = len(grants)
+
+            def _grant(user_id, role_id):
+                api.keystone.add_tenant_user_role(request,
+                                                  project=project_id,
+                                                  user=user_id,
+                                                  role=role_id)
+
             # add new users to project
-            for role in available_roles:
-                field_name = member_step.get_member_field_name(role.id)
-                role_list = data[field_name]
-                users_added = 0
-                for user in role_list:
-                    api.keystone.add_tenant_user_role(request,
-                                                      project=project_id,
-                                                      user=user,
-                                                      role=role.id)
-                    users_added += 1
-                users_to_add -= users_added
+            failures = _apply_role_assignments(_grant, None, grants, {})
+            users_to_add = len(set(failure[0] for failure in failures))
+            _raise_role_failures(failures, 'user')
         except Exception:
             if PROJECT_GROUP_ENABLED:
                 group_msg = _(", add project groups")
@@ -579,24 +686,19 @@ class CreateProject(CommonQuotaWorkflow):
         try:
             available_roles = api.keystone.role_list(request)
             member_step = self.get_step(PROJECT_GROUP_MEMBER_SLUG)
+            grants = _get_selected_roles(data, member_step, available_roles)
+            groups_to_add = len(grants)
+
+            def _grant(group_id, role_id):
+                api.keystone.add_group_role(request,
+                                            role=role_id,
+                                            group=group_id,
+                                            project=project_id)
 
-            # count how many groups are to be added
-            for role in available_roles:
-                field_name = member_step.get_member_field_name(role.id)
-                role_list = data[field_name]
-                groups_to_add += len(role_list)
             # add new groups to project
-            for role in available_roles:
-                field_name = member_step.get_member_field_name(role.id)
-                role_list = data[field_name]
-                groups_added = 0
-                for group in role_list:
-                    api.keystone.add_group_role(request,
-                                                role=role.id,
-                                                group=group,
-                                                project=project_id)
-                    groups_added += 1
-                groups_to_add -= groups_added
+            failures = _apply_role_assignments(_grant, None, grants, {})
+            groups_to_add = len(set(failure[0] for failure in failures))
+            _raise_role_failures(failures, 'group')
         except Exception:
             exceptions.handle(request,
                               _('Failed to add %s project groups '
@@ -783,39 +885,6 @@ class UpdateProject(CommonQuotaWorkflow):
             exceptions.handle(request, ignore=True)
             return
 
-    def _add_roles_to_users(self, request, data, project_id, user_id,
-                            role_ids, available_roles):
-        member_step = self.get_step(PROJECT_USER_MEMBER_SLUG)
-        current_role_ids = list(role_ids)
-
-        for role in available_roles:
-            field_name = member_step.get_member_field_name(role.id)
-            # Check if the user is in the list of users with this role.
-            if user_id in data[field_name]:
-                # Add it if necessary
-                if role.id not in current_role_ids:
-                    # user role has changed
-                    api.keystone.add_tenant_user_role(
-                        request,
-                        project=project_id,
-                        user=user_id,
-                        role=role.id)
-                else:
-                    # User role is unchanged, so remove it from the
-                    # remaining roles list to avoid removing it later.
-                    index = current_role_ids.index(role.id)
-                    current_role_ids.pop(index)
-        return current_role_ids
-
-    def _remove_roles_from_user(self, request, project_id, user_id,
-                                current_role_ids):
-        for id_to_delete in current_role_ids:
-            api.keystone.remove_tenant_user_role(
-                request,
-                project=project_id,
-                user=user_id,
-                role=id_to_delete)
-
     def _is_removing_self_admin_role(self, request, project_id, user_id,
                                      available_roles, current_role_ids):
         is_current_user = user_id == request.user.id
@@ -866,45 +935,36 @@ class UpdateProject(CommonQuotaWorkflow):
             all_users = api.keystone.user_list(request,
                                                domain=data['domain_id'])
             users_dict = {user.id: user.name for user in all_users}
+            current = dict((user_id, role_ids)
+                           for user_id, role_ids in users_roles.items()
+                           if user_id in users_dict)
 
-            for user_id in users_roles.keys():
-                # Don't remove roles if the user isn't in the domain
-                if user_id not in users_dict:
-                    users_to_modify -= 1
-                    continue
-
-                # Check if there have been any changes in the roles of
-                # Existing project members.
-                current_role_ids = list(users_roles[user_id])
-                modified_role_ids = self._add_roles_to_users(
-                    request, data, project_id, user_id,
-                    current_role_ids, available_roles)
+            selected = _get_selected_roles(data, member_step, available_roles)
+            grants, revokes = _diff_role_assignments(current, selected)
+            for user_id in list(revokes):
                 # Prevent admins from doing stupid things to themselves.
-                removing_admin = self._is_removing_self_admin_role(
-                    request, project_id, user_id, available_roles,
-                    modified_role_ids)
-                # Otherwise go through and revoke any removed roles.
-                if not removing_admin:
-                    self._remove_roles_from_user(request, project_id, user_id,
-                                                 modified_role_ids)
-                users_to_modify -= 1
-
-            # Grant new roles on the project.
-            for role in available_roles:
-                field_name = member_step.get_member_field_name(role.id)
-                # Count how many users may be added for exception handling.
-                users_to_modify += len(data[field_name])
-            for role in available_roles:
-                users_added = 0
-                field_name = member_step.get_member_field_name(role.id)
-                for user_id in data[field_name]:
-                    if user_id not in users_roles:
-                        api.keystone.add_tenant_user_role(request,
-                                                          project=project_id,
-                                                          user=user_id,
-                                                          role=role.id)
-                    users_added += 1
-                users_to_modify -= users_added
+                if self._is_removing_self_admin_role(
+                        request, project_id, user_id, available_roles,
+                        revokes[user_id]):
+                    del revokes[user_id]
+            users_to_modify = len(set(grants) | set(revokes))
+
+            def _grant(user_id, role_id):
+                api.keystone.add_tenant_user_role(request,
+                                                  project=project_id,
+                                                  user=user_id,
+                                                  role=role_id)
+
+            def _revoke(user_id, role_id):
+                api.keystone.remove_tenant_user_role(request,
+                                                     project=project_id,
+                                                     user=user_id,
+                                                     role=role_id)
+
+            failures = _apply_role_assignments(_grant, _revoke,
+                                               grants, revokes)
+            users_to_modify = len(set(failure[0] for failure in failures))
+            _raise_role_failures(failures, 'user')
             return True
         except Exception:
             if PROJECT_GROUP_ENABLED:
@@ -925,65 +985,37 @@ class UpdateProject(CommonQuotaWorkflow):
         member_step = self.get_step(PROJECT_GROUP_MEMBER_SLUG)
         try:
             available_roles = self._get_available_roles(request)
-            # Get the groups currently associated with this project so we
-            # can diff against it.
+            # Get the groups of the domain currently associated with this
+            # project, and their roles, so we can diff against it.
             project_groups = api.keystone.group_list(request,
                                                      domain=domain_id,
                                                      project=project_id)
             groups_to_modify = len(project_groups)
-            for group in project_groups:
-                # Check if there have been any changes in the roles of
-                # Existing project members.
-                current_roles = api.keystone.roles_for_group(
-                    self.request,
-                    group=group.id,
-                    project=project_id)
-                current_role_ids = [role.id for role in current_roles]
-                for role in available_roles:
-                    # Check if the group is in the list of groups with
-                    # this role.
-                    field_name = member_step.get_member_field_name(role.id)
-                    if group.id in data[field_name]:
-                        # Add it if necessary
-                        if role.id not in current_role_ids:
-                            # group role has changed
-                            api.keystone.add_group_role(
-                                request,
-                                role=role.id,
-                                group=group.id,
-                                project=project_id)
-                        else:
-                            # Group role is unchanged, so remove it from
-                            # the remaining roles list to avoid removing it
-                            # later.
-                            index = current_role_ids.index(role.id)
-                            current_role_ids.pop(index)
-
-                # Revoke any removed roles.
-                for id_to_delete in current_role_ids:
-                    api.keystone.remove_group_role(request,
-                                                   role=id_to_delete,
-                                                   group=group.id,
-                                                   project=project_id)
-                groups_to_modify -= 1
-
-            # Grant new roles on the project.
-            for role in available_roles:
-                field_name = member_step.get_member_field_name(role.id)
-                # Count how many groups may be added for error handling.
-                groups_to_modify += len(data[field_name])
-            for role in available_roles:
-                groups_added = 0
-                field_name = member_step.get_member_field_name(role.id)
-                for group_id in data[field_name]:
-                    if not filter(lambda x: group_id == x.id,
-                                  project_groups):
-                        api.keystone.add_group_role(request,
-                                                    role=role.id,
-                                                    group=group_id,
-                                                    project=project_id)
-                    groups_added += 1
-                groups_to_modify -= groups_added
+            groups_roles = api.keystone.get_project_groups_roles(
+                request, project=project_id)
+            current = dict((group.id, groups_roles.get(group.id, []))
+                           for group in project_groups)
+
+            selected = _get_selected_roles(data, member_step, available_roles)
+            grants, revokes = _diff_role_assignments(current, selected)
+            groups_to_modify = len(set(grants) | set(revokes))
+
+            def _grant(group_id, role_id):
+                api.keystone.add_group_role(request,
+                                            role=role_id,
+                                            group=group_id,
+                                            project=project_id)
+
+            def _revoke(group_id, role_id):
+                api.keystone.remove_group_role(request,
+                                               role=role_id,
+                                               group=group_id,
+                                               project=project_id)
+
+            failures = _apply_role_assignments(_grant, _revoke,
+                                               grants, revokes)
+            groups_to_modify = len(set(failure[0] for failure in failures))
+            _raise_role_failures(failures, 'group')
             return True
         except Exception:
             exceptions.handle(request,
@@ -1005,10 +1037,6 @@ class UpdateProject(CommonQuotaWorkflow):
             return False
 
     def handle(self, request, data):
-        # FIXME(gabriel): This should be refactored to use Python's built-in
-        # sets and do this all in a single "roles to add" and "roles to remove"
-        # pass instead of the multi-pass thing happening now.
-
         project = self._update_project(request, data)
         if not project:
             return False
@@ -797,6 +797,9 @@ def get_instance_error(instance):
 
 class UpdateRow(tables.Row):
     ajax = True
+    # Whether the instances of all the projects are listed when several rows
+    # are updated at once
+    all_tenants = False
 
     def get_data(self, request, instance_id):
         instance = api.nova.server_get(request, instance_id)
@@ -810,15 +813,68 @@ class UpdateRow(tables.Row):
                               ignore=True)
         try:
             api.network.servers_update_addresses(request, [instance])
-            if (hasattr(instance, 'addresses') and hasattr(instance, "nics")):
-                instance.addresses = utils.sort_addresses_by_nic(instance)
-            else:
-                instance.addresses = []
+            self._sort_addresses(instance)
         except Exception:
             exceptions.handle(request,
                               _('Unable to retrieve Network information '
                                 'for instance "%s".') % instance_id,
                               ignore=True)
+        return self._load_instance(request, instance)
+
+    def get_batch_data(self, request, obj_ids):
+        search_opts = {'all_tenants': True} if self.all_tenants else None
+        servers, has_more = api.nova.server_list(request,
+                                                 search_opts=search_opts)
+        instances = [server for server in servers if server.id in obj_ids]
+
+        try:
+            full_flavors = dict([(str(flavor.id), flavor) for flavor
+                                 in api.nova.flavor_list_cached(request)])
+        except Exception:
+            full_flavors = {}
+            exceptions.handle(request, ignore=True)
+        for instance in instances:
+            flavor_id = str(instance.flavor["id"])
+            try:
+                if flavor_id not in full_flavors:
+                    full_flavors[flavor_id] = api.nova.flavor_get(request,
+                                                                  flavor_id)
+                instance.full_flavor = full_flavors[flavor_id]
+            except Exception:
+                exceptions.handle(request,
+                                  _('Unable to retrieve flavor information '
+                                    'for instance "%s".') % instance.id,
+                                  ignore=True)
+
+        if instances:
+            try:
+                api.network.servers_update_addresses(
+                    request, instances, all_tenants=self.all_tenants)
+                for instance in instances:
+                    self._sort_addresses(instance)
+            except Exception:
+                exceptions.handle(
+                    request,
+                    message=_('Unable to retrieve IP addresses from Neutron.'),
+                    ignore=True)
+
+        data = dict([(instance.id, self._load_instance(request, instance))
+                     for instance in instances])
+        # The instances beyond the API result limit are retrieved one by one
+        missing = [obj_id for obj_id in obj_ids if obj_id not in data]
+        if missing:
+            data.update(super(UpdateRow, self).get_batch_data(request,
+                                                              missing))
+        return data
+
+    @staticmethod
+    def _sort_addresses(instance):
+        if (hasattr(instance, 'addresses') and hasattr(instance, "nics")):
+            instance.addresses = utils.sort_addresses_by_nic(instance)
+        else:
+            instance.addresses = []
+
+    def _load_instance(self, request, instance):
         error = get_instance_error(instance)
         if error:
             messages.error(request, error)
@@ -4389,6 +4389,44 @@ class InstanceAjaxTests(helpers.TestCase):
         self.assertContains(res, server.name)
         self.assertContains(res, "Not available")
 
+    @helpers.create_stubs({api.nova: ("server_list",
+                                      "flavor_list_cached",
+                                      "extension_supported",
+                                      "is_feature_available"),
+                           api.network: ('servers_update_addresses',)})
+    def test_rows_update(self):
+        servers = self.servers.list()
+        instance_ids = [server.id for server in servers[:2]]
+
+        api.nova.extension_supported('AdminActions', IsA(http.HttpRequest)) \
+            .MultipleTimes().AndReturn(True)
+        api.nova.is_feature_available(
+            IsA(http.HttpRequest), 'locked_attribute'
+        ).MultipleTimes().AndReturn(True)
+        api.nova.extension_supported('Shelve', IsA(http.HttpRequest)) \
+            .MultipleTimes().AndReturn(True)
+        api.nova.server_list(IsA(http.HttpRequest), search_opts=None) \
+            .AndReturn([servers, False])
+        api.nova.flavor_list_cached(IsA(http.HttpRequest)) \
+            .AndReturn(self.flavors.list())
+        api.network.servers_update_addresses(IsA(http.HttpRequest),
+                                             servers[:2],
+                                             all_tenants=False) \
+            .AndReturn(None)
+
+        self.mox.ReplayAll()
+
+        params = [('action', 'rows_update'),
+                  ('table', 'instances')]
+        params.extend(('obj_id', instance_id) for instance_id in instance_ids)
+        res = self.client.get('?'.join((INDEX_URL, urlencode(params))),
+                              HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+        self.assertEqual(200, res.status_code)
+        rows = json.loads(res.content)['rows']
+        self.assertItemsEqual(instance_ids, rows.keys())
+        for server in servers[:2]:
+            self.assertIn(server.name, rows[server.id])
+
 
 class ConsoleManagerTests(helpers.ResetImageAPIVersionMixin, helpers.TestCase):
 
@@ -114,7 +114,7 @@ class IndexView(tables.DataTableView):
         def _task_get_flavors():
             # Gather our flavors to correlate our instances to them
             try:
-                tmp_flavors = api.nova.flavor_list(self.request)
+                tmp_flavors = api.nova.flavor_list_cached(self.request)
                 flavors.extend(tmp_flavors)
                 full_flavors.update([(str(flavor.id), flavor)
                                      for flavor in flavors])
@@ -125,7 +125,7 @@ class IndexView(tables.DataTableView):
             # Gather our images to correlate our instances to them
             try:
                 # TODO(gabriel): Handle pagination.
-                tmp_images = api.glance.image_list_detailed(self.request)[0]
+                tmp_images = api.glance.image_list_cached(self.request)
                 images.extend(tmp_images)
                 image_map.update([(str(image.id), image) for image in images])
             except Exception:
@@ -181,6 +181,50 @@ class NetworkTopologyTests(test.TestCase):
                  'fixed_ips': []})
         self.assertEqual(expect_port_urls, data['ports'])
 
+    @test.create_stubs({api.nova: ('server_list',),
+                        api.neutron: ('network_list_for_tenant',
+                                      'network_list',
+                                      'router_list',
+                                      'port_list')})
+    def test_json_view_delta(self):
+        servers = self.servers.list()
+        tenant_networks = [net for net in self.networks.list()
+                           if not net['router:external']]
+        external_networks = [net for net in self.networks.list()
+                             if net['router:external']]
+        for server_list in (servers, servers[1:]):
+            api.nova.server_list(
+                IsA(http.HttpRequest)).AndReturn([server_list, False])
+            api.neutron.network_list_for_tenant(
+                IsA(http.HttpRequest),
+                self.tenant.id).AndReturn(tenant_networks)
+            api.neutron.network_list(
+                IsA(http.HttpRequest),
+                **{'router:external': True}).AndReturn(external_networks)
+            api.neutron.router_list(
+                IsA(http.HttpRequest),
+                tenant_id=self.tenant.id).AndReturn(self.routers.list())
+            api.neutron.port_list(
+                IsA(http.HttpRequest)).AndReturn(self.ports.list())
+
+        self.mox.ReplayAll()
+
+        data = jsonutils.loads(self.client.get(JSON_URL).content)
+        version = data['version']
+        self.assertEqual(len(servers), len(data['servers']))
+
+        res = self.client.get(JSON_URL, {'since': version})
+        data = jsonutils.loads(res.content)
+        self.assertEqual(version, data['since'])
+        self.assertNotEqual(version, data['version'])
+        self.assertNotIn('servers', data)
+        self.assertEqual({'added': [], 'changed': [],
+                          'removed': [servers[0].id]},
+                         data['delta']['servers'])
+        for kind in ('networks', 'ports', 'routers'):
+            self.assertEqual({'added': [], 'changed': [], 'removed': []},
+                             data['delta'][kind])
+
 
 class NetworkTopologyCreateTests(test.TestCase):
 
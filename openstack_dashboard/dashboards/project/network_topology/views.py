@@ -16,9 +16,11 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import hashlib
 import json
 
 from django.conf import settings
+from django.core.cache import cache
 from django.core.urlresolvers import reverse
 from django.core.urlresolvers import reverse_lazy
 from django.http import HttpResponse
@@ -82,6 +84,15 @@ console_invalid_status = {
     'revert_resize', 'migrating', 'build', 'shelved',
     'shelved_offloaded'}
 
+# Kinds of resources making up the topology document, in the order they are
+# sent to the canvas.
+TOPOLOGY_RESOURCES = ('servers', 'networks', 'ports', 'routers')
+
+# How long (in seconds) the digests of a topology version are kept so that
+# later polls can be answered with a delta against it.
+TOPOLOGY_VERSION_CACHE_TIMEOUT = getattr(
+    settings, 'NETWORK_TOPOLOGY_VERSION_CACHE_TIMEOUT', 300)
+
 
 class TranslationHelper(object):
     """Helper class to provide the translations.
@@ -218,18 +229,15 @@ class JSONView(View):
 
     def add_resource_url(self, view, resources):
         tenant_id = self.request.user.tenant_id
+        # Resolve the URL pattern once and substitute each resource id
+        # rather than calling reverse() for every resource.
+        placeholder = 'RESOURCE_ID'
+        url = reverse(view, None, [placeholder])
         for resource in resources:
             if (resource.get('tenant_id')
                     and tenant_id != resource.get('tenant_id')):
                 continue
-            resource['url'] = reverse(view, None, [str(resource['id'])])
-
-    def _check_router_external_port(self, ports, router_id, network_id):
-        for port in ports:
-            if (port['network_id'] == network_id
-                    and port['device_id'] == router_id):
-                return True
-        return False
+            resource['url'] = url.replace(placeholder, str(resource['id']))
 
     def _get_servers(self, request):
         # Get nova data
@@ -290,7 +298,7 @@ class JSONView(View):
                     **{'router:external': True})
             except Exception:
                 neutron_public_networks = []
-            my_network_ids = [net['id'] for net in networks]
+            my_network_ids = set(net['id'] for net in networks)
             for publicnet in neutron_public_networks:
                 if publicnet.id in my_network_ids:
                     continue
@@ -346,7 +354,7 @@ class JSONView(View):
 
         # we should filter out ports connected to non tenant networks
         # which they have no visibility to
-        tenant_network_ids = [network['id'] for network in networks]
+        tenant_network_ids = set(network['id'] for network in networks)
         ports = [{'id': port.id,
                   'network_id': port.network_id,
                   'device_id': port.device_id,
@@ -364,6 +372,8 @@ class JSONView(View):
     def _prepare_gateway_ports(self, routers, ports):
         # user can't see port on external network. so we are
         # adding fake port based on router information
+        router_ports = set((port['device_id'], port['network_id'])
+                           for port in ports)
         for router in routers:
             external_gateway_info = router.get('external_gateway_info')
             if not external_gateway_info:
@@ -372,9 +382,7 @@ class JSONView(View):
                 'network_id')
             if not external_network:
                 continue
-            if self._check_router_external_port(ports,
-                                                router['id'],
-                                                external_network):
+            if (router['id'], external_network) in router_ports:
                 continue
             fake_port = {'id': 'gateway%s' % external_network,
                          'network_id': external_network,
@@ -382,6 +390,59 @@ class JSONView(View):
                          'fixed_ips': []}
             ports.append(fake_port)
 
+    def _resource_key(self, kind, resource):
+        # The fake gateway ports of routers sharing an external network have
+        # the same id, so ports are told apart by their device as well.
+        if kind == 'ports':
+            return '%s:%s' % (resource['id'], resource['device_id'] or '')
+        return resource['id']
+
+    def _get_digests(self, data):
+        digests = {}
+        for kind in TOPOLOGY_RESOURCES:
+            digests[kind] = {}
+            for resource in data[kind]:
+                encoded = json.dumps(resource, cls=LazyTranslationEncoder,
+                                     sort_keys=True)
+                digests[kind][self._resource_key(kind, resource)] = \
+                    hashlib.sha1(encoded.encode('utf-8')).hexdigest()
+        return digests
+
+    def _get_version(self, digests):
+        version = hashlib.sha1()
+        for kind in TOPOLOGY_RESOURCES:
+            for key in sorted(digests[kind]):
+                version.update(('%s:%s:%s;' % (kind, key, digests[kind][key])
+                                ).encode('utf-8'))
+        return version.hexdigest()
+
+    def _version_cache_key(self, version):
+        return 'network_topology:%s:%s' % (self.request.user.tenant_id,
+                                           version)
+
+    def _get_delta(self, data, digests, previous):
+        """Returns the resources added, changed and removed since a version.
+
+        ``previous`` holds the digests of the version the client last saw,
+        keyed by resource kind and then by resource key.
+        """
+        delta = {}
+        for kind in TOPOLOGY_RESOURCES:
+            old = previous.get(kind, {})
+            added = []
+            changed = []
+            for resource in data[kind]:
+                key = self._resource_key(kind, resource)
+                if key not in old:
+                    added.append(resource)
+                elif old[key] != digests[kind][key]:
+                    changed.append(resource)
+            delta[kind] = {'added': added,
+                           'changed': changed,
+                           'removed': [key for key in old
+                                       if key not in digests[kind]]}
+        return delta
+
     def get(self, request, *args, **kwargs):
         networks = self._get_networks(request)
         data = {'servers': self._get_servers(request),
@@ -389,6 +450,22 @@ class JSONView(View):
                 'ports': self._get_ports(request, networks),
                 'routers': self._get_routers(request)}
         self._prepare_gateway_ports(data['routers'], data['ports'])
+
+        # Tag the document with a version token. A client polling with
+        # ?since=<token> only receives what changed since that version, as
+        # long as its digests are still cached; otherwise the full document
+        # is sent again.
+        digests = self._get_digests(data)
+        version = self._get_version(digests)
+        cache.set(self._version_cache_key(version), digests,
+                  TOPOLOGY_VERSION_CACHE_TIMEOUT)
+        since = request.GET.get('since')
+        previous = since and cache.get(self._version_cache_key(since))
+        if previous:
+            data = {'since': since,
+                    'delta': self._get_delta(data, digests, previous)}
+        data['version'] = version
+
         json_string = json.dumps(data, cls=LazyTranslationEncoder,
                                  ensure_ascii=False)
         return HttpResponse(json_string, content_type='text/json')
@@ -0,0 +1,54 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from django.conf import settings
+from django.core.management import base
+
+from horizon.utils import file_discovery
+import openstack_dashboard.enabled
+import openstack_dashboard.local.enabled
+from openstack_dashboard.utils import settings as settings_utils
+
+
+class Command(base.BaseCommand):
+    help = ("Record the static files discovered in horizon, "
+            "openstack_dashboard, the themes and the plugins to a manifest "
+            "loaded by the settings instead of walking their directories.")
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "-o", "--output", dest="output",
+            default=settings.STATIC_FILES_MANIFEST,
+            help=("file to write the manifest to (defaults to the "
+                  "STATIC_FILES_MANIFEST setting: %(default)s)")
+        )
+
+    def handle(self, *args, **options):
+        manifest = file_discovery.StaticFilesManifest(record=True)
+        settings_utils.find_static_files({},
+                                         settings.AVAILABLE_THEMES,
+                                         settings.THEME_COLLECTION_DIR,
+                                         settings.ROOT_PATH,
+                                         manifest=manifest)
+        settings_utils.update_dashboards(
+            [
+                openstack_dashboard.enabled,
+                openstack_dashboard.local.enabled,
+            ],
+            {},
+            [],
+            manifest=manifest,
+        )
+        manifest.save(options['output'])
+        self.stdout.write("Recorded the static files of %d directories "
+                          "in %s" % (len(manifest.entries),
+                                     options['output']))
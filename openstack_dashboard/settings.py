@@ -28,6 +28,7 @@ from openstack_dashboard import exceptions
 from openstack_dashboard import theme_settings
 from openstack_dashboard.utils import settings as settings_utils
 
+from horizon.utils import file_discovery
 from horizon.utils.escape import monkeypatch_escape
 
 monkeypatch_escape()
@@ -277,6 +278,11 @@ POLICY_FILES = {
 SECRET_KEY = None
 LOCAL_PATH = None
 
+# Static files discovered at build time by the make_static_manifest
+# management command. Defaults to static_files_manifest.json in the local
+# directory; the directories are walked when it is missing or stale.
+STATIC_FILES_MANIFEST = None
+
 SECURITY_GROUP_RULES = {
     'all_tcp': {
         'name': _('All TCP'),
@@ -454,8 +460,15 @@ if not SECRET_KEY:
 
 # populate HORIZON_CONFIG with auto-discovered JavaScript sources, mock files,
 # specs files and external templates.
+if STATIC_FILES_MANIFEST is None:
+    STATIC_FILES_MANIFEST = os.path.join(
+        LOCAL_PATH or os.path.join(ROOT_PATH, 'local'),
+        'static_files_manifest.json')
+_static_files_manifest = file_discovery.StaticFilesManifest.load(
+    STATIC_FILES_MANIFEST)
 settings_utils.find_static_files(HORIZON_CONFIG, AVAILABLE_THEMES,
-                                 THEME_COLLECTION_DIR, ROOT_PATH)
+                                 THEME_COLLECTION_DIR, ROOT_PATH,
+                                 manifest=_static_files_manifest)
 
 
 # Load the pluggable dashboard settings
@@ -470,6 +483,7 @@ settings_utils.update_dashboards(
     ],
     HORIZON_CONFIG,
     INSTALLED_APPS,
+    manifest=_static_files_manifest,
 )
 INSTALLED_APPS[0:0] = ADD_INSTALLED_APPS
 
@@ -44,10 +44,20 @@ horizon.networktopologyloader = {
    */
   update:function() {
     var self = this;
+    var params = {};
+    // once a version is known only the changes since it are requested
+    if (self.model !== null && self.model.version) {
+      params.since = self.model.version;
+    }
     angular.element.getJSON(
       angular.element('#networktopology').data('networktopology') + '?' + angular.element.now(),
+      params,
       function(data) {
-        self.model = data;
+        if (data.delta && self.model !== null) {
+          self.apply_delta(data);
+        } else {
+          self.model = data;
+        }
         $('#networktopology').trigger('change');
         self.update_timer = setTimeout(function(){
           self.update();
@@ -56,6 +66,44 @@ horizon.networktopologyloader = {
     );
   },
 
+  /**
+   * key identifying a resource of the given kind, as computed by the
+   * topology JSON view
+   */
+  resource_key:function(kind, resource) {
+    if (kind === 'ports') {
+      return resource.id + ':' + (resource.device_id || '');
+    }
+    return resource.id;
+  },
+
+  /**
+   * merges the added, changed and removed resources of a delta response
+   * into the 'model'
+   */
+  apply_delta:function(data) {
+    var self = this;
+    angular.forEach(data.delta, function(delta, kind) {
+      var removed = {};
+      var changed = {};
+      var resources = [];
+      angular.forEach(delta.removed, function(key) {
+        removed[key] = true;
+      });
+      angular.forEach(delta.changed, function(resource) {
+        changed[self.resource_key(kind, resource)] = resource;
+      });
+      angular.forEach(self.model[kind], function(resource) {
+        var key = self.resource_key(kind, resource);
+        if (!removed[key]) {
+          resources.push(changed[key] || resource);
+        }
+      });
+      self.model[kind] = resources.concat(delta.added);
+    });
+    self.model.version = data.version;
+  },
+
   /**
    * stops the data update sequences
    */
@@ -19,6 +19,7 @@
 from __future__ import absolute_import
 
 from django.conf import settings
+from django.core.cache import cache
 from django.test.utils import override_settings
 
 from horizon import exceptions
@@ -332,3 +333,47 @@ class QuotaSetTests(test.TestCase):
     def test_quotaset_add_with_wrong_type(self):
         quota_set = api_base.QuotaSet({'foo': 1, 'bar': 10})
         self.assertRaises(ValueError, quota_set.add, {'test': 7})
+
+
+class SharedCacheTests(test.TestCase):
+
+    def setUp(self):
+        super(SharedCacheTests, self).setUp()
+        cache.clear()
+        self.calls = []
+
+    def _get_data(self):
+        self.calls.append(None)
+        return [api_base.CachedResource({'id': 'foo', 'name': 'bar'})]
+
+    def test_shared_cache_get(self):
+        data = api_base.shared_cache_get(self.request, 'test', self._get_data,
+                                         60)
+        cached = api_base.shared_cache_get(self.request, 'test',
+                                           self._get_data, 60)
+        self.assertEqual(1, len(self.calls))
+        self.assertEqual(data, cached)
+        self.assertEqual('bar', cached[0].name)
+
+    def test_shared_cache_get_scope(self):
+        api_base.shared_cache_get(self.request, 'test', self._get_data, 60,
+                                  scope='one')
+        api_base.shared_cache_get(self.request, 'test', self._get_data, 60,
+                                  scope='two')
+        self.assertEqual(2, len(self.calls))
+
+    def test_shared_cache_get_disabled(self):
+        api_base.shared_cache_get(self.request, 'test', self._get_data, 0)
+        api_base.shared_cache_get(self.request, 'test', self._get_data, 0)
+        self.assertEqual(2, len(self.calls))
+
+    def test_shared_cache_invalidate(self):
+        api_base.shared_cache_get(self.request, 'test', self._get_data, 60)
+        api_base.shared_cache_invalidate(self.request, 'test')
+        api_base.shared_cache_get(self.request, 'test', self._get_data, 60)
+        self.assertEqual(2, len(self.calls))
+
+    def test_cached_resource_missing_attribute(self):
+        resource = api_base.CachedResource({'id': 'foo'})
+        self.assertEqual('foo', resource.id)
+        self.assertRaises(AttributeError, getattr, resource, 'name')
@@ -0,0 +1,171 @@
+#
+# Copyright (c) 2017 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+
+from django.core.cache import cache
+import mock
+
+from openstack_dashboard.api import dc_manager as api_dc_manager
+from openstack_dashboard.api.rest import dc_manager
+from openstack_dashboard.test import helpers as test
+
+
+class DcManagerRestTestCase(test.TestCase):
+    def setUp(self):
+        super(DcManagerRestTestCase, self).setUp()
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def _request(self, **kwargs):
+        args = {'user.services_region': 'RegionOne',
+                'GET': {},
+                'META': {}}
+        args.update(kwargs)
+        return self.mock_rest_request(**args)
+
+    def _resource(self, name, **attrs):
+        resource = mock.Mock(**{'to_dict.return_value': attrs})
+        resource.name = name
+        return resource
+
+    def _subcloud(self, subcloud_id, name, **attrs):
+        attrs.update({'subcloud_id': subcloud_id, 'name': name})
+        return self._resource(name, **attrs)
+
+    #
+    # Overview
+    #
+    def _overview(self, dcm, request, subclouds, summaries=()):
+        dcm.subcloud_list_cached.return_value = subclouds
+        dcm.alarm_summary_list_cached.return_value = list(summaries)
+        return dc_manager.Overview().get(request)
+
+    @mock.patch.object(dc_manager, 'dc_manager')
+    def test_overview_get(self, dcm):
+        request = self._request()
+        response = self._overview(
+            dcm, request,
+            [self._subcloud(1, 'sc1', availability_status='online'),
+             self._subcloud(2, 'sc2', availability_status='offline')],
+            [self._resource('sc1', name='sc1', critical=1)])
+
+        self.assertStatusCode(response, 200)
+        version = response.json['version']
+        self.assertEqual('"%s"' % version, response['ETag'])
+        self.assertEqual(
+            [{'subcloud_id': 1, 'name': 'sc1',
+              'availability_status': 'online', 'critical': 1},
+             {'subcloud_id': 2, 'name': 'sc2',
+              'availability_status': 'offline'}],
+            response.json['items'])
+        self.assertNotIn('changed', response.json)
+
+    @mock.patch.object(dc_manager, 'dc_manager')
+    def test_overview_get_not_modified(self, dcm):
+        subclouds = [self._subcloud(1, 'sc1', availability_status='online')]
+        response = self._overview(dcm, self._request(), subclouds)
+        etag = response['ETag']
+
+        request = self._request(META={'HTTP_IF_NONE_MATCH': etag})
+        response = self._overview(dcm, request, subclouds)
+        self.assertStatusCode(response, 304)
+        self.assertEqual(etag, response['ETag'])
+
+    @mock.patch.object(dc_manager, 'dc_manager')
+    def test_overview_get_since_version(self, dcm):
+        response = self._overview(
+            dcm, self._request(),
+            [self._subcloud(1, 'sc1', availability_status='online'),
+             self._subcloud(2, 'sc2', availability_status='online'),
+             self._subcloud(3, 'sc3', availability_status='online')])
+        since = response.json['version']
+
+        request = self._request(GET={'since': since})
+        response = self._overview(
+            dcm, request,
+            [self._subcloud(1, 'sc1', availability_status='online'),
+             self._subcloud(3, 'sc3', availability_status='offline'),
+             self._subcloud(4, 'sc4', availability_status='online')])
+
+        self.assertStatusCode(response, 200)
+        self.assertNotEqual(since, response.json['version'])
+        self.assertNotIn('items', response.json)
+        self.assertEqual(
+            [{'subcloud_id': 3, 'name': 'sc3',
+              'availability_status': 'offline'},
+             {'subcloud_id': 4, 'name': 'sc4',
+              'availability_status': 'online'}],
+            response.json['changed'])
+        self.assertEqual([2], response.json['removed'])
+
+    @mock.patch.object(dc_manager, 'dc_manager')
+    def test_overview_get_since_unknown_version(self, dcm):
+        request = self._request(GET={'since': 'unknown'})
+        response = self._overview(
+            dcm, request,
+            [self._subcloud(1, 'sc1', availability_status='online')])
+
+        self.assertStatusCode(response, 200)
+        self.assertEqual(
+            [{'subcloud_id': 1, 'name': 'sc1',
+              'availability_status': 'online'}],
+            response.json['items'])
+        self.assertNotIn('changed', response.json)
+        self.assertNotIn('removed', response.json)
+
+    #
+    # Subclouds cache
+    #
+    def _list_subclouds_cached(self, client, request):
+        subclouds = api_dc_manager.subcloud_list_cached(request)
+        self.assertEqual(['sc1'], [s.name for s in subclouds])
+        return client.return_value.subcloud_manager.list_subclouds.call_count
+
+    def _subcloud_resource(self):
+        # Mocks cannot be pickled into the cache
+        return api_dc_manager.base.CachedResource(subcloud_id=1, name='sc1')
+
+    @mock.patch.object(api_dc_manager.base, 'SUBCLOUD_CACHE_TIMEOUT', 300)
+    @mock.patch.object(api_dc_manager, 'dcmanagerclient')
+    def test_subcloud_list_cached(self, client):
+        request = self._request()
+        manager = client.return_value.subcloud_manager
+        manager.list_subclouds.return_value = [self._subcloud_resource()]
+
+        self.assertEqual(1, self._list_subclouds_cached(client, request))
+        self.assertEqual(1, self._list_subclouds_cached(client, request))
+
+    def _test_subcloud_list_invalidated(self, client, change):
+        request = self._request()
+        manager = client.return_value.subcloud_manager
+        manager.list_subclouds.return_value = [self._subcloud_resource()]
+        manager.update_subcloud.return_value = []
+
+        self.assertEqual(1, self._list_subclouds_cached(client, request))
+        change(request)
+        self.assertEqual(2, self._list_subclouds_cached(client, request))
+
+    @mock.patch.object(api_dc_manager.base, 'SUBCLOUD_CACHE_TIMEOUT', 300)
+    @mock.patch.object(api_dc_manager, 'dcmanagerclient')
+    def test_subcloud_create_invalidates_list(self, client):
+        self._test_subcloud_list_invalidated(
+            client,
+            lambda request: api_dc_manager.subcloud_create(
+                request, {'data': {'name': 'sc2'}}))
+
+    @mock.patch.object(api_dc_manager.base, 'SUBCLOUD_CACHE_TIMEOUT', 300)
+    @mock.patch.object(api_dc_manager, 'dcmanagerclient')
+    def test_subcloud_update_invalidates_list(self, client):
+        self._test_subcloud_list_invalidated(
+            client,
+            lambda request: api_dc_manager.subcloud_update(
+                request, 1, {'updated': {'management-state': 'managed'}}))
+
+    @mock.patch.object(api_dc_manager.base, 'SUBCLOUD_CACHE_TIMEOUT', 300)
+    @mock.patch.object(api_dc_manager, 'dcmanagerclient')
+    def test_subcloud_delete_invalidates_list(self, client):
+        self._test_subcloud_list_invalidated(
+            client,
+            lambda request: api_dc_manager.subcloud_delete(request, 1))
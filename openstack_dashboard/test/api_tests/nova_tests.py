@@ -19,9 +19,12 @@
 
 from __future__ import absolute_import
 
+import datetime
+
 from django.conf import settings
 from django import http
 from django.test.utils import override_settings
+import mock
 
 from mox3.mox import IsA
 from novaclient import api_versions
@@ -272,6 +275,39 @@ class ComputeApiTests(test.APITestCase):
         for usage in ret_val:
             self.assertIsInstance(usage, api.nova.NovaUsage)
 
+    @mock.patch.object(api.nova, 'USAGE_CACHE_TIMEOUT', 60)
+    def test_usage_list_cached_past_days(self):
+        usages = self.usages.list()
+        start = datetime.datetime(2017, 1, 1)
+        middle = datetime.datetime(2017, 1, 3)
+        end = datetime.datetime(2017, 1, 5, 23, 59, 59)
+
+        novaclient = self.stub_novaclient()
+        novaclient.versions = self.mox.CreateMockAnything()
+        novaclient.versions.get_current().MultipleTimes().AndReturn(
+            api_versions.APIVersion('2.1'))
+        novaclient.usage = self.mox.CreateMockAnything()
+        # The days which are not cached yet are retrieved at once
+        novaclient.usage.list(start, middle, True).AndReturn(usages)
+        novaclient.usage.list(middle, end, True).AndReturn(usages)
+        self.mox.ReplayAll()
+
+        api.base.shared_cache_invalidate(self.request, 'nova_usage_list')
+        api.nova.usage_list(self.request, start, middle)
+        api.nova.usage_list(self.request, start, end)
+        # The third call only reads the cached days
+        ret_val = api.nova.usage_list(self.request, start, end)
+
+        self.assertEqual([u.tenant_id for u in usages],
+                         [u.tenant_id for u in ret_val])
+        usage = ret_val[0]
+        self.assertIsInstance(usage, api.nova.NovaUsage)
+        self.assertEqual(usages[0].total_vcpus_usage * 2, usage.vcpu_hours)
+        self.assertEqual(len(usages[0].server_usages),
+                         len(usage.server_usages))
+        self.assertEqual(usages[0].server_usages[0]['hours'] * 2,
+                         usage.server_usages[0]['hours'])
+
     def test_server_get(self):
         server = self.servers.first()
 
@@ -0,0 +1,180 @@
+#
+# Copyright (c) 2017 Wind River Systems, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+
+from django.core.cache import cache
+import mock
+
+from openstack_dashboard.api.rest import push
+from openstack_dashboard.api import vim
+from openstack_dashboard.test import helpers as test
+
+
+class PushRestTestCase(test.TestCase):
+    def setUp(self):
+        super(PushRestTestCase, self).setUp()
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def _request(self, **kwargs):
+        args = {'user.services_region': 'RegionOne',
+                'user.is_superuser': True}
+        args.update(kwargs)
+        return self.mock_rest_request(**args)
+
+    def _expire_lease(self, request, topic):
+        cache.delete(push._cache_key(request, topic, 'lease'))
+
+    #
+    # Snapshots
+    #
+    def test_snapshot_retrieved_once_per_interval(self):
+        request = self._request()
+        fetch = mock.Mock(return_value={'1': {'state': 'enabled'}})
+        with mock.patch.dict(push.TOPICS, {'hosts': (fetch, 'platform')}):
+            first = push._get_snapshot(request, 'hosts')
+            second = push._get_snapshot(request, 'hosts')
+
+        fetch.assert_called_once_with(request)
+        self.assertEqual({'1': {'state': 'enabled'}}, first['entities'])
+        self.assertEqual(first, second)
+
+    def test_snapshot_retrieved_again_once_lease_expired(self):
+        request = self._request()
+        fetch = mock.Mock(side_effect=[{'1': {'state': 'enabled'}},
+                                       {'1': {'state': 'disabled'}}])
+        with mock.patch.dict(push.TOPICS, {'hosts': (fetch, 'platform')}):
+            first = push._get_snapshot(request, 'hosts')
+            self._expire_lease(request, 'hosts')
+            second = push._get_snapshot(request, 'hosts')
+
+        self.assertEqual(2, fetch.call_count)
+        self.assertNotEqual(first['version'], second['version'])
+        self.assertEqual({'1': {'state': 'disabled'}}, second['entities'])
+
+    def test_snapshot_stale_when_retrieval_fails(self):
+        request = self._request()
+        fetch = mock.Mock(side_effect=[{'1': {'state': 'enabled'}},
+                                       Exception('sysinv unavailable')])
+        with mock.patch.dict(push.TOPICS, {'hosts': (fetch, 'platform')}):
+            first = push._get_snapshot(request, 'hosts')
+            self._expire_lease(request, 'hosts')
+            second = push._get_snapshot(request, 'hosts')
+
+        self.assertEqual(2, fetch.call_count)
+        self.assertEqual(first, second)
+
+    @mock.patch.object(push.vim, '_sw_update_client')
+    def test_strategy_change_seen_within_request(self, sw_update_client):
+        request = self._request()
+        states = {vim.STRATEGY_SW_PATCH: 'applying'}
+
+        def _get_strategy(name):
+            if name not in states:
+                return None
+            return mock.Mock(state=states[name], current_phase='apply',
+                             current_phase_completion_percentage=50)
+
+        sw_update_client.return_value.get_strategy.side_effect = \
+            _get_strategy
+
+        first = push._get_snapshot(request, 'strategy')
+        states[vim.STRATEGY_SW_PATCH] = 'applied'
+        self._expire_lease(request, 'strategy')
+        second = push._get_snapshot(request, 'strategy')
+
+        self.assertEqual(
+            'applying', first['entities'][vim.STRATEGY_SW_PATCH]['state'])
+        self.assertEqual(
+            'applied', second['entities'][vim.STRATEGY_SW_PATCH]['state'])
+        changes = push._get_changes(request, 'strategy', second,
+                                    first['version'])
+        self.assertEqual([vim.STRATEGY_SW_PATCH], list(changes['changed']))
+
+    #
+    # Changes
+    #
+    def _snapshot(self, request, entities):
+        self._expire_lease(request, 'hosts')
+        fetch = mock.Mock(return_value=entities)
+        with mock.patch.dict(push.TOPICS, {'hosts': (fetch, 'platform')}):
+            return push._get_snapshot(request, 'hosts')
+
+    def test_changes_reset_when_version_unknown(self):
+        request = self._request()
+        snapshot = self._snapshot(request, {'1': {'state': 'enabled'},
+                                            '2': {'state': 'disabled'}})
+
+        for since in (None, 'unknown'):
+            changes = push._get_changes(request, 'hosts', snapshot, since)
+            self.assertEqual({'version': snapshot['version'],
+                              'reset': True,
+                              'changed': snapshot['entities'],
+                              'removed': []}, changes)
+
+    def test_changes_since_version(self):
+        request = self._request()
+        old = self._snapshot(request, {'1': {'state': 'enabled'},
+                                       '2': {'state': 'disabled'},
+                                       '3': {'state': 'enabled'}})
+        new = self._snapshot(request, {'1': {'state': 'disabled'},
+                                       '3': {'state': 'enabled'},
+                                       '4': {'state': 'enabled'}})
+
+        changes = push._get_changes(request, 'hosts', new, old['version'])
+        self.assertEqual({'version': new['version'],
+                          'reset': False,
+                          'changed': {'1': {'state': 'disabled'},
+                                      '4': {'state': 'enabled'}},
+                          'removed': ['2']}, changes)
+
+    #
+    # Updates
+    #
+    @mock.patch.object(push, 'get_updates')
+    def test_updates_get_disabled(self, get_updates):
+        request = self._request(GET={'topics': 'hosts'})
+        response = push.Updates().get(request)
+        self.assertStatusCode(response, 404)
+        self.assertFalse(get_updates.called)
+
+    @mock.patch.object(push, 'ENABLED', True)
+    @mock.patch.object(push, 'get_updates')
+    def test_updates_get_not_admin(self, get_updates):
+        request = self._request(GET={'topics': 'hosts'},
+                                **{'user.is_superuser': False})
+        response = push.Updates().get(request)
+        self.assertStatusCode(response, 403)
+        self.assertFalse(get_updates.called)
+
+    @mock.patch.object(push, 'ENABLED', True)
+    @mock.patch.object(push.base, 'is_service_enabled')
+    @mock.patch.object(push, 'get_updates')
+    def test_updates_get_ignores_disabled_services(self, get_updates,
+                                                   is_service_enabled):
+        request = self._request(GET={'topics': 'hosts,subclouds,unknown',
+                                     'hosts': 'v1', 'subclouds': 'v2'})
+        is_service_enabled.side_effect = \
+            lambda request, service_type: service_type == 'platform'
+        get_updates.return_value = {'hosts': {'version': 'v3'}}
+
+        response = push.Updates().get(request)
+        self.assertStatusCode(response, 200)
+        self.assertEqual({'topics': {'hosts': {'version': 'v3'}}},
+                         response.json)
+        get_updates.assert_called_once_with(request, {'hosts': 'v1'})
+
+    @mock.patch.object(push, 'ENABLED', True)
+    @mock.patch.object(push.base, 'is_service_enabled')
+    @mock.patch.object(push, 'get_updates')
+    def test_updates_get_without_enabled_topics(self, get_updates,
+                                                is_service_enabled):
+        request = self._request(GET={'topics': 'subclouds'})
+        is_service_enabled.return_value = False
+
+        response = push.Updates().get(request)
+        self.assertStatusCode(response, 200)
+        self.assertEqual({'topics': {}}, response.json)
+        self.assertFalse(get_updates.called)
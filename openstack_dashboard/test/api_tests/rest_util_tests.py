@@ -11,6 +11,12 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import gzip
+import json
+
+import mock
+import six
+
 from openstack_dashboard.api.rest import json_encoder
 from openstack_dashboard.api.rest import utils
 from openstack_dashboard.test import helpers as test
@@ -127,6 +133,31 @@ class RestUtilsTestCase(test.TestCase):
         self.assertEqual('/api/spam/spam123', response['location'])
         self.assertEqual("spam!", response.json)
 
+    def test_api_stream_items(self):
+        @utils.ajax(stream_items=True)
+        def f(self, request):
+            return {'items': (i for i in range(3)), 'has_more_data': False}
+        request = self.mock_rest_request()
+        response = f(None, request)
+        self.assertStatusCode(response, 200)
+        self.assertTrue(response.streaming)
+        content = b''.join(response.streaming_content).decode('utf-8')
+        self.assertEqual({'items': [0, 1, 2], 'has_more_data': False},
+                         json.loads(content))
+
+    def test_api_gzip(self):
+        @utils.ajax(gzip=True)
+        def f(self, request):
+            return {'items': ['item'] * 100}
+        request = self.mock_rest_request(
+            META={'HTTP_ACCEPT_ENCODING': 'gzip'})
+        response = f(None, request)
+        self.assertStatusCode(response, 200)
+        self.assertEqual('gzip', response['Content-Encoding'])
+        content = gzip.GzipFile(fileobj=six.BytesIO(response.content)).read()
+        self.assertEqual({'items': ['item'] * 100},
+                         json.loads(content.decode('utf-8')))
+
     def test_parse_filters_keywords(self):
         kwargs = {
             'sort_dir': '1',
@@ -247,3 +278,15 @@ class JSONEncoderTestCase(test.TestCase):
 
         self.assertNotEqual(default_encoder_response.content,
                             custom_encoder_response.content)
+
+    def test_custom_encoder_uses_c_encoder_without_nan(self):
+        encoder = json_encoder.NaNJSONEncoder()
+        with mock.patch.object(encoder, '_py_iterencode') as py_iterencode:
+            self.assertEqual('{"key": [1, 2.5]}',
+                             encoder.encode({'key': [1, 2.5]}))
+        self.assertFalse(py_iterencode.called)
+
+    def test_custom_encoder_falls_back_on_infinity(self):
+        encoder = json_encoder.NaNJSONEncoder()
+        self.assertEqual('{"key": [1, 1e+999]}',
+                         encoder.encode({'key': [1, self.data_inf]}))
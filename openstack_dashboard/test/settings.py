@@ -283,6 +283,17 @@ REST_API_ADDITIONAL_SETTINGS = ['REST_API_SETTING_2']
 
 ALLOWED_PRIVATE_SUBNET_CIDR = {'ipv4': [], 'ipv6': []}
 
+# Data shared between requests through the cache would leak between tests
+REFERENCE_DATA_CACHE_TIMEOUT = 0
+ALARM_SUMMARY_CACHE_TIMEOUT = 0
+SUBCLOUD_CACHE_TIMEOUT = 0
+SYSINV_SYSTEM_CONTEXT_CACHE_TIMEOUT = 0
+PATCH_HOSTS_CACHE_TIMEOUT = 0
+QUOTA_USAGES_CACHE_TIMEOUT = 0
+NOVA_USAGE_CACHE_TIMEOUT = 0
+HOST_TOPOLOGY_CACHE_TIMEOUT = 0
+CEPH_SERVICES_CACHE_TIMEOUT = 0
+
 
 # --------------------
 # Test-only settings
@@ -19,9 +19,12 @@
 
 from __future__ import absolute_import
 
+import copy
+
 from django import http
 from django.test.utils import override_settings
 from django.utils.translation import ugettext_lazy as _
+import mock
 from mox3.mox import IsA
 
 from horizon import exceptions
@@ -621,3 +624,77 @@ class QuotaTests(test.APITestCase):
         self.assertEqual(expected, quota_usages.usages)
         # Compare available resources
         self.assertAvailableQuotasEqual(expected, quota_usages.usages)
+
+    @test.create_stubs({quotas: ('get_disabled_quotas',
+                                 '_get_tenant_quota_usages')})
+    def test_tenant_quota_usages_shared_between_requests(self):
+        usages = quotas.QuotaUsage()
+        usages.tally('instances', 2)
+        quotas.get_disabled_quotas(IsA(http.HttpRequest)) \
+            .MultipleTimes().AndReturn(set())
+        quotas._get_tenant_quota_usages(IsA(http.HttpRequest), '1', set()) \
+            .MultipleTimes().AndReturn((usages, True))
+        self.mox.ReplayAll()
+
+        with mock.patch.object(quotas, 'QUOTA_USAGES_CACHE_TIMEOUT', 60):
+            api.base.shared_cache_invalidate(self.request, 'quota_usages')
+            quotas.tenant_quota_usages(self.request)
+            usages.tally('instances', 1)
+            quota_usages = quotas.tenant_quota_usages(
+                copy.copy(self.request))
+            self.assertEqual(2, quota_usages['instances']['used'])
+
+            api.base.shared_cache_invalidate(self.request, 'quota_usages')
+            quota_usages = quotas.tenant_quota_usages(
+                copy.copy(self.request))
+            self.assertEqual(3, quota_usages['instances']['used'])
+
+    @test.create_stubs({quotas: ('get_disabled_quotas',
+                                 '_get_tenant_quota_usages')})
+    def test_tenant_quota_usages_incomplete_not_shared(self):
+        usages = quotas.QuotaUsage()
+        usages.tally('instances', 2)
+        quotas.get_disabled_quotas(IsA(http.HttpRequest)) \
+            .MultipleTimes().AndReturn(set())
+        quotas._get_tenant_quota_usages(IsA(http.HttpRequest), '1', set()) \
+            .MultipleTimes().AndReturn((usages, False))
+        self.mox.ReplayAll()
+
+        with mock.patch.object(quotas, 'QUOTA_USAGES_CACHE_TIMEOUT', 60):
+            api.base.shared_cache_invalidate(self.request, 'quota_usages')
+            quotas.tenant_quota_usages(self.request)
+            usages.tally('instances', 1)
+            quota_usages = quotas.tenant_quota_usages(
+                copy.copy(self.request))
+            self.assertEqual(3, quota_usages['instances']['used'])
+
+    def test_get_tenant_quota_usages_cinder_quota_failure(self):
+        def _get_tenant_quota_data(request, disabled_quotas, tenant_id):
+            # as when cinder.tenant_quota_get() fails
+            disabled_quotas.update(quotas.CINDER_QUOTA_FIELDS)
+            return api.base.QuotaSet({'instances': 10})
+
+        def _get_compute_usages(request, usages, disabled_quotas,
+                                tenant_id):
+            usages.tally('instances', 2)
+
+        def _get_volume_usages(request, usages, disabled_quotas, tenant_id):
+            usages.tally('volumes', 1)
+            usages.tally('gigabytes', 10)
+
+        with mock.patch.multiple(
+                quotas,
+                get_tenant_quota_data=_get_tenant_quota_data,
+                _get_tenant_compute_usages=_get_compute_usages,
+                _get_tenant_network_usages=mock.Mock(return_value=None),
+                _get_tenant_volume_usages=_get_volume_usages,
+                _get_tenant_server_group_usages=mock.Mock(
+                    return_value=None)):
+            usages, complete = quotas._get_tenant_quota_usages(
+                self.request, '1', set())
+
+        self.assertFalse(complete)
+        self.assertNotIn('volumes', usages)
+        self.assertNotIn('gigabytes', usages)
+        self.assertEqual({'quota': 10, 'used': 2, 'available': 8},
+                         usages['instances'])
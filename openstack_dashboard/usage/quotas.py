@@ -13,8 +13,12 @@
 from collections import defaultdict
 import itertools
 import logging
+import sys
 
+from django.conf import settings
 from django.utils.translation import ugettext_lazy as _
+import futurist
+import six
 
 from horizon import exceptions
 from horizon.utils.memoized import memoized
@@ -28,6 +32,12 @@ from openstack_dashboard.contrib.developer.profiler import api as profiler
 
 LOG = logging.getLogger(__name__)
 
+# Number of seconds the quota usages of a project are shared between
+# requests. They are also discarded when the dashboard creates or deletes
+# resources counted against the quotas.
+QUOTA_USAGES_CACHE_TIMEOUT = getattr(settings, 'QUOTA_USAGES_CACHE_TIMEOUT',
+                                     10)
+
 
 NOVA_COMPUTE_QUOTA_FIELDS = {
     "metadata_items",
@@ -392,6 +402,7 @@ def _get_tenant_network_usages(request, usages, disabled_quotas, tenant_id):
 
 @profiler.trace
 def _get_tenant_volume_usages(request, usages, disabled_quotas, tenant_id):
+    """Tally the volume usages, returning False when they are unavailable."""
     if CINDER_QUOTA_FIELDS - disabled_quotas:
         try:
             if tenant_id:
@@ -413,6 +424,7 @@ def _get_tenant_volume_usages(request, usages, disabled_quotas, tenant_id):
         except cinder.cinder_exception.ClientException:
             msg = _("Unable to retrieve volume limit information.")
             exceptions.handle(request, msg)
+            return False
 
 
 NETWORK_QUOTA_API_KEY_MAP = {
@@ -443,11 +455,99 @@ def _convert_targets_to_quota_keys(targets):
     return quota_keys
 
 
+@profiler.trace
+def _get_tenant_server_group_usages(request, usages, disabled_quotas,
+                                    tenant_id):
+    if 'server_groups' in disabled_quotas:
+        return
+
+    server_groups = []
+    try:
+        server_groups = nova.server_group_list(request)
+    except Exception:
+        pass
+
+    for server_group in server_groups:
+        project_id = getattr(server_group, 'project_id', None)
+        setattr(server_group, 'project_id', project_id)
+
+    usages.tally('server_groups', len([server_group for server_group in
+                                       server_groups if
+                                       server_group.project_id ==
+                                       request.user.tenant_id]))
+
+
+def _get_tenant_quota_usages(request, tenant_id, disabled_quotas):
+    """Return the quota usages of a tenant and whether they are complete.
+
+    They are incomplete when some quotas or usages could not be retrieved,
+    the error being reported to the user.
+    """
+    usages = QuotaUsage()
+    quotas = []
+    quota_disabled_quotas = set(disabled_quotas)
+    unavailable = []
+    errors = {}
+
+    def _task_get_quota_data():
+        # get_tenant_quota_data() may disable the cinder quotas when they
+        # cannot be retrieved, so it works on its own copy of the set the
+        # usage collectors are reading.
+        quotas.extend(get_tenant_quota_data(
+            request, disabled_quotas=quota_disabled_quotas,
+            tenant_id=tenant_id))
+
+    def _task_get_usages(func):
+        # Each collector tallies a distinct set of quota names.
+        if func(request, usages, disabled_quotas, tenant_id) is False:
+            unavailable.append(func)
+
+    def _run(index, func, *args):
+        try:
+            func(*args)
+        except Exception:
+            errors[index] = sys.exc_info()
+
+    collectors = (_get_tenant_compute_usages,
+                  _get_tenant_network_usages,
+                  _get_tenant_volume_usages,
+                  _get_tenant_server_group_usages)
+    with futurist.ThreadPoolExecutor(
+            max_workers=len(collectors) + 1) as e:
+        e.submit(_run, 0, _task_get_quota_data)
+        for index, func in enumerate(collectors, 1):
+            e.submit(_run, index, _task_get_usages, func)
+
+    # Raise the error the sequential retrieval would have hit first.
+    if errors:
+        six.reraise(*errors[min(errors)])
+
+    # The quotas which could not be retrieved are disabled, as they would
+    # have been before their usages were tallied by a sequential retrieval.
+    failed_quotas = quota_disabled_quotas - disabled_quotas
+    for name in failed_quotas:
+        usages.usages.pop(name, None)
+
+    # The usages were tallied before the quotas were known, so their
+    # availability is computed again once the quotas are added.
+    for quota in quotas:
+        usages.add_quota(quota)
+    for name, usage in usages.usages.items():
+        if 'used' in usage:
+            usages.update_available(name)
+    return usages, not (failed_quotas or unavailable)
+
+
 @profiler.trace
 @memoized
 def tenant_quota_usages(request, tenant_id=None, targets=None):
     """Get our quotas and construct our usage object.
 
+    The quotas and the usages of each service are retrieved concurrently.
+    The result is shared between the requests of the users of the same
+    project for QUOTA_USAGES_CACHE_TIMEOUT seconds, unless some quotas or
+    usages could not be retrieved.
+
     :param tenant_id: Target tenant ID. If no tenant_id is provided,
         a the request.user.project_id is assumed to be used.
     :param targets: A tuple of quota names to be retrieved.
@@ -457,39 +557,24 @@ def tenant_quota_usages(request, tenant_id=None, targets=None):
         tenant_id = request.user.project_id
 
     disabled_quotas = get_disabled_quotas(request)
-    usages = QuotaUsage()
 
     if targets:
         enabled_quotas = set(QUOTA_FIELDS) - disabled_quotas
         enabled_quotas &= _convert_targets_to_quota_keys(targets)
         disabled_quotas = set(QUOTA_FIELDS) - enabled_quotas
 
-    for quota in get_tenant_quota_data(request,
-                                       disabled_quotas=disabled_quotas,
-                                       tenant_id=tenant_id):
-        usages.add_quota(quota)
-
-    # Get our usages.
-    _get_tenant_compute_usages(request, usages, disabled_quotas, tenant_id)
-    _get_tenant_network_usages(request, usages, disabled_quotas, tenant_id)
-    _get_tenant_volume_usages(request, usages, disabled_quotas, tenant_id)
+    def _usage_list():
+        usages, complete = _get_tenant_quota_usages(request, tenant_id,
+                                                    disabled_quotas)
+        return dict(usages.usages), complete
 
-    # Server Group usage
-    if 'server_groups' not in disabled_quotas:
-        server_groups = []
-        try:
-            server_groups = nova.server_group_list(request)
-        except Exception:
-            pass
-
-        for server_group in server_groups:
-            project_id = getattr(server_group, 'project_id', None)
-            setattr(server_group, 'project_id', project_id)
-
-        usages.tally('server_groups', len([server_group for server_group in
-                                           server_groups if
-                                           server_group.project_id ==
-                                           request.user.tenant_id]))
+    scope = '%s:%s:%s' % (base.get_project_scope(request), tenant_id,
+                          ','.join(sorted(disabled_quotas)))
+    usage_list = base.shared_cache_get(
+        request, 'quota_usages', _usage_list, QUOTA_USAGES_CACHE_TIMEOUT,
+        scope=scope, cacheable=lambda value: value[1])[0]
+    usages = QuotaUsage()
+    usages.usages.update(usage_list)
     return usages
 
 
@@ -60,7 +60,8 @@ def import_dashboard_config(modules):
                   key=lambda c: c[1]['__name__'].rsplit('.', 1)[1])
 
 
-def update_dashboards(modules, horizon_config, installed_apps):
+def update_dashboards(modules, horizon_config, installed_apps,
+                      manifest=None):
     """Imports dashboard and panel configuration from modules and applies it.
 
     The submodules from specified modules are imported, and the configuration
@@ -89,6 +90,11 @@ def update_dashboards(modules, horizon_config, installed_apps):
     the panel configuration can be applied. Making changes to the panel is
     deferred until the horizon autodiscover is completed, configurations are
     applied in alphabetical order of files where it was imported.
+
+    The static files of the applications with AUTO_DISCOVER_STATIC_FILES
+    are looked up in the optional
+    :class:`~horizon.utils.file_discovery.StaticFilesManifest` before their
+    directories are walked.
     """
     config_dashboards = horizon_config.get('dashboards', [])
     if config_dashboards or horizon_config.get('default_dashboard'):
@@ -125,7 +131,8 @@ def update_dashboards(modules, horizon_config, installed_apps):
                 module = import_module(_app)
                 base_path = os.path.join(module.__path__[0], 'static/')
                 file_discovery.populate_horizon_config(horizon_config,
-                                                       base_path)
+                                                       base_path,
+                                                       manifest=manifest)
 
         add_exceptions = config.get('ADD_EXCEPTIONS', {}).items()
         for category, exc_list in add_exceptions:
@@ -271,7 +278,8 @@ def find_static_files(
         HORIZON_CONFIG,
         AVAILABLE_THEMES,
         THEME_COLLECTION_DIR,
-        ROOT_PATH):
+        ROOT_PATH,
+        manifest=None):
     import horizon
     import openstack_dashboard
 
@@ -282,7 +290,8 @@ def find_static_files(
     # leading "/"
     file_discovery.populate_horizon_config(
         HORIZON_CONFIG,
-        os.path.join(horizon_home_dir, 'static/')
+        os.path.join(horizon_home_dir, 'static/'),
+        manifest=manifest
     )
 
     # filter out non-angular javascript code and lib
@@ -294,7 +303,8 @@ def find_static_files(
     file_discovery.populate_horizon_config(
         HORIZON_CONFIG,
         os.path.join(os_dashboard_home_dir, 'static/'),
-        sub_path='app/'
+        sub_path='app/',
+        manifest=manifest
     )
 
     # Discover theme static resources, and in particular any
@@ -311,7 +321,8 @@ def find_static_files(
         # discover static files provided by the theme
         file_discovery.populate_horizon_config(
             discovered_files,
-            path
+            path,
+            manifest=manifest
         )
 
         # Get the theme name from the theme url
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Compare the REST API JSON encoding paths on representative payloads.
+
+Usage: python tools/json_encoder_benchmark.py [--number N]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__),
+                                                os.pardir)))
+
+from openstack_dashboard.api.rest import json_encoder  # noqa
+
+
+def _limits():
+    names = ('maxTotalInstances', 'maxTotalCores', 'maxTotalRAMSize',
+             'maxTotalKeypairs', 'maxServerMeta', 'maxImageMeta',
+             'maxPersonality', 'maxPersonalitySize', 'maxSecurityGroups',
+             'maxSecurityGroupRules', 'maxServerGroups',
+             'maxServerGroupMembers', 'totalInstancesUsed',
+             'totalCoresUsed', 'totalRAMUsed', 'totalSecurityGroupsUsed',
+             'totalFloatingIpsUsed', 'totalServerGroupsUsed')
+    return dict((name, 10 * i) for i, name in enumerate(names))
+
+
+def _servers(count):
+    return {
+        'items': [{
+            'id': '6e8e1c5d-0f67-4d09-9e1e-%012d' % i,
+            'name': 'server-%d' % i,
+            'status': 'ACTIVE',
+            'tenant_id': 'a7cf8c5a3e0a4e3b8e55b3c1d7d2b1f%d' % (i % 10),
+            'addresses': {'private': [{'addr': '10.0.%d.%d' % (i // 250,
+                                                               i % 250),
+                                       'version': 4}]},
+            'flavor': {'id': '1', 'vcpus': 2, 'ram': 2048.0},
+            'metadata': {'role': 'worker', 'index': str(i)},
+            'progress': 0,
+            'created': '2017-08-01T12:00:00Z',
+        } for i in range(count)],
+        'has_more_data': False,
+    }
+
+
+def _with_infinity(payload):
+    payload = dict(payload)
+    payload['maxTotalFloatingIps'] = float('inf')
+    return payload
+
+
+PAYLOADS = (
+    ('nova limits', _limits()),
+    ('nova limits with inf', _with_infinity(_limits())),
+    ('1000 servers', _servers(1000)),
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--number', type=int, default=100,
+                        help='encodings per payload and path')
+    args = parser.parse_args()
+
+    encoder = json_encoder.NaNJSONEncoder()
+
+    def fast(payload):
+        return encoder.encode(payload)
+
+    def pure_python(payload):
+        return ''.join(encoder._py_iterencode(payload, _one_shot=True))
+
+    print('%-24s %12s %12s %8s' % ('payload', 'encode ms', 'python ms',
+                                   'speedup'))
+    for name, payload in PAYLOADS:
+        assert fast(payload) == pure_python(payload)
+        timings = [timeit.timeit(lambda: func(payload), number=args.number)
+                   for func in (fast, pure_python)]
+        fast_ms, python_ms = [1000.0 * t / args.number for t in timings]
+        print('%-24s %12.3f %12.3f %7.1fx' % (name, fast_ms, python_ms,
+                                              python_ms / fast_ms))
+
+
+if __name__ == '__main__':
+    main()